@@ -0,0 +1,131 @@
+import argparse
+import hmac
+import os
+import shutil
+import signal
+import socket
+import socketserver
+import subprocess
+import sys
+import tempfile
+import threading
+
+from protocol import ProtocolError, recv_frame, send_frame
+
+WORKDIR_TOKEN = "@WORKDIR@"
+
+
+class AgentHandler(socketserver.BaseRequestHandler):
+    """
+    One connection = one job:
+      -> hello {token}            <- welcome {name} | error
+      -> run {command, outputs} + input files as 'file' frames, then 'start'
+         (a file with templates=true is a nuclei template list whose relative
+         entries resolve against the agent's --templates directory)
+      <- output {data}...         (-> interrupt at any time)
+      <- exit {code}, file {name} + payload..., done
+    """
+
+    def handle(self):
+        sock = self.request
+        try:
+            header, _ = recv_frame(sock)
+            if header.get("type") != "hello" or not hmac.compare_digest(
+                    str(header.get("token", "")), self.server.token):
+                send_frame(sock, {"type": "error", "message": "authentication failed"})
+                return
+            send_frame(sock, {"type": "welcome", "name": socket.gethostname()})
+            self.run_job(sock)
+        except (ConnectionError, ProtocolError, OSError):
+            pass
+
+    def run_job(self, sock):
+        header, _ = recv_frame(sock)
+        if header.get("type") != "run":
+            send_frame(sock, {"type": "error", "message": "expected run"})
+            return
+        workdir = tempfile.mkdtemp(prefix="hackingtool_job_")
+        try:
+            while True:
+                frame, payload = recv_frame(sock)
+                if frame.get("type") == "start":
+                    break
+                if frame.get("type") == "file":
+                    name = os.path.basename(frame["name"])
+                    if frame.get("templates"):
+                        payload = self.resolve_templates(payload)
+                    with open(os.path.join(workdir, name), "wb") as f:
+                        f.write(payload)
+            command = header["command"].replace(WORKDIR_TOKEN, workdir)
+            proc = subprocess.Popen(command, shell=True, cwd=workdir, stdout=subprocess.PIPE,
+                                    stderr=subprocess.STDOUT, start_new_session=True)
+            threading.Thread(target=self.watch_interrupt, args=(sock, proc), daemon=True).start()
+            while True:
+                data = proc.stdout.read1(65536)
+                if not data:
+                    break
+                send_frame(sock, {"type": "output"}, data)
+            code = proc.wait()
+            send_frame(sock, {"type": "exit", "code": code})
+            for name in header.get("outputs", []):
+                path = os.path.join(workdir, os.path.basename(name))
+                if os.path.isfile(path):
+                    with open(path, "rb") as f:
+                        send_frame(sock, {"type": "file", "name": name}, f.read())
+            send_frame(sock, {"type": "done"})
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    def resolve_templates(self, payload):
+        root = self.server.templates_dir
+        lines = payload.decode("utf-8", "replace").splitlines()
+        return "".join(os.path.join(root, line) + "\n" for line in lines if line.strip()).encode("utf-8")
+
+    def watch_interrupt(self, sock, proc):
+        try:
+            while proc.poll() is None:
+                header, _ = recv_frame(sock)
+                if header.get("type") == "interrupt":
+                    try:
+                        os.killpg(os.getpgid(proc.pid), signal.SIGINT)
+                    except OSError:
+                        proc.terminate()
+        except (ConnectionError, ProtocolError, OSError):
+            if proc.poll() is None:
+                proc.terminate()
+
+
+class AgentServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address, token, templates_dir=None):
+        super().__init__(address, AgentHandler)
+        self.token = token
+        self.templates_dir = templates_dir or os.path.expanduser("~/nuclei-templates")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Remote worker agent for hackingtool jobs")
+    parser.add_argument("--listen", default="127.0.0.1:7777", help="host:port to bind (default 127.0.0.1:7777)")
+    parser.add_argument("--token", default=os.environ.get("HACKINGTOOL_AGENT_TOKEN", ""),
+                        help="shared secret (or $HACKINGTOOL_AGENT_TOKEN)")
+    parser.add_argument("--templates", default=os.path.expanduser("~/nuclei-templates"),
+                        help="nuclei templates directory shard template lists resolve against")
+    args = parser.parse_args(argv)
+    if not args.token:
+        parser.error("a --token is required; agents execute arbitrary commands")
+    host, _, port = args.listen.rpartition(":")
+    server = AgentServer((host or "127.0.0.1", int(port)), args.token, args.templates)
+    print(f"[agent] listening on {host or '127.0.0.1'}:{server.server_address[1]}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,38 @@
+from PyQt6.QtGui import QColor, QFont, QTextCharFormat
+from utils import DEFAULT_STYLE, ansi_runs
+
+
+class StyleCache:
+    """
+    One QTextCharFormat per distinct (fg, bg, bold) style, built on first
+    use, so colored output is inserted as plain text runs with a shared
+    format instead of going through HTML.
+    """
+
+    MAX_FORMATS = 4096
+
+    def __init__(self):
+        self._formats = {}
+
+    def format(self, style):
+        fmt = self._formats.get(style)
+        if fmt is None:
+            fg, bg, bold = style
+            fmt = QTextCharFormat()
+            if fg:
+                fmt.setForeground(QColor(fg))
+            if bg:
+                fmt.setBackground(QColor(bg))
+            fmt.setFontWeight(QFont.Weight.Bold if bold else QFont.Weight.Normal)
+            # truecolor gradients could otherwise grow this without bound
+            if len(self._formats) >= self.MAX_FORMATS:
+                self._formats.clear()
+            self._formats[style] = fmt
+        return fmt
+
+    def insert(self, cursor, text, style=DEFAULT_STYLE):
+        """Insert ANSI-colored ``text`` at ``cursor``; returns the style in effect afterwards."""
+        runs, style = ansi_runs(text, style)
+        for segment, run_style in runs:
+            cursor.insertText(segment, self.format(run_style))
+        return style
@@ -0,0 +1,23 @@
+from PyQt6.QtCore import QThread, pyqtSignal
+
+
+class BackgroundTask(QThread):
+    """
+    Run a plain Python callable off the GUI thread and report back through
+    signals, for jobs that are not external commands (indexing, merging,
+    probing...).
+    """
+    result_signal = pyqtSignal(object)
+    error_signal = pyqtSignal(str)
+
+    def __init__(self, func, *args, **kwargs):
+        super().__init__()
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+
+    def run(self):
+        try:
+            self.result_signal.emit(self.func(*self.args, **self.kwargs))
+        except Exception as e:
+            self.error_signal.emit(str(e))
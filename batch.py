@@ -0,0 +1,123 @@
+import json
+import sys
+
+# dnsx options that only differ in record types: option -> (name, types)
+DNSX_OPTIONS = {
+    1: ("basic", ("a",)),
+    2: ("a_aaaa", ("a", "aaaa")),
+    3: ("cname", ("cname",)),
+    4: ("mx_txt", ("mx", "txt")),
+}
+# httpx single-URL options that only differ in what is printed: option -> (name, JSON field)
+HTTPX_OPTIONS = {
+    1: ("basic", None),
+    3: ("title", "title"),
+    4: ("status", "status_code"),
+    5: ("headers", "header"),
+}
+HTTPX_FLAGS = {"title": "-title", "status_code": "-status-code", "header": "-include-response-header"}
+
+
+def dnsx_flags(names):
+    """Union of the record-type flags the given dnsx options need."""
+    types = []
+    for name, option_types in DNSX_OPTIONS.values():
+        if name in names:
+            types.extend(t for t in option_types if t not in types)
+    return " ".join(f"-{t}" for t in types)
+
+
+def httpx_flags(names):
+    fields = [field for name, field in HTTPX_OPTIONS.values() if name in names and field]
+    return " ".join(HTTPX_FLAGS[f] for f in fields)
+
+
+def _records(path):
+    with open(path, errors="replace") as f:
+        for line in f:
+            line = line.strip()
+            if not line.startswith('{'):
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+
+def split_dnsx(combined, outputs):
+    """
+    Write each option's file from one combined ``dnsx -json`` run:
+    ``outputs`` maps option name -> path; a host goes to an option's file
+    when it has any of that option's record types. Returns lines per option.
+    """
+    types = {name: option_types for name, option_types in DNSX_OPTIONS.values()}
+    files = {name: open(path, "w") for name, path in outputs.items()}
+    counts = dict.fromkeys(outputs, 0)
+    try:
+        for record in _records(combined):
+            host = record.get("host")
+            if not host:
+                continue
+            for name, f in files.items():
+                if any(record.get(t) for t in types[name]):
+                    f.write(host + "\n")
+                    counts[name] += 1
+    finally:
+        for f in files.values():
+            f.close()
+    return counts
+
+
+def _httpx_line(record, field):
+    url = record.get("url", "")
+    if field is None:
+        return url
+    value = record.get(field)
+    if value is None:
+        return None
+    if field == "header":
+        return url + "".join(f"\n  {k}: {v}" for k, v in sorted(value.items()))
+    return f"{url} [{value}]"
+
+
+def split_httpx(combined, outputs):
+    """Write each httpx option's file from one combined ``httpx -json`` run, in httpx's text format."""
+    fields = {name: field for name, field in HTTPX_OPTIONS.values()}
+    files = {name: open(path, "w") for name, path in outputs.items()}
+    counts = dict.fromkeys(outputs, 0)
+    try:
+        for record in _records(combined):
+            for name, f in files.items():
+                line = _httpx_line(record, fields[name])
+                if line is not None:
+                    f.write(line + "\n")
+                    counts[name] += 1
+    finally:
+        for f in files.values():
+            f.close()
+    return counts
+
+
+def main(argv):
+    """
+    batch.py split dnsx|httpx COMBINED_JSON NAME=PATH...
+    Split a coalesced run back into the files the single options write.
+    """
+    args = argv[1:]
+    if len(args) < 4 or args[0] != "split" or args[1] not in ("dnsx", "httpx"):
+        print(main.__doc__.strip(), file=sys.stderr)
+        return 2
+    outputs = dict(a.split("=", 1) for a in args[3:])
+    split = split_dnsx if args[1] == "dnsx" else split_httpx
+    try:
+        counts = split(args[2], outputs)
+    except (OSError, KeyError) as e:
+        print(f"[batch] split failed: {e}", file=sys.stderr)
+        return 1
+    for name, n in counts.items():
+        print(f"[batch] {name}: {n} lines -> {outputs[name]}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,475 @@
+import argparse
+import json
+import os
+import shutil
+import socket
+import socketserver
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from rich.console import Console
+from rich.table import Table
+
+from presets import PresetCommands
+from resolvers import build_query, parse_response
+
+console = Console()
+
+TOOLS = ["fuzzer", "httpx", "nuclei", "subfinder", "dnsx"]
+STUB_TOOLS = ["ffuf", "httpx", "nuclei", "subfinder", "dnsx"]
+DNS_TOOLS = ("subfinder", "dnsx")
+BENCH_DOMAIN = "bench.test"
+# paths the HTTP stand-in answers 200 for; everything else is a 404
+HTTP_HITS = {"/", "/admin", "/login", "/backup", "/index.php", "/search.php", "/path"}
+# subdomains the DNS stand-in resolves, plus the names resolvers.py checks
+DNS_NAMES = {"www", "api", "admin", "mail", "dev", "vpn"}
+DNS_FIXED = {"one.one.one.one": "1.1.1.1", "dns.google": "8.8.8.8"}
+BASE_WORDS = ["admin", "login", "backup", "api", "www", "mail", "dev", "vpn", "index.php", "search.php"]
+
+_DNS_HEADER = struct.Struct(">HHHHHH")
+PAGE_KB = (os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096) // 1024
+
+
+class CountingHTTPHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _answer(self):
+        self.server.count()
+        path = self.path.split('?', 1)[0]
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        body = b"<html><title>bench</title>index of /</html>\n" if path in HTTP_HITS else b"not found\n"
+        self.send_response(200 if path in HTTP_HITS else 404)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    do_GET = do_POST = do_HEAD = _answer
+
+    def log_message(self, *args):
+        pass
+
+
+class HTTPStandIn(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), CountingHTTPHandler)
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def count(self):
+        with self._lock:
+            self.requests += 1
+
+
+class DNSHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        data, sock = self.request
+        self.server.count()
+        try:
+            qid = _DNS_HEADER.unpack_from(data)[0]
+            pos, labels = _DNS_HEADER.size, []
+            while data[pos]:
+                labels.append(data[pos + 1:pos + 1 + data[pos]].decode("ascii", "replace").lower())
+                pos += 1 + data[pos]
+            qtype = struct.unpack_from(">H", data, pos + 1)[0]
+            question = data[_DNS_HEADER.size:pos + 5]
+        except (struct.error, IndexError):
+            return
+        name = ".".join(labels)
+        address = DNS_FIXED.get(name)
+        if address is None and (name == BENCH_DOMAIN or (
+                name.endswith("." + BENCH_DOMAIN) and name[:-len(BENCH_DOMAIN) - 1] in DNS_NAMES)):
+            address = "127.0.0.1"
+        if address is None:
+            sock.sendto(_DNS_HEADER.pack(qid, 0x8183, 1, 0, 0, 0) + question, self.client_address)
+            return
+        answers = b""
+        if qtype == 1:
+            answers = b"\xc0\x0c" + struct.pack(">HHIH", 1, 1, 60, 4) + socket.inet_aton(address)
+        sock.sendto(_DNS_HEADER.pack(qid, 0x8580, 1, 1 if answers else 0, 0, 0) + question + answers,
+                    self.client_address)
+
+
+class DNSStandIn(socketserver.ThreadingUDPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), DNSHandler)
+        self.queries = 0
+        self._lock = threading.Lock()
+
+    def count(self):
+        with self._lock:
+            self.queries += 1
+
+
+class BenchContext(PresetCommands):
+    """The state on_option_click reads, pointed at the bench work directory."""
+
+    def __init__(self, domain, workdir, wordlist, templates):
+        self.domain = domain
+        self.output_dir = workdir
+        self.output_filename = "ffuf_bench.json"
+        self.wordlist_path = wordlist
+        self.nuclei_templates_path = templates
+        self.delta_mode = False
+        self.nuclei_shards = 1
+        self.template_index = None
+        self.template_index_ready = False
+        self.tool_info = {}
+        self.scope_path = None
+
+
+def _args(argv, *names):
+    values = []
+    for i, a in enumerate(argv[:-1]):
+        if a in names:
+            values.append(argv[i + 1])
+    return values
+
+
+def _stdin_lines():
+    if sys.stdin is None or sys.stdin.isatty():
+        return []
+    return [line.strip() for line in sys.stdin if line.strip()]
+
+
+def _fetch(url, data=None):
+    try:
+        with urllib.request.urlopen(url, data=data, timeout=5) as r:
+            return r.status
+    except urllib.error.HTTPError as e:
+        return e.code
+    except (urllib.error.URLError, OSError, ValueError):
+        return None
+
+
+def _dns_server(argv):
+    spec = (_args(argv, "-r") or [os.environ.get("BENCH_DNS", "")])[0]
+    if os.path.isfile(spec):
+        with open(spec) as f:
+            spec = next((line.strip() for line in f if line.strip()), "")
+    host, _, port = spec.rpartition(':')
+    return host or "127.0.0.1", int(port or 53)
+
+
+def _host(url):
+    return url.split("://", 1)[-1].split('/', 1)[0].rsplit(':', 1)[0]
+
+
+def _is_address(url):
+    try:
+        socket.inet_aton(_host(url))
+        return True
+    except OSError:
+        return False
+
+
+def _resolve(server, name):
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        s.settimeout(2)
+        try:
+            s.sendto(build_query(1, name), server)
+            _, rcode, addresses = parse_response(s.recv(4096))
+        except (OSError, struct.error, IndexError):
+            return False
+    return rcode == 0 and bool(addresses)
+
+
+def run_stub(tool, argv):
+    """
+    Stand-in for a real tool: does the same kind of work (HTTP requests to
+    the targets, DNS queries to the -r resolver) and writes -o, so presets
+    can be timed without the Go binaries.
+    """
+    out = (_args(argv, "-o") or [None])[0]
+    results = []
+    if tool == "ffuf":
+        url = (_args(argv, "-u") or [""])[0].replace("https://", "http://")
+        wordlist = (_args(argv, "-w") or [""])[0].split(':')[0]
+        with open(wordlist) as f:
+            words = [w.strip() for w in f if w.strip()]
+        post = "-d" in argv
+        with ThreadPoolExecutor(16) as pool:
+            codes = list(pool.map(lambda w: _fetch(url.replace("FUZZ", w), b"x" if post else None), words))
+        results = [{"input": {"FUZZ": w}, "status": c} for w, c in zip(words, codes) if c == 200]
+        text = json.dumps({"results": results})
+    elif tool in ("httpx", "nuclei"):
+        targets = _args(argv, "-u") or _stdin_lines()
+        urls = [t if "://" in t else "http://" + t for t in targets]
+        urls = [u.replace("https://", "http://") for u in urls]
+        # names cost a lookup against the bench resolver; only address
+        # literals have something listening behind them
+        server = _dns_server(argv)
+        for u in urls:
+            if not _is_address(u):
+                _resolve(server, _host(u))
+        urls = [u for u in urls if _is_address(u)]
+        if tool == "nuclei":
+            urls = [u.rstrip('/') + p for u in urls for p in sorted(HTTP_HITS) + ["/.env", "/.git/config"]]
+        with ThreadPoolExecutor(16) as pool:
+            codes = list(pool.map(_fetch, urls))
+        results = [u for u, c in zip(urls, codes) if c == 200]
+        text = "".join(f"{u}\n" for u in results)
+    else:
+        server = _dns_server(argv)
+        domain = (_args(argv, "-d") or [BENCH_DOMAIN])[0]
+        if tool == "subfinder":
+            names = [f"{w}.{domain}" for w in BASE_WORDS]
+        elif _args(argv, "-w"):
+            with open(_args(argv, "-w")[0]) as f:
+                names = [f"{w.strip()}.{domain}" for w in f if w.strip()]
+        else:
+            names = _stdin_lines() or [domain]
+        with ThreadPoolExecutor(16) as pool:
+            found = list(pool.map(lambda n: _resolve(server, n), names))
+        results = [n for n, ok in zip(names, found) if ok]
+        text = "".join(f"{n}\n" for n in results)
+    sys.stdout.write(text if tool != "ffuf" else "".join(f"{r['input']['FUZZ']}\n" for r in results))
+    if out:
+        with open(out, "w") as f:
+            f.write(text)
+    return 0
+
+
+def make_stub_bin(directory):
+    os.makedirs(directory, exist_ok=True)
+    for tool in STUB_TOOLS:
+        path = os.path.join(directory, tool)
+        with open(path, "w") as f:
+            f.write(f'#!/bin/sh\nexec "{sys.executable}" "{os.path.abspath(__file__)}" stub {tool} "$@"\n')
+        os.chmod(path, 0o755)
+    return directory
+
+
+def prepare_workdir(workdir, dns_port, http_port, words):
+    wordlist = os.path.join(workdir, "wordlist.txt")
+    with open(wordlist, "w") as f:
+        # the httpx list presets read hosts from the wordlist
+        f.write(f"127.0.0.1:{http_port}\n")
+        for i in range(words):
+            f.write(BASE_WORDS[i] if i < len(BASE_WORDS) else f"word{i}")
+            f.write("\n")
+    templates = os.path.join(workdir, "nuclei-templates")
+    for part in ("vulnerabilities", "exposures", "files", "takeovers", "misconfiguration", "credentials", "custom"):
+        os.makedirs(os.path.join(templates, part), exist_ok=True)
+    with open(os.path.join(workdir, "resolvers.txt"), "w") as f:
+        f.write(f"127.0.0.1:{dns_port}\n")
+    return wordlist, templates
+
+
+def bench_command(cmd, tool, dns_port):
+    """Point a preset command at the stand-ins (plain http, local resolver)."""
+    cmd = cmd.replace("https://", "http://")
+    if tool in DNS_TOOLS and " -r " not in cmd:
+        cmd = cmd.replace(f"{tool} -d", f"{tool} -r 127.0.0.1:{dns_port} -d")
+    return cmd
+
+
+def session_rss_kb(sid):
+    """Summed RSS (KiB) of every process in session ``sid``, from /proc; None where there is no /proc."""
+    total = 0
+    try:
+        pids = [p for p in os.listdir("/proc") if p.isdigit()]
+    except OSError:
+        return None
+    for pid in pids:
+        try:
+            with open(f"/proc/{pid}/stat", "rb") as f:
+                # pid (comm) state ppid pgrp session ...; comm may contain spaces
+                fields = f.read().rsplit(b")", 1)[1].split()
+            if int(fields[3]) != sid:
+                continue
+            with open(f"/proc/{pid}/statm", "rb") as f:
+                total += int(f.read().split()[1]) * PAGE_KB
+        except (OSError, IndexError, ValueError):
+            continue
+    return total
+
+
+class TreeRSSSampler(threading.Thread):
+    """Peak of the summed RSS of a job's session (the preset's whole process tree), sampled every ``interval``."""
+
+    def __init__(self, sid, interval=0.02):
+        super().__init__(daemon=True)
+        self.sid = sid
+        self.interval = interval
+        self.peak_kb = 0
+        self._done = threading.Event()
+
+    def run(self):
+        while not self._done.is_set():
+            rss = session_rss_kb(self.sid)
+            if rss is None:
+                return
+            self.peak_kb = max(self.peak_kb, rss)
+            self._done.wait(self.interval)
+
+    def stop(self):
+        self._done.set()
+        self.join()
+
+
+def measure(cmd, cwd, env, http, dns, timeout):
+    """
+    Run one command; wall/cpu seconds, peak RSS (KiB) and stand-in hits of
+    the whole process tree. RSS is the peak of the tree's summed RSS where
+    /proc can be sampled, and never less than its largest single process.
+    """
+    requests_before = http.requests + dns.queries
+    started = time.perf_counter()
+    proc = subprocess.Popen(cmd, shell=True, cwd=cwd, env=env, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.DEVNULL, start_new_session=True)
+    sampler = TreeRSSSampler(proc.pid)
+    sampler.start()
+    timer = threading.Timer(timeout, lambda: os.killpg(proc.pid, 9))
+    timer.start()
+    try:
+        _, status, usage = os.wait4(proc.pid, 0)
+    finally:
+        timer.cancel()
+        sampler.stop()
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    wall = time.perf_counter() - started
+    requests = http.requests + dns.queries - requests_before
+    # ru_maxrss is KiB on Linux but bytes on macOS
+    rss = usage.ru_maxrss // 1024 if sys.platform == "darwin" else usage.ru_maxrss
+    rss = max(rss, sampler.peak_kb)
+    return {
+        "exit": proc.returncode, "wall": round(wall, 4), "cpu": round(usage.ru_utime + usage.ru_stime, 4),
+        "rss_kb": rss, "requests": requests, "rps": round(requests / wall, 1) if wall > 0 else 0.0,
+    }
+
+
+def compare(results, baseline, tolerance, slack=0.05):
+    """Presets whose wall time or RSS grew beyond the tolerance; [(preset, reason)]."""
+    regressions = []
+    for key, r in results.items():
+        base = baseline.get(key)
+        if not base:
+            continue
+        if r["wall"] > base["wall"] * (1 + tolerance) + slack:
+            regressions.append((key, f"wall {base['wall']:.3f}s -> {r['wall']:.3f}s"))
+        if base.get("rss_kb") and r["rss_kb"] > base["rss_kb"] * (1 + tolerance):
+            regressions.append((key, f"rss {base['rss_kb']} -> {r['rss_kb']} KiB"))
+    return regressions
+
+
+def parse_presets(spec):
+    if not spec:
+        return [(t, i) for t in TOOLS for i in range(1, 11)]
+    presets = []
+    for item in spec.split(','):
+        tool, _, idx = item.partition(':')
+        indices = [int(idx)] if idx else range(1, 11)
+        presets.extend((tool.lower(), i) for i in indices)
+    return presets
+
+
+def run(args):
+    http, dns = HTTPStandIn(), DNSStandIn()
+    for server in (http, dns):
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+    dns_port = dns.server_address[1]
+    workdir = tempfile.mkdtemp(prefix="hackingtool_bench_")
+    env = dict(os.environ)
+    # keep caches and rankings the presets write away from the real ~/.hackingtool
+    env["HOME"] = os.environ["HOME"] = os.path.join(workdir, "home")
+    env["BENCH_DNS"] = f"127.0.0.1:{dns_port}"
+    if args.stubs:
+        env["PATH"] = make_stub_bin(os.path.join(workdir, "bin")) + os.pathsep + env.get("PATH", "")
+    wordlist, templates = prepare_workdir(workdir, dns_port, http.server_address[1], args.words)
+    http_ctx = BenchContext(f"127.0.0.1:{http.server_address[1]}", workdir, wordlist, templates)
+    dns_ctx = BenchContext(BENCH_DOMAIN, workdir, wordlist, templates)
+
+    results = {}
+    try:
+        for tool, idx in parse_presets(args.presets):
+            ctx = dns_ctx if tool in DNS_TOOLS else http_ctx
+            cmd = ctx.preset_command(tool, idx)
+            if not cmd or cmd.lstrip().startswith('#'):
+                continue
+            cmd = bench_command(cmd, tool, dns_port)
+            runs = [measure(cmd, workdir, env, http, dns, args.timeout) for _ in range(args.repeat)]
+            # a failed run is the result: its timing says nothing about the preset
+            failed = [r for r in runs if r["exit"] != 0]
+            best = failed[0] if failed else min(runs, key=lambda r: r["wall"])
+            best["command"] = cmd
+            results[f"{tool}:{idx}"] = best
+    finally:
+        http.shutdown()
+        dns.shutdown()
+        if not args.keep:
+            shutil.rmtree(workdir, ignore_errors=True)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time every sidebar preset against local HTTP/DNS stand-ins")
+    parser.add_argument("--stubs", action="store_true", help="use stub tools instead of the real binaries")
+    parser.add_argument("--presets", help="comma-separated tool[:index] list, e.g. fuzzer:1,dnsx (default: all)")
+    parser.add_argument("--words", type=int, default=200, help="wordlist size (default 200)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per preset; the fastest counts (default 3)")
+    parser.add_argument("--timeout", type=float, default=120, help="per-run timeout in seconds")
+    parser.add_argument("--baseline", default=os.path.join(os.path.expanduser("~/.hackingtool"), "bench_baseline.json"))
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown/RSS growth (default 25%%)")
+    parser.add_argument("--keep", action="store_true", help="keep the bench work directory")
+    args = parser.parse_args(argv)
+
+    baseline_path = os.path.abspath(args.baseline)
+    results = run(args)
+
+    table = Table(title="Preset benchmark")
+    for col in ("Preset", "Exit", "Wall (s)", "CPU (s)", "RSS (KiB)", "Requests", "Req/s"):
+        table.add_column(col)
+    for key, r in results.items():
+        table.add_row(key, str(r["exit"]), f"{r['wall']:.3f}", f"{r['cpu']:.3f}", str(r["rss_kb"]),
+                      str(r["requests"]), f"{r['rps']:.1f}")
+    console.print(table)
+
+    failures = {key: r for key, r in results.items() if r["exit"] != 0}
+    for key, r in failures.items():
+        console.print(f"[bold red]FAILED {key}: exit {r['exit']} ({r['command']})[/bold red]")
+
+    if args.save_baseline:
+        if failures:
+            console.print("[bold red]not saving a baseline with failed presets[/bold red]")
+            return 1
+        os.makedirs(os.path.dirname(baseline_path), exist_ok=True)
+        with open(baseline_path, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        console.print(f"[green]baseline saved to {baseline_path}[/green]")
+        return 0
+    try:
+        with open(baseline_path) as f:
+            baseline = json.load(f)
+    except (OSError, ValueError):
+        console.print(f"[yellow]no baseline at {baseline_path}; run with --save-baseline[/yellow]")
+        return 1 if failures else 0
+    regressions = compare(results, baseline, args.tolerance)
+    for key, reason in regressions:
+        console.print(f"[bold red]REGRESSION {key}: {reason}[/bold red]")
+    if regressions or failures:
+        return 1
+    console.print("[green]no regressions against the baseline[/green]")
+    return 0
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == "stub":
+        sys.exit(run_stub(sys.argv[2], sys.argv[3:]))
+    sys.exit(main())
@@ -3,19 +3,44 @@ import os
 import signal
 import subprocess
 from PyQt6.QtCore import QThread, pyqtSignal
+from job_log import JobLog
+from output_queue import OutputQueue
+from spawn import spawn
+from utils import LineSplitter
 
 class CommandWorker(QThread):
     output_signal = pyqtSignal(str)
     finished_signal = pyqtSignal()
+    _wake_signal = pyqtSignal()
 
-    def __init__(self, command, cwd=None):
+    def __init__(self, command, cwd=None, log_path=None):
         super().__init__()
         self.command = command
         self.cwd = cwd
+        self.log_path = log_path
         self.process = None
+        self.queue = OutputQueue(log_path=log_path)
+        # QThread object lives in the GUI thread, so the drain runs there
+        self._wake_signal.connect(self._drain)
+
+    def _drain(self):
+        for chunk in self.queue.drain():
+            self.output_signal.emit(chunk)
+
+    def _push(self, chunk, log):
+        if log is not None:
+            log.write_line(chunk.rstrip('\n'))
+        if self.queue.push(chunk):
+            self._wake_signal.emit()
 
     def run(self):
+        log = None
         try:
+            if self.log_path:
+                try:
+                    log = JobLog(self.log_path)
+                except OSError as e:
+                    self._push(f"[Error] cannot open job log: {e}\n", None)
             is_windows = platform.system() == "Windows"
             if is_windows:
                 creationflags = subprocess.CREATE_NEW_PROCESS_GROUP
@@ -24,31 +49,31 @@ class CommandWorker(QThread):
                     shell=True,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.STDOUT,
-                    text=True,
                     cwd=self.cwd,
                     creationflags=creationflags
                 )
             else:
-                self.process = subprocess.Popen(
-                    self.command,
-                    shell=True,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    text=True,
-                    cwd=self.cwd,
-                    preexec_fn=os.setsid
-                )
+                self.process = spawn(self.command, cwd=self.cwd)
 
-            for line in iter(self.process.stdout.readline, ''):
-                if line is None:
+            splitter = LineSplitter(keep_ends=True)
+            while True:
+                data = self.process.stdout.read1(65536)
+                if not data:
                     break
-                self.output_signal.emit(line.rstrip('\n'))
+                for chunk in splitter.feed(data):
+                    self._push(chunk, log)
+            for chunk in splitter.finish():
+                self._push(chunk, log)
             if self.process.stdout:
                 self.process.stdout.close()
             self.process.wait()
         except Exception as e:
-            self.output_signal.emit(f"[Error] {str(e)}")
+            self._push(f"[Error] {str(e)}\n", None)
         finally:
+            if log is not None:
+                log.close()
+            # queued after every push, so the final drain sees all output
+            self._wake_signal.emit()
             self.finished_signal.emit()
             try:
                 self.process = None
@@ -0,0 +1,158 @@
+import hashlib
+import sqlite3
+import sys
+import time
+
+
+class SeenStore:
+    """
+    Persistent per-stage record of what a recon stage has already handled:
+    key -> (fingerprint, first_seen, last_seen), stored in SQLite. Keys a
+    filter passes on wait in ``pending`` until commit(), which the preset
+    runs only after the downstream tool succeeded, so an interrupted or
+    failed run hands them on again next time.
+    """
+
+    BATCH = 10_000
+
+    def __init__(self, db_path):
+        self.db = sqlite3.connect(db_path)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS seen (
+                stage TEXT NOT NULL,
+                key TEXT NOT NULL,
+                fingerprint TEXT,
+                first_seen REAL NOT NULL,
+                last_seen REAL NOT NULL,
+                PRIMARY KEY (stage, key)
+            )""")
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS pending (
+                stage TEXT NOT NULL,
+                key TEXT NOT NULL,
+                fingerprint TEXT,
+                PRIMARY KEY (stage, key)
+            )""")
+
+    def close(self):
+        self.db.commit()
+        self.db.close()
+
+    def delta(self, stages, records):
+        """
+        For (key, fingerprint) pairs, yield each key that is new to any of
+        ``stages`` (one name or several, for a tool run standing in for
+        several presets) or whose fingerprint changed, once, and hold it as
+        pending for those stages until commit(). Pending keys of an earlier
+        run that never committed are dropped first.
+        """
+        stages = [stages] if isinstance(stages, str) else list(stages)
+        now = time.time()
+        for stage in stages:
+            self.db.execute("DELETE FROM pending WHERE stage = ?", (stage,))
+        batch = 0
+        for key, fp in records:
+            passed = False
+            for stage in stages:
+                row = self.db.execute(
+                    "SELECT fingerprint FROM seen WHERE stage = ? AND key = ?", (stage, key)).fetchone()
+                if row is None or (fp is not None and row[0] != fp):
+                    cur = self.db.execute("INSERT OR IGNORE INTO pending VALUES (?, ?, ?)", (stage, key, fp))
+                    passed = passed or cur.rowcount > 0
+                else:
+                    self.db.execute("UPDATE seen SET last_seen = ? WHERE stage = ? AND key = ?", (now, stage, key))
+            if passed:
+                yield key
+            batch += 1
+            if batch >= self.BATCH:
+                self.db.commit()
+                batch = 0
+        self.db.commit()
+
+    def commit(self, stage):
+        """Record the pending keys of ``stage`` as seen; returns how many."""
+        now = time.time()
+        count = self.db.execute("SELECT COUNT(*) FROM pending WHERE stage = ?", (stage,)).fetchone()[0]
+        self.db.execute("""
+            INSERT OR REPLACE INTO seen
+            SELECT p.stage, p.key, p.fingerprint,
+                   COALESCE((SELECT first_seen FROM seen s WHERE s.stage = p.stage AND s.key = p.key), ?), ?
+            FROM pending p WHERE p.stage = ?""", (now, now, stage))
+        self.db.execute("DELETE FROM pending WHERE stage = ?", (stage,))
+        self.db.commit()
+        return count
+
+    def count(self, stage):
+        return self.db.execute("SELECT COUNT(*) FROM seen WHERE stage = ?", (stage,)).fetchone()[0]
+
+
+def parse_records(lines, fingerprint=False, urls_only=False):
+    """
+    Key is the first field of a line (host or URL); with ``fingerprint``
+    the rest of the line (status, title, tech...) is hashed so a changed
+    response counts as new. With ``urls_only`` lines not starting with an
+    http(s) URL (headers, bodies) are skipped.
+    """
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        fields = line.split(None, 1)
+        key = fields[0].lower()
+        if urls_only and not key.startswith(("http://", "https://")):
+            continue
+        fp = None
+        if fingerprint:
+            fp = hashlib.sha1((fields[1] if len(fields) > 1 else "").encode("utf-8", "replace")).hexdigest()
+        yield key, fp
+
+
+def _input_lines(paths):
+    if not paths or paths == ["-"]:
+        yield from sys.stdin
+        return
+    for path in paths:
+        try:
+            with open(path, errors="replace") as f:
+                yield from f
+        except OSError as e:
+            print(f"[delta] skipping {path}: {e}", file=sys.stderr)
+
+
+def main(argv):
+    """
+    delta.py filter DB STAGE[,STAGE...] [--fingerprint] [--urls] [FILE...|-]
+    Print only keys that a STAGE has not seen before (or whose fingerprint
+    changed), once each, and hold them as pending.
+    delta.py commit DB STAGE[,STAGE...]
+    Remember the STAGEs' pending keys; run it after the stage succeeded.
+    """
+    args = argv[1:]
+    fingerprint = "--fingerprint" in args
+    urls_only = "--urls" in args
+    args = [a for a in args if a not in ("--fingerprint", "--urls")]
+    if len(args) < 3 or args[0] not in ("filter", "commit"):
+        print(main.__doc__.strip(), file=sys.stderr)
+        return 2
+    db_path, stages, inputs = args[1], args[2].split(","), args[3:]
+    store = SeenStore(db_path)
+    try:
+        if args[0] == "commit":
+            for stage in stages:
+                committed = store.commit(stage)
+                print(f"[delta] {stage}: {committed} recorded, {store.count(stage)} known", file=sys.stderr)
+            return 0
+        passed = 0
+        for key in store.delta(stages, parse_records(_input_lines(inputs), fingerprint, urls_only)):
+            sys.stdout.write(key + "\n")
+            passed += 1
+        known = "".join(f", {store.count(stage)} known to {stage}" for stage in stages)
+        print(f"[delta] {args[2]}: {passed} new/changed{known}", file=sys.stderr)
+    finally:
+        store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
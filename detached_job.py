@@ -0,0 +1,83 @@
+import threading
+
+import jobd
+from command_worker import CommandWorker
+from protocol import recv_frame, send_frame
+
+
+class DetachedJob(CommandWorker):
+    """
+    A job owned by the job daemon (jobd.py) rather than by the GUI. Same
+    interface as CommandWorker; with ``job_id`` it reattaches to a job the
+    daemon is already running and replays only the output no GUI has seen.
+    The daemon writes the job log itself. Output is acknowledged once it
+    has been handed to the terminal, so a GUI that dies before that gets
+    it replayed on the next attach.
+    """
+
+    def __init__(self, command, cwd=None, log_path=None, job_id=None):
+        super().__init__(command, cwd=cwd, log_path=log_path)
+        self.job_id = job_id
+        self.sock = None
+        self._send_lock = threading.Lock()
+        # seq after the newest chunk queued for the GUI, and the last one acknowledged
+        self._received = 0
+        self._acked = 0
+        # set once the last chunk is queued; the drain that sees it acks and closes
+        self._finished = False
+
+    def run(self):
+        try:
+            self.sock = jobd.connect()
+            with self._send_lock:
+                if self.job_id is None:
+                    send_frame(self.sock, {"type": "spawn", "command": self.command,
+                                           "cwd": self.cwd, "log": self.log_path})
+                else:
+                    send_frame(self.sock, {"type": "attach", "job": self.job_id})
+            while True:
+                header, payload = recv_frame(self.sock)
+                kind = header.get("type")
+                if kind == "output":
+                    self._push(payload.decode("utf-8", "replace"), None)
+                    # only after the push, so a drain never acknowledges a chunk it did not take
+                    self._received = max(self._received, header["seq"] + 1)
+                elif kind == "spawned":
+                    self.job_id = header["job"]
+                elif kind == "exit":
+                    break
+                elif kind == "error":
+                    self._push(f"[Error] job daemon: {header.get('message')}\n", None)
+                    break
+        except Exception as e:
+            self._push(f"[Error] job daemon: {e}\n", None)
+        finally:
+            # the socket stays open for the final drain's ack; that drain closes it
+            self._finished = True
+            self._wake_signal.emit()
+            self.finished_signal.emit()
+
+    def _drain(self):
+        received, finished = self._received, self._finished
+        super()._drain()
+        if received > self._acked:
+            self._acked = received
+            self._send({"type": "ack", "job": self.job_id, "seq": received})
+        if finished:
+            with self._send_lock:
+                sock, self.sock = self.sock, None
+            if sock is not None:
+                sock.close()
+
+    def _send(self, header):
+        sock = self.sock
+        if sock is None:
+            return
+        try:
+            with self._send_lock:
+                send_frame(sock, header)
+        except OSError:
+            pass
+
+    def interrupt(self):
+        self._send({"type": "interrupt", "job": self.job_id})
@@ -0,0 +1,62 @@
+import heapq
+import os
+import tempfile
+
+
+def _write_run(items, directory):
+    fd, path = tempfile.mkstemp(prefix="run_", suffix=".txt", dir=directory)
+    with os.fdopen(fd, "w") as f:
+        for item in items:
+            f.write(item + "\n")
+    return path
+
+
+def _read_run(path):
+    with open(path, errors="replace") as f:
+        for line in f:
+            yield line.rstrip("\n")
+
+
+def unique_sorted(iterable):
+    """Drop adjacent duplicates from a sorted stream."""
+    last = None
+    for item in iterable:
+        if item != last:
+            yield item
+            last = item
+
+
+def external_sort(lines, tmp_dir=None, chunk_lines=500_000, key=None, unique=True):
+    """
+    Sort an arbitrarily long stream of newline-free strings using sorted
+    runs on disk and a k-way heap merge, yielding the result lazily.
+    Memory is bounded by ``chunk_lines``.
+    """
+    tmp = tempfile.mkdtemp(prefix="extsort_", dir=tmp_dir)
+    runs = []
+    try:
+        chunk = []
+        for line in lines:
+            chunk.append(line)
+            if len(chunk) >= chunk_lines:
+                chunk.sort(key=key)
+                runs.append(_write_run(unique_sorted(chunk) if unique and key is None else chunk, tmp))
+                chunk = []
+        chunk.sort(key=key)
+        if not runs:
+            merged = iter(chunk)
+        else:
+            if chunk:
+                runs.append(_write_run(chunk, tmp))
+            merged = heapq.merge(*(_read_run(r) for r in runs), key=key)
+        yield from (unique_sorted(merged) if unique and key is None else merged)
+    finally:
+        for r in runs:
+            try:
+                os.remove(r)
+            except OSError:
+                pass
+        try:
+            os.rmdir(tmp)
+        except OSError:
+            pass
@@ -0,0 +1,196 @@
+import argparse
+import json
+import os
+import sys
+from collections import Counter
+
+try:
+    import numpy as np
+except ImportError:  # optional: the pure-Python path gives the same answers, just slower
+    np = None
+
+COLUMNS = ("status", "length", "words", "lines", "duration")
+# ffuf filter flag per response-shape column, most specific first
+FILTER_FLAGS = (("length", "-fs"), ("words", "-fw"), ("lines", "-fl"))
+
+
+def load_results(path):
+    """The ``results`` list of a ffuf ``-of json`` file, plus the whole document."""
+    with open(path, errors="replace") as f:
+        doc = json.load(f)
+    return doc.get("results") or [], doc
+
+
+class Columns:
+    """
+    ffuf results as one array per column (status, length, words, lines,
+    duration): NumPy int64 arrays when NumPy is installed, lists otherwise.
+    ``shape`` holds each row's (status, words, lines) as one comparable key.
+    """
+
+    def __init__(self, results):
+        self.n = len(results)
+        for name in COLUMNS:
+            values = (r.get(name) or 0 for r in results)
+            if np is not None:
+                setattr(self, name, np.fromiter(values, dtype=np.int64, count=self.n))
+            else:
+                setattr(self, name, [int(v) for v in values])
+        if np is not None:
+            self.shape = _pack(self.status, self.words, self.lines)
+        else:
+            self.shape = list(zip(self.status, self.words, self.lines))
+
+
+def _pack(status, words, lines):
+    """(status, words, lines) packed into one int64 per row: 10 + 27 + 26 bits."""
+    return (np.clip(status, 0, (1 << 10) - 1) << 53) | (np.clip(words, 0, (1 << 27) - 1) << 26) \
+        | np.clip(lines, 0, (1 << 26) - 1)
+
+
+def _unpack(key):
+    if np is None:
+        return key
+    key = int(key)
+    return key >> 53, (key >> 26) & ((1 << 27) - 1), key & ((1 << 26) - 1)
+
+
+def _shape_counts(cols):
+    """{shape key: count} for every response shape present."""
+    if np is not None:
+        keys, counts = np.unique(cols.shape, return_counts=True)
+        return dict(zip(keys.tolist(), counts.tolist()))
+    return Counter(cols.shape)
+
+
+def _isin(column, values):
+    if np is not None:
+        return np.isin(column, list(values))
+    values = set(values)
+    return [v in values for v in column]
+
+
+def _empty(n):
+    return np.zeros(n, dtype=bool) if np is not None else [False] * n
+
+
+def _union(a, b):
+    return a | b if np is not None else [x or y for x, y in zip(a, b)]
+
+
+def _count_outside(mask, noise):
+    """Rows selected by ``mask`` that are not noise."""
+    if np is not None:
+        return int((mask & ~noise).sum())
+    return sum(m and not n for m, n in zip(mask, noise))
+
+
+def _values(column, mask):
+    """Distinct values of ``column`` on the rows selected by ``mask``."""
+    if np is not None:
+        return set(int(v) for v in np.unique(column[mask]))
+    return {v for v, m in zip(column, mask) if m}
+
+
+def cluster(cols, min_hits=25, min_ratio=0.05, max_values=5):
+    """
+    Find the noise: response shapes (status, words, lines) covering at
+    least ``min_hits`` results and ``min_ratio`` of all of them. For each
+    one pick the filter needing the fewest values (-fs, then -fw, then -fl
+    on ties), at most ``max_values``, that removes nothing outside the noise.
+    Returns (clusters, flags, noise mask) where flags maps a ffuf flag to
+    the sorted values to filter.
+    """
+    threshold = max(min_hits, int(min_ratio * cols.n))
+    noisy = sorted((c, key) for key, c in _shape_counts(cols).items() if c >= threshold)
+    noisy.reverse()
+    flags = {}
+    clusters = []
+    noise = _isin(cols.shape, [key for _, key in noisy])
+    filtered = _empty(cols.n)
+    for count, key in noisy:
+        rows = _isin(cols.shape, [key])
+        shape = _unpack(key)
+        chosen = None
+        for column, flag in FILTER_FLAGS:
+            values = _values(getattr(cols, column), rows)
+            if len(values) > max_values or (chosen and len(values) >= len(chosen[1])):
+                continue
+            hit = _isin(getattr(cols, column), values)
+            if _count_outside(hit, noise) == 0:
+                chosen = (flag, values, hit)
+        entry = {"status": shape[0], "words": shape[1], "lines": shape[2], "count": count,
+                 "duration_ms": _median_ms(cols.duration, rows)}
+        if chosen is not None:
+            flag, values, hit = chosen
+            flags.setdefault(flag, set()).update(values)
+            filtered = _union(filtered, hit)
+            entry["filter"] = f"{flag} {','.join(str(v) for v in sorted(values))}"
+        clusters.append(entry)
+    return clusters, {flag: sorted(values) for flag, values in flags.items()}, filtered
+
+
+def _median_ms(durations, mask):
+    """Median duration (ffuf reports nanoseconds) of the selected rows, in ms."""
+    if np is not None:
+        selected = durations[mask]
+        return round(float(np.median(selected)) / 1e6, 1) if selected.size else None
+    selected = sorted(d for d, m in zip(durations, mask) if m)
+    return round(selected[len(selected) // 2] / 1e6, 1) if selected else None
+
+
+def flag_args(flags):
+    """'-fs 1234,5678 -fw 12' for a ffuf rerun."""
+    return " ".join(f"{flag} {','.join(str(v) for v in values)}" for flag, values in flags.items())
+
+
+def write_filtered(doc, results, filtered, out_path):
+    """Write the ffuf document back with the filtered rows dropped; returns rows kept."""
+    if np is not None:
+        keep = np.flatnonzero(~filtered)
+        kept = [results[i] for i in keep.tolist()]
+    else:
+        kept = [r for r, f in zip(results, filtered) if not f]
+    doc = dict(doc, results=kept)
+    tmp = out_path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(doc, f)
+    os.replace(tmp, out_path)
+    return len(kept)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Cluster ffuf -of json results into noise response shapes, drop them and "
+                    "print the -fs/-fw/-fl flags that filter them on a rerun")
+    parser.add_argument("input", help="ffuf output written with -of json")
+    parser.add_argument("-o", "--output", help="filtered results file (default INPUT.filtered.json)")
+    parser.add_argument("--min-hits", type=int, default=25, help="smallest cluster treated as noise")
+    parser.add_argument("--min-ratio", type=float, default=0.05, help="smallest share of results treated as noise")
+    parser.add_argument("--max-values", type=int, default=5, help="most values a single filter flag may carry")
+    parser.add_argument("--flags-only", action="store_true", help="only print the filter flags")
+    args = parser.parse_args(argv)
+
+    try:
+        results, doc = load_results(args.input)
+    except (OSError, ValueError) as e:
+        print(f"[ffuf-cluster] cannot read {args.input}: {e}", file=sys.stderr)
+        return 1
+    cols = Columns(results)
+    clusters, flags, filtered = cluster(cols, args.min_hits, args.min_ratio, args.max_values)
+    if args.flags_only:
+        print(flag_args(flags))
+        return 0
+    for c in clusters:
+        print(f"[ffuf-cluster] noise: status {c['status']}, {c['words']} words, {c['lines']} lines "
+              f"x{c['count']} ({c['duration_ms']} ms) -> {c.get('filter', 'no safe filter')}")
+    out = args.output or os.path.splitext(args.input)[0] + ".filtered.json"
+    kept = write_filtered(doc, results, filtered, out)
+    print(f"[ffuf-cluster] kept {kept} of {cols.n} results -> {out}")
+    if flags:
+        print(f"[ffuf-cluster] rerun with: {flag_args(flags)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
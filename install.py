@@ -4,31 +4,98 @@ import sys
 import time
 import shutil
 import stat
+from concurrent.futures import ThreadPoolExecutor
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 from rich.prompt import Confirm, Prompt
+from rich.table import Table
 from rich.text import Text
+from tool_versions import TOOLS, VersionCache, go_binary, probe_installed, probe_latest
 
 console = Console()
 
 def check_go_installed():
     """Check if Go is installed."""
     try:
-        subprocess.run(["go", "version"], check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        subprocess.run([go_binary(), "version"], check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
         return True
     except (subprocess.CalledProcessError, FileNotFoundError):
         return False
 
-def install_go_tool(tool_url):
+def go_build_env():
+    """
+    Environment for concurrent `go install` runs: every job gets the same
+    module and build cache so shared dependencies are fetched/compiled once.
+    """
+    env = dict(os.environ)
+    try:
+        res = subprocess.run([go_binary(), "env", "GOMODCACHE", "GOCACHE"],
+                             stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, check=True)
+        values = res.stdout.splitlines()
+        if len(values) == 2:
+            env.setdefault("GOMODCACHE", values[0])
+            env.setdefault("GOCACHE", values[1])
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        pass
+    return env
+
+def install_go_tool(tool_url, env=None):
     """Install a Go tool using go install."""
     try:
-        subprocess.run(["go", "install", tool_url], check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        subprocess.run([go_binary(), "install", tool_url], check=True, stdout=subprocess.PIPE,
+                       stderr=subprocess.PIPE, env=env)
         return True
     except subprocess.CalledProcessError as e:
         console.print(f"[bold red]Error installing {tool_url}: {e}[/bold red]")
         return False
 
+def probe_tool(tool, cache):
+    """Installed and latest version of a tool; both lookups hit the cache first."""
+    start = time.monotonic()
+    binary, installed = probe_installed(tool, cache)
+    latest = probe_latest(tool, cache)
+    return {"binary": binary, "installed": installed, "latest": latest, "probe_time": time.monotonic() - start}
+
+def plan_installs(tools, probes, force=False):
+    """Tools needing `go install`: missing, outdated, or unknown when the latest can't be resolved."""
+    todo = []
+    for tool in tools:
+        p = probes[tool["name"]]
+        if force or not p["binary"] or not p["installed"] or p["installed"] in ("(devel)", None):
+            todo.append(tool)
+        elif p["latest"] and p["installed"] != p["latest"]:
+            todo.append(tool)
+    return todo
+
+def install_tools(tools, force=False, max_workers=None):
+    """
+    Probe every tool concurrently, then `go install` only the ones that are
+    missing or outdated, in parallel. Returns {name: (status, seconds)}.
+    """
+    cache = VersionCache()
+    with ThreadPoolExecutor(max_workers=len(tools)) as pool:
+        probes = dict(zip((t["name"] for t in tools), pool.map(lambda t: probe_tool(t, cache), tools)))
+    cache.save()
+
+    results = {t["name"]: ("up to date", probes[t["name"]]["probe_time"]) for t in tools}
+    todo = plan_installs(tools, probes, force)
+    if not todo:
+        return results, probes
+
+    env = go_build_env()
+
+    def run(tool):
+        version = probes[tool["name"]]["latest"] or "latest"
+        start = time.monotonic()
+        ok = install_go_tool(f"{tool['package']}@{version}", env=env)
+        return tool["name"], ok, time.monotonic() - start
+
+    with ThreadPoolExecutor(max_workers=max_workers or len(todo)) as pool:
+        for name, ok, seconds in pool.map(run, todo):
+            results[name] = ("installed" if ok else "failed", seconds)
+    return results, probes
+
 def create_global_command():
     """Create a global command to run the app from any terminal."""
     app_name = "moderndarkterminal"
@@ -80,33 +147,33 @@ def main():
             console.print("[bold red]Installation aborted.[/bold red]")
             sys.exit(1)
 
-    tools = [
-        "github.com/ffuf/ffuf@latest",
-        "github.com/projectdiscovery/httpx/cmd/httpx@latest",
-        "github.com/projectdiscovery/subfinder/v2/cmd/subfinder@latest",
-        "github.com/projectdiscovery/nuclei/v3/cmd/nuclei@latest",
-        "github.com/projectdiscovery/dnsx/cmd/dnsx@latest"
-    ]
-
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        transient=True
-    ) as progress:
-        if check_go_installed():
-            task = progress.add_task("[cyan]Installing Go tools...", total=len(tools))
-            for tool in tools:
-                progress.update(task, description=f"Installing {tool.split('/')[-1].split('@')[0]}...")
-                success = install_go_tool(tool)
-                if success:
-                    console.print(f"[green]✓ {tool} installed successfully![/green]")
-                else:
-                    console.print(f"[red]✗ Failed to install {tool}.[/red]")
-                progress.advance(task)
-                time.sleep(0.5)
-        else:
-            console.print("[yellow]Skipping Go tools installation as Go is not detected.[/yellow]")
+    force = "--force" in sys.argv
+
+    if check_go_installed():
+        start = time.monotonic()
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            transient=True
+        ) as progress:
+            progress.add_task("[cyan]Checking and installing Go tools...", total=None)
+            results, probes = install_tools(TOOLS, force=force)
+
+        table = Table(title="Go tools")
+        table.add_column("Tool")
+        table.add_column("Version")
+        table.add_column("Status")
+        table.add_column("Time", justify="right")
+        for tool in TOOLS:
+            status, seconds = results[tool["name"]]
+            color = {"installed": "green", "failed": "red"}.get(status, "cyan")
+            version = probes[tool["name"]]["latest"] or probes[tool["name"]]["installed"] or "?"
+            table.add_row(tool["name"], version, f"[{color}]{status}[/{color}]", f"{seconds:.1f}s")
+        console.print(table)
+        console.print(f"[cyan]Go tools done in {time.monotonic() - start:.1f}s[/cyan]")
+    else:
+        console.print("[yellow]Skipping Go tools installation as Go is not detected.[/yellow]")
 
     console.print("\n[bold blue]Installing PyQt6...[/bold blue]")
     try:
@@ -0,0 +1,196 @@
+import bisect
+import gzip
+import os
+import re
+import struct
+import threading
+import time
+
+from utils import app_data_dir
+
+# offset, compressed size, first line number, line count, first ts, last ts
+INDEX_RECORD = struct.Struct("<QIQIdd")
+
+
+def new_job_log_path(command: str) -> str:
+    """Build a unique log path for a job, named after its command."""
+    words = command.strip().split()
+    slug = re.sub(r'[^A-Za-z0-9_.-]+', '_', words[0] if words else "job")[:32]
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    directory = app_data_dir("logs", time.strftime("%Y-%m-%d"))
+    base = os.path.join(directory, f"{stamp}_{slug}")
+    path = f"{base}.log.gz"
+    n = 1
+    while os.path.exists(path):
+        n += 1
+        path = f"{base}_{n}.log.gz"
+    return path
+
+
+class JobLog:
+    """
+    Append-only compressed log of a job's raw output.
+
+    Lines are buffered and written as independent gzip members ("frames"),
+    so the file is still a valid .gz for zcat, while the sidecar .idx file
+    maps every frame to its byte offset, line range and time range. A
+    frame is written once it is FRAME_BYTES big or FRAME_SECONDS old, by a
+    timer if the job has gone quiet. Consecutive '\r' progress lines
+    still in the buffer collapse into the newest one.
+    """
+
+    FRAME_BYTES = 64 * 1024
+    FRAME_SECONDS = 2.0
+
+    def __init__(self, path):
+        self.path = path
+        self.index_path = path + ".idx"
+        self._lock = threading.Lock()
+        self._pending = []
+        self._pending_bytes = 0
+        self._first_ts = 0.0
+        self._last_ts = 0.0
+        self._timer = None
+
+        records = read_index(self.index_path)
+        if records:
+            offset, size, first, count, _, _ = records[-1]
+            self._next_line = first + count
+            self._offset = offset + size
+        else:
+            self._next_line = 0
+            self._offset = 0
+        self._data = open(path, "ab")
+        self._data.truncate(self._offset)
+        self._index = open(self.index_path, "ab")
+        self._index.truncate(len(records) * INDEX_RECORD.size)
+
+    @property
+    def line_count(self):
+        return self._next_line + len(self._pending)
+
+    def write_line(self, line):
+        """Buffer one line; returns its line number (a collapsed progress line keeps the one it replaced)."""
+        now = time.time()
+        with self._lock:
+            if not self._pending:
+                self._first_ts = now
+            self._last_ts = now
+            data = line.encode("utf-8", "replace") + b"\n"
+            if data.endswith(b"\r\n") and self._pending and self._pending[-1].endswith(b"\r\n"):
+                self._pending_bytes -= len(self._pending.pop())
+            self._pending.append(data)
+            self._pending_bytes += len(data)
+            number = self._next_line + len(self._pending) - 1
+            if self._pending_bytes >= self.FRAME_BYTES or now - self._first_ts >= self.FRAME_SECONDS:
+                self._flush_frame()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.FRAME_SECONDS, self._flush_idle)
+                self._timer.daemon = True
+                self._timer.start()
+            return number
+
+    def flush(self):
+        with self._lock:
+            self._flush_frame()
+
+    def close(self):
+        with self._lock:
+            if self._data.closed:
+                return
+            self._flush_frame()
+            self._data.close()
+            self._index.close()
+
+    def _flush_idle(self):
+        with self._lock:
+            self._timer = None
+            if not self._data.closed:
+                self._flush_frame()
+
+    def _flush_frame(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        frame = gzip.compress(b"".join(self._pending), compresslevel=6, mtime=0)
+        self._data.write(frame)
+        self._data.flush()
+        self._index.write(INDEX_RECORD.pack(
+            self._offset, len(frame), self._next_line, len(self._pending),
+            self._first_ts, self._last_ts
+        ))
+        self._index.flush()
+        self._offset += len(frame)
+        self._next_line += len(self._pending)
+        self._pending = []
+        self._pending_bytes = 0
+
+
+def read_index(index_path):
+    """Load the frame index, ignoring a torn trailing record."""
+    try:
+        with open(index_path, "rb") as f:
+            raw = f.read()
+    except OSError:
+        return []
+    usable = len(raw) - len(raw) % INDEX_RECORD.size
+    return [INDEX_RECORD.unpack_from(raw, pos) for pos in range(0, usable, INDEX_RECORD.size)]
+
+
+class JobLogReader:
+    """Random access to a JobLog by line number or timestamp."""
+
+    def __init__(self, path):
+        self.path = path
+        self.reload()
+
+    def reload(self):
+        self.frames = read_index(self.path + ".idx")
+        self._first_lines = [r[2] for r in self.frames]
+        self._last_ts = [r[5] for r in self.frames]
+
+    @property
+    def line_count(self):
+        if not self.frames:
+            return 0
+        _, _, first, count, _, _ = self.frames[-1]
+        return first + count
+
+    def _decode_frame(self, f, record):
+        offset, size, _, _, _, _ = record
+        f.seek(offset)
+        return gzip.decompress(f.read(size)).decode("utf-8", "replace").split("\n")[:-1]
+
+    def read_lines(self, start, stop=None):
+        """Return lines [start, stop) decoding only the frames that cover them."""
+        stop = self.line_count if stop is None else min(stop, self.line_count)
+        if start >= stop:
+            return []
+        out = []
+        i = max(bisect.bisect_right(self._first_lines, start) - 1, 0)
+        with open(self.path, "rb") as f:
+            while i < len(self.frames) and self.frames[i][2] < stop:
+                first = self.frames[i][2]
+                lines = self._decode_frame(f, self.frames[i])
+                out.extend(lines[max(start - first, 0):stop - first])
+                i += 1
+        return out
+
+    def iter_lines(self, start=0):
+        i = max(bisect.bisect_right(self._first_lines, start) - 1, 0)
+        with open(self.path, "rb") as f:
+            for record in self.frames[i:]:
+                lines = self._decode_frame(f, record)
+                yield from lines[max(start - record[2], 0):]
+
+    def line_at_time(self, ts):
+        """First line number of the frame that was being written at ``ts``."""
+        i = bisect.bisect_left(self._last_ts, ts)
+        if i >= len(self.frames):
+            return self.line_count
+        return self.frames[i][2]
+
+    def lines_since(self, ts):
+        return self.read_lines(self.line_at_time(ts))
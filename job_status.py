@@ -0,0 +1,88 @@
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import QFrame, QVBoxLayout, QHBoxLayout, QLabel, QProgressBar
+from progress import format_duration
+
+
+class JobStatusRow(QFrame):
+    def __init__(self, title, parent=None):
+        super().__init__(parent)
+        layout = QHBoxLayout()
+        layout.setContentsMargins(8, 2, 8, 2)
+        self.setLayout(layout)
+        self.title = QLabel(title)
+        self.title.setStyleSheet("color: #9EA7FF; font-weight: 600;")
+        self.title.setMaximumWidth(320)
+        self.bar = QProgressBar()
+        self.bar.setFixedHeight(14)
+        self.bar.setTextVisible(False)
+        self.bar.setStyleSheet("""
+            QProgressBar { background-color: #121212; border: none; border-radius: 4px; }
+            QProgressBar::chunk { background-color: #7B61FF; border-radius: 4px; }
+        """)
+        self.info = QLabel("")
+        self.info.setStyleSheet("color: #A6A6A6; font-family: 'Courier New';")
+        layout.addWidget(self.title)
+        layout.addWidget(self.bar, 1)
+        layout.addWidget(self.info)
+
+    def show_fields(self, f):
+        total = max(f["total"], 1)
+        self.bar.setMaximum(total)
+        self.bar.setValue(min(f["done"], total))
+        pct = 100.0 * f["done"] / total
+        text = (f"{f['done']}/{f['total']} ({pct:.0f}%)  {f['rate']} req/s  "
+                f"elapsed {format_duration(f['elapsed'])}  eta {format_duration(f['eta'])}  "
+                f"errors {f['errors']}")
+        if "matched" in f:
+            text += f"  matched {f['matched']}"
+        self.info.setText(text)
+
+
+class JobStatusPanel(QFrame):
+    """
+    One compact progress row per running job, fed by parsed progress lines
+    and repainted at most ``fps`` times a second whatever the input rate.
+    """
+
+    def __init__(self, fps=10, parent=None):
+        super().__init__(parent)
+        self.setStyleSheet("background-color: #1B1B2B;")
+        self.layout_ = QVBoxLayout()
+        self.layout_.setContentsMargins(0, 2, 0, 2)
+        self.layout_.setSpacing(0)
+        self.setLayout(self.layout_)
+        self.rows = {}
+        self.pending = {}
+        self.timer = QTimer(self)
+        self.timer.setInterval(int(1000 / fps))
+        self.timer.timeout.connect(self._render)
+        self.hide()
+
+    def update_progress(self, key, title, fields):
+        if key not in self.rows:
+            row = JobStatusRow(title)
+            self.rows[key] = row
+            self.layout_.addWidget(row)
+            self.show()
+        self.pending[key] = fields
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def finish(self, key):
+        self.pending.pop(key, None)
+        row = self.rows.pop(key, None)
+        if row is not None:
+            row.setParent(None)
+            row.deleteLater()
+        if not self.rows:
+            self.hide()
+
+    def _render(self):
+        if not self.pending:
+            self.timer.stop()
+            return
+        for key, fields in self.pending.items():
+            row = self.rows.get(key)
+            if row is not None:
+                row.show_fields(fields)
+        self.pending.clear()
@@ -0,0 +1,338 @@
+import argparse
+import os
+import queue
+import signal
+import socket
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+
+from job_log import JobLog, JobLogReader
+from protocol import ProtocolError, recv_frame, send_frame
+from spawn import spawn
+from utils import LineSplitter, app_data_dir
+
+# chunks kept in memory per job; older output is replayed from the job log
+RING_SIZE = 5000
+
+
+def socket_path():
+    return os.path.join(app_data_dir(), "jobd.sock")
+
+
+def connect(path=None, timeout=2.0):
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(path or socket_path())
+    except OSError:
+        sock.close()
+        raise
+    sock.settimeout(None)
+    return sock
+
+
+def is_supported():
+    return hasattr(socket, "AF_UNIX") and os.name == "posix"
+
+
+def daemon_running(path=None):
+    try:
+        connect(path, timeout=0.5).close()
+        return True
+    except OSError:
+        return False
+
+
+def start_daemon(path=None, wait=3.0):
+    """Spawn the daemon in its own session unless one is already listening."""
+    if daemon_running(path):
+        return True
+    args = [sys.executable, os.path.abspath(__file__), "serve"]
+    if path:
+        args += ["--socket", path]
+    subprocess.Popen(args, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                     stderr=subprocess.DEVNULL, start_new_session=True)
+    deadline = time.monotonic() + wait
+    while time.monotonic() < deadline:
+        if daemon_running(path):
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def list_jobs(path=None):
+    sock = connect(path)
+    try:
+        send_frame(sock, {"type": "list"})
+        header, _ = recv_frame(sock)
+        return header.get("jobs", [])
+    finally:
+        sock.close()
+
+
+class Client:
+    """A connected GUI; frames are queued so a slow reader never stalls a job."""
+
+    def __init__(self, server, sock):
+        self.server = server
+        self.sock = sock
+        self.queue = queue.Queue()
+        self.alive = True
+        threading.Thread(target=self._writer, daemon=True).start()
+
+    def send(self, header, payload=b""):
+        if self.alive:
+            self.queue.put((header, payload))
+
+    def close(self):
+        self.alive = False
+        self.queue.put(None)
+
+    def _writer(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+            header, payload = item
+            try:
+                send_frame(self.sock, header, payload)
+            except OSError:
+                self.alive = False
+                return
+
+
+class ManagedJob:
+    """
+    A command owned by the daemon. Every output chunk gets a sequence
+    number equal to its line number in the job log; the newest RING_SIZE
+    chunks stay in memory and anything older is read back from the log.
+    """
+
+    def __init__(self, job_id, command, cwd=None, log_path=None):
+        self.id = job_id
+        self.command = command
+        self.log_path = log_path
+        self.lock = threading.Lock()
+        self.ring = deque(maxlen=RING_SIZE)
+        self.next_seq = 0
+        self.delivered = 0
+        self.subscribers = []
+        self.exit_code = None
+        self.log = JobLog(log_path) if log_path else None
+        self.process = spawn(command, cwd=cwd)
+        threading.Thread(target=self._pump, daemon=True).start()
+
+    @property
+    def running(self):
+        return self.exit_code is None
+
+    def _pump(self):
+        splitter = LineSplitter(keep_ends=True)
+        while True:
+            data = self.process.stdout.read1(65536)
+            if not data:
+                break
+            for chunk in splitter.feed(data):
+                self._append(chunk)
+        for chunk in splitter.finish():
+            self._append(chunk)
+        self.process.stdout.close()
+        code = self.process.wait()
+        with self.lock:
+            self.exit_code = code
+            if self.log is not None:
+                self.log.close()
+            for client in self.subscribers:
+                client.send({"type": "exit", "job": self.id, "code": code})
+            self.subscribers = []
+
+    def _append(self, chunk):
+        with self.lock:
+            seq = self.next_seq
+            if self.log is not None:
+                # a progress line the log collapsed into the previous one keeps its number
+                seq = self.log.write_line(chunk.rstrip('\n'))
+            self.next_seq = seq + 1
+            if self.ring and self.ring[-1][0] == seq:
+                self.ring.pop()
+            self.ring.append((seq, chunk))
+            for client in self.subscribers:
+                client.send({"type": "output", "job": self.id, "seq": seq}, chunk.encode("utf-8"))
+
+    def mark_delivered(self, seq):
+        """A GUI acknowledged every chunk before ``seq``; only acks advance this, not sends."""
+        with self.lock:
+            self.delivered = max(self.delivered, seq)
+
+    def attach(self, client, since=None):
+        """Replay output from ``since`` (default: what no GUI has seen yet), then follow."""
+        with self.lock:
+            since = self.delivered if since is None else max(since, 0)
+            ring_start = self.ring[0][0] if self.ring else self.next_seq
+            if since < ring_start and self.log_path:
+                if self.log is not None:
+                    self.log.flush()
+                lines = JobLogReader(self.log_path).read_lines(since, ring_start)
+                for seq, line in enumerate(lines, start=since):
+                    chunk = line if line.endswith('\r') else line + '\n'
+                    client.send({"type": "output", "job": self.id, "seq": seq}, chunk.encode("utf-8"))
+            for seq, chunk in self.ring:
+                if seq >= since:
+                    client.send({"type": "output", "job": self.id, "seq": seq}, chunk.encode("utf-8"))
+            if self.exit_code is not None:
+                client.send({"type": "exit", "job": self.id, "code": self.exit_code})
+            else:
+                self.subscribers.append(client)
+
+    def detach(self, client):
+        with self.lock:
+            if client in self.subscribers:
+                self.subscribers.remove(client)
+
+    def interrupt(self):
+        try:
+            os.killpg(os.getpgid(self.process.pid), signal.SIGINT)
+        except OSError:
+            pass
+
+    def describe(self):
+        with self.lock:
+            return {"id": self.id, "command": self.command, "log": self.log_path,
+                    "running": self.running, "pending": self.next_seq - self.delivered}
+
+
+class JobDaemonHandler(socketserver.BaseRequestHandler):
+    """
+    Requests, one connection each:
+      -> list                         <- jobs {jobs}
+      -> spawn {command, cwd, log}    <- spawned {job}, then output/exit as for attach
+      -> attach {job, since?}         <- output {job, seq} + chunk..., exit {code}
+      -> interrupt {job}              (also accepted on an attached connection)
+      -> ack {job, seq}               output before seq reached the GUI (attached connection)
+      -> shutdown
+    """
+
+    def handle(self):
+        server = self.server
+        client = Client(server, self.request)
+        attached = None
+        try:
+            while True:
+                header, _ = recv_frame(self.request)
+                kind = header.get("type")
+                if kind == "list":
+                    server.prune()
+                    client.send({"type": "jobs", "jobs": [j.describe() for j in server.jobs.values()]})
+                elif kind == "spawn":
+                    try:
+                        attached = server.spawn(header["command"], header.get("cwd"), header.get("log"))
+                    except (KeyError, OSError) as e:
+                        client.send({"type": "error", "message": str(e)})
+                        continue
+                    client.send({"type": "spawned", "job": attached.id})
+                    attached.attach(client, since=0)
+                elif kind == "attach":
+                    attached = server.jobs.get(header.get("job"))
+                    if attached is None:
+                        client.send({"type": "error", "message": f"no such job: {header.get('job')}"})
+                        continue
+                    attached.attach(client, header.get("since"))
+                elif kind == "ack":
+                    job = server.jobs.get(header.get("job")) or attached
+                    if job is not None and isinstance(header.get("seq"), int):
+                        job.mark_delivered(header["seq"])
+                elif kind == "interrupt":
+                    job = server.jobs.get(header.get("job")) or attached
+                    if job is not None:
+                        job.interrupt()
+                elif kind == "shutdown":
+                    threading.Thread(target=server.shutdown, daemon=True).start()
+                    return
+        except (ConnectionError, ProtocolError, OSError):
+            pass
+        finally:
+            if attached is not None:
+                attached.detach(client)
+            client.close()
+
+
+class JobDaemon(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path):
+        if os.path.exists(path):
+            if daemon_running(path):
+                raise OSError(f"a job daemon is already listening on {path}")
+            os.unlink(path)
+        super().__init__(path, JobDaemonHandler)
+        # whoever can connect can run commands as us
+        os.chmod(path, 0o600)
+        self.path = path
+        self.jobs = {}
+        self._next_id = 1
+        self._lock = threading.Lock()
+
+    def spawn(self, command, cwd=None, log_path=None):
+        with self._lock:
+            job_id = self._next_id
+            self._next_id += 1
+        job = ManagedJob(job_id, command, cwd, log_path)
+        self.jobs[job_id] = job
+        return job
+
+    def prune(self):
+        """Forget finished jobs whose output has been fully delivered."""
+        for job_id, job in list(self.jobs.items()):
+            if not job.running and job.delivered >= job.next_seq and not job.subscribers:
+                del self.jobs[job_id]
+
+    def server_close(self):
+        super().server_close()
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Job daemon that keeps scans running across GUI restarts")
+    sub = parser.add_subparsers(dest="action", required=True)
+    serve = sub.add_parser("serve", help="run the daemon in the foreground")
+    serve.add_argument("--socket", default=None)
+    listing = sub.add_parser("list", help="list the daemon's jobs")
+    listing.add_argument("--socket", default=None)
+    stop = sub.add_parser("stop", help="stop the daemon (running jobs are left running)")
+    stop.add_argument("--socket", default=None)
+    args = parser.parse_args(argv)
+    path = args.socket or socket_path()
+
+    if args.action == "serve":
+        server = JobDaemon(path)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+        return 0
+    try:
+        if args.action == "list":
+            for job in list_jobs(path):
+                state = "running" if job["running"] else "done"
+                print(f"{job['id']}\t{state}\t{job['pending']} unseen\t{job['command']}")
+        else:
+            sock = connect(path)
+            send_frame(sock, {"type": "shutdown"})
+            sock.close()
+    except OSError as e:
+        print(f"[Error] job daemon not reachable: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,12 @@
 import sys
+from spawn import start_fork_server
 from setup_dialog import InitialSetupDialog
 from terminal_app import ModernDarkTerminalApp
 from PyQt6.QtWidgets import QApplication
 
 if __name__ == "__main__":
+    # before the window and its widgets exist, while this process is small
+    start_fork_server()
     app = QApplication(sys.argv)
     window = ModernDarkTerminalApp()
     window.show()
@@ -0,0 +1,176 @@
+import os
+import re
+import sqlite3
+from contextlib import contextmanager
+
+from utils import app_data_dir
+
+PROTOCOL_KEYS = (
+    "http", "requests", "dns", "file", "network", "tcp", "headless", "ssl",
+    "websocket", "whois", "code", "javascript", "flow", "workflows"
+)
+
+_ID_RE = re.compile(r'^id:\s*["\']?([^"\'\s]+)', re.M)
+_SEVERITY_RE = re.compile(r'^\s+severity:\s*["\']?(\w+)', re.M)
+_TAGS_RE = re.compile(r'^\s+tags:\s*(.+)$', re.M)
+_TECH_RE = re.compile(r'^\s+(?:product|vendor):\s*["\']?([^"\'\s#]+)', re.M)
+_PROTOCOL_RE = re.compile(r'^(' + '|'.join(PROTOCOL_KEYS) + r'):', re.M)
+
+
+def parse_template(text: str) -> dict:
+    """
+    Pull id, tags, severity, protocol and tech out of a nuclei template with
+    a few anchored regexes; much faster than a full YAML load and good
+    enough for the flat 'info' block templates use.
+    """
+    m = _ID_RE.search(text)
+    if not m:
+        return None
+    tags_m = _TAGS_RE.search(text)
+    tags = []
+    if tags_m:
+        tags = [t.strip().strip('"\'[] ').lower() for t in tags_m.group(1).split(',')]
+        tags = [t for t in tags if t]
+    sev_m = _SEVERITY_RE.search(text)
+    proto_m = _PROTOCOL_RE.search(text)
+    protocol = proto_m.group(1) if proto_m else ""
+    if protocol == "requests":
+        protocol = "http"
+    tech = sorted({t.lower() for t in _TECH_RE.findall(text)})
+    return {
+        "id": m.group(1),
+        "tags": tags,
+        "severity": sev_m.group(1).lower() if sev_m else "",
+        "protocol": protocol,
+        "tech": tech,
+    }
+
+
+def walk_templates(root):
+    stack = [root]
+    while stack:
+        d = stack.pop()
+        try:
+            entries = os.scandir(d)
+        except OSError:
+            continue
+        with entries:
+            for e in entries:
+                if e.name.startswith('.'):
+                    continue
+                if e.is_dir(follow_symlinks=False):
+                    stack.append(e.path)
+                elif e.name.endswith((".yaml", ".yml")):
+                    try:
+                        yield e.path, e.stat().st_mtime_ns
+                    except OSError:
+                        continue
+
+
+class TemplateIndex:
+    """
+    Persistent index of a nuclei templates tree, kept in SQLite and
+    refreshed incrementally: only files whose mtime changed are re-read.
+    """
+
+    def __init__(self, root, db_path=None):
+        self.root = os.path.abspath(root)
+        self.db_path = db_path or os.path.join(app_data_dir(), "nuclei_index.sqlite")
+        with self._connect() as db:
+            db.execute("""
+                CREATE TABLE IF NOT EXISTS templates (
+                    path TEXT PRIMARY KEY,
+                    root TEXT NOT NULL,
+                    mtime INTEGER NOT NULL,
+                    id TEXT,
+                    tags TEXT,
+                    severity TEXT,
+                    protocol TEXT,
+                    tech TEXT
+                )""")
+            db.execute("CREATE INDEX IF NOT EXISTS templates_root ON templates(root)")
+
+    @contextmanager
+    def _connect(self):
+        db = sqlite3.connect(self.db_path)
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    def update(self):
+        """Sync the index with the tree; returns (indexed, changed, removed)."""
+        with self._connect() as db:
+            known = dict(db.execute("SELECT path, mtime FROM templates WHERE root = ?", (self.root,)))
+            seen = set()
+            changed = []
+            for path, mtime in walk_templates(self.root):
+                seen.add(path)
+                if known.get(path) == mtime:
+                    continue
+                try:
+                    with open(path, encoding="utf-8", errors="replace") as f:
+                        info = parse_template(f.read())
+                except OSError:
+                    continue
+                if info is None:
+                    info = {"id": None, "tags": [], "severity": "", "protocol": "", "tech": []}
+                changed.append((
+                    path, self.root, mtime, info["id"], "," + ",".join(info["tags"]) + ",",
+                    info["severity"], info["protocol"], "," + ",".join(info["tech"]) + ","
+                ))
+            db.executemany("INSERT OR REPLACE INTO templates VALUES (?, ?, ?, ?, ?, ?, ?, ?)", changed)
+            removed = [(p,) for p in known if p not in seen]
+            db.executemany("DELETE FROM templates WHERE path = ?", removed)
+        return len(seen), len(changed), len(removed)
+
+    def select(self, tags=None, severity=None, protocol=None, tech=None, path_part=None, exclude_tags=None):
+        """
+        Return template paths matching every given filter. ``tags``,
+        ``severity``, ``tech`` and ``exclude_tags`` are lists (any-of);
+        ``path_part`` matches a directory name anywhere under the root,
+        e.g. 'exposures' finds both exposures/ and http/exposures/.
+        """
+        sql = "SELECT path FROM templates WHERE root = ? AND id IS NOT NULL"
+        params = [self.root]
+        for column, values in (("tags", tags), ("tech", tech)):
+            if values:
+                sql += " AND (" + " OR ".join(f"{column} LIKE ?" for _ in values) + ")"
+                params += [f"%,{v.lower()},%" for v in values]
+        if exclude_tags:
+            for v in exclude_tags:
+                sql += " AND tags NOT LIKE ?"
+                params.append(f"%,{v.lower()},%")
+        if severity:
+            sql += " AND severity IN (" + ",".join("?" for _ in severity) + ")"
+            params += [s.lower() for s in severity]
+        if protocol:
+            sql += " AND protocol = ?"
+            params.append(protocol)
+        if path_part:
+            sql += " AND (path LIKE ? OR path LIKE ?)"
+            params += [
+                f"{self.root}{os.sep}{path_part}{os.sep}%",
+                f"{self.root}{os.sep}%{os.sep}{path_part}{os.sep}%",
+            ]
+        sql += " ORDER BY path"
+        with self._connect() as db:
+            return [row[0] for row in db.execute(sql, params)]
+
+    def ids(self, paths):
+        with self._connect() as db:
+            out = []
+            for path in paths:
+                row = db.execute("SELECT id FROM templates WHERE path = ?", (path,)).fetchone()
+                if row and row[0]:
+                    out.append(row[0])
+            return out
+
+
+def write_template_list(paths, list_path):
+    """Write paths one per line, the file form nuclei accepts for -t."""
+    with open(list_path, "w") as f:
+        for p in paths:
+            f.write(p + "\n")
+    return list_path
@@ -0,0 +1,160 @@
+import contextlib
+import os
+import re
+import shlex
+import tempfile
+import uuid
+
+from nuclei_index import walk_templates
+
+_FINDING_RE = re.compile(r'^\[([^\]]+)\]\s+\[[^\]]*\]\s+\[[^\]]*\]\s+(\S+)')
+_ANSI_RE = re.compile(r'\x1b\[[0-9;]*[A-Za-z]')
+
+
+def _option_value(argv, *names):
+    for i, a in enumerate(argv[:-1]):
+        if a in names:
+            return argv[i + 1]
+    return None
+
+
+def _without_options(argv, *names):
+    out = []
+    skip = False
+    for a in argv:
+        if skip:
+            skip = False
+            continue
+        if a in names:
+            skip = True
+            continue
+        out.append(a)
+    return out
+
+
+def expand_templates(arg):
+    """
+    Resolve a nuclei -t value into template files: a list file, a
+    directory (walked for YAML) or a comma-separated mix of both.
+    """
+    paths = []
+    for part in arg.split(','):
+        part = part.strip()
+        if os.path.isdir(part):
+            paths.extend(sorted(p for p, _ in walk_templates(part)))
+        elif os.path.isfile(part) and not part.endswith((".yaml", ".yml")):
+            with open(part) as f:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        paths.extend(expand_templates(line))
+        elif part:
+            paths.append(part)
+    return paths
+
+
+def partition(items, n):
+    """Split items into at most n non-empty, near-equal round-robin shards."""
+    n = max(1, min(n, len(items)))
+    return [items[i::n] for i in range(n)]
+
+
+def plan_shards(command, n, shard_dir=None, by="templates", scope=None):
+    """
+    Turn one nuclei command line into up to ``n`` shard commands.
+
+    ``by="templates"`` splits the -t set; ``by="targets"`` splits the -l
+    list. Shard lists and outputs go to ``shard_dir`` (default: a fresh
+    directory next to the -o file, so concurrent runs never share one). With a ``scope`` (scope.Scope) the -l list is cut down
+    to in-scope targets first. Returns (commands, shard_inputs,
+    shard_outputs, merged_output); shard_inputs are the per-shard list files.
+    """
+    argv = shlex.split(command)
+    if not argv or os.path.basename(argv[0]) != "nuclei":
+        raise ValueError("shard only supports nuclei commands")
+    out = _option_value(argv, "-o", "-output")
+    if not out:
+        raise ValueError("nuclei command needs -o to merge shard results")
+    if shard_dir:
+        os.makedirs(shard_dir, exist_ok=True)
+    else:
+        shard_dir = tempfile.mkdtemp(dir=os.path.dirname(out) or ".", prefix=os.path.basename(out) + ".shards.")
+    base = _without_options(argv, "-o", "-output")
+
+    targets_file = _option_value(argv, "-l", "-list")
+    if targets_file and scope is not None:
+        scoped = os.path.join(shard_dir, "targets.inscope")
+        with open(targets_file, errors="replace") as src, open(scoped, "w") as dst:
+            dst.writelines(line if line.endswith("\n") else line + "\n" for line in scope.filter(src))
+        targets_file = scoped
+        base = _without_options(base, "-l", "-list") + ["-l", scoped]
+
+    if by == "targets":
+        if not targets_file:
+            raise ValueError("sharding by targets needs -l <file>")
+        with open(targets_file) as f:
+            targets = [line.strip() for line in f if line.strip()]
+        shards = partition(targets, n)
+        base = _without_options(base, "-l", "-list")
+        flag = "-l"
+    else:
+        templates = _option_value(argv, "-t", "-templates")
+        if not templates:
+            raise ValueError("sharding by templates needs -t")
+        shards = partition(expand_templates(templates), n)
+        base = _without_options(base, "-t", "-templates")
+        flag = "-t"
+
+    commands, inputs, outputs = [], [], []
+    for i, shard in enumerate(shards, start=1):
+        list_path = os.path.join(shard_dir, f"shard_{i}.{by}")
+        with open(list_path, "w") as f:
+            f.write("\n".join(shard) + "\n")
+        inputs.append(list_path)
+        shard_out = os.path.join(shard_dir, f"shard_{i}.txt")
+        outputs.append(shard_out)
+        commands.append(shlex.join(base + [flag, list_path, "-o", shard_out]))
+    return commands, inputs, outputs, out
+
+
+def finding_key(line):
+    """(template-id, matched-at) for a nuclei text finding, else the line."""
+    line = _ANSI_RE.sub('', line).strip()
+    m = _FINDING_RE.match(line)
+    if not m:
+        return line
+    return (m.group(1).split(':', 1)[0], m.group(2))
+
+
+def merge_findings(shard_outputs, merged_output):
+    """
+    Write the union of shard findings to ``merged_output``, keeping the
+    first line per key. Returns (written, duplicates). The merge goes to a
+    private temp file renamed over ``merged_output``, so two sharded runs
+    on the same domain never interleave their writes.
+    """
+    seen = set()
+    written = duplicates = 0
+    tmp = f"{merged_output}.{uuid.uuid4().hex[:12]}.tmp"
+    try:
+        with open(tmp, "x") as out:
+            for path in shard_outputs:
+                if not os.path.exists(path):
+                    continue
+                with open(path, errors="replace") as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        key = finding_key(line)
+                        if key in seen:
+                            duplicates += 1
+                            continue
+                        seen.add(key)
+                        out.write(line if line.endswith("\n") else line + "\n")
+                        written += 1
+        os.replace(tmp, merged_output)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp)
+        raise
+    return written, duplicates
@@ -0,0 +1,71 @@
+import threading
+from collections import deque
+
+
+class OutputQueue:
+    """
+    Bounded hand-off of output chunks from a job to the GUI.
+
+    Chunks keep their terminator: 'text\\n' is a line, 'text\\r' is a
+    progress frame that the next frame overwrites anyway. While the
+    consumer lags, consecutive frames collapse into the newest one, and
+    once ``max_bytes`` are queued the oldest chunks are dropped; they are
+    already in the job log, so the drain reports how many were skipped
+    and where to find them. Chunks pushed with ``droppable=False`` (output
+    with no log behind it) are never dropped or collapsed.
+    """
+
+    def __init__(self, max_bytes=1024 * 1024, log_path=None):
+        self.max_bytes = max_bytes
+        self.log_path = log_path
+        self._lock = threading.Lock()
+        self._chunks = deque()
+        self._bytes = 0
+        self._droppable_bytes = 0
+        self._dropped = 0
+        self.collapsed = 0
+
+    def push(self, chunk, droppable=True):
+        """Queue a chunk; returns True when the consumer needs waking up."""
+        with self._lock:
+            wake = not self._chunks and not self._dropped
+            if droppable and chunk.endswith('\r') and self._chunks:
+                last, last_droppable = self._chunks[-1]
+                if last_droppable and last.endswith('\r'):
+                    self._chunks.pop()
+                    self._bytes -= len(last)
+                    self._droppable_bytes -= len(last)
+                    self.collapsed += 1
+            self._chunks.append((chunk, droppable))
+            self._bytes += len(chunk)
+            if droppable:
+                self._droppable_bytes += len(chunk)
+            pinned = []
+            while self._droppable_bytes > self.max_bytes and len(self._chunks) > 1:
+                item = self._chunks.popleft()
+                if not item[1]:
+                    pinned.append(item)
+                    continue
+                self._bytes -= len(item[0])
+                self._droppable_bytes -= len(item[0])
+                self._dropped += 1
+            self._chunks.extendleft(reversed(pinned))
+            return wake
+
+    def drain(self):
+        """Take everything queued, prefixed by a notice if chunks were dropped."""
+        with self._lock:
+            chunks = [chunk for chunk, _ in self._chunks]
+            self._chunks.clear()
+            self._bytes = 0
+            self._droppable_bytes = 0
+            dropped, self._dropped = self._dropped, 0
+        if dropped:
+            where = f", see job log {self.log_path}" if self.log_path else ""
+            chunks.insert(0, f"[... {dropped} lines skipped while the display caught up{where}]\n")
+        return chunks
+
+    @property
+    def lag_bytes(self):
+        with self._lock:
+            return self._bytes
@@ -0,0 +1,161 @@
+import tempfile
+from array import array
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex
+from PyQt6.QtGui import QFont
+from PyQt6.QtWidgets import QListView, QAbstractItemView
+from utils import output_ops
+
+
+class LineStore:
+    """
+    Output lines kept in a spill file, addressed through an array of offsets.
+
+    Like the QTextEdit document, there is always a current (last) line:
+    appending fills it and opens a new empty one, '\\r' and erase-line
+    rewrite it. Only that line stays in memory; every earlier line is
+    immutable once committed, so appending is O(1) and memory is a few
+    bytes per line regardless of how much text was printed.
+    """
+
+    CACHE_LINES = 1024
+
+    def __init__(self):
+        self._file = None
+        self.clear()
+
+    def __len__(self):
+        return len(self._offsets) + 1
+
+    def append(self, s):
+        data = s.encode("utf-8", "replace")
+        self._file.seek(self._end)
+        self._file.write(data)
+        self._offsets.append(self._end)
+        self._end += len(data)
+        self._tail = ""
+
+    def replace_last(self, s):
+        self._tail = s
+
+    def clear_last(self):
+        self._tail = ""
+
+    def line(self, i):
+        committed = len(self._offsets)
+        if i == committed:
+            return self._tail
+        if i < 0 or i > committed:
+            return None
+        cached = self._cache.get(i)
+        if cached is not None:
+            return cached
+        start = self._offsets[i]
+        stop = self._offsets[i + 1] if i + 1 < committed else self._end
+        self._file.seek(start)
+        text = self._file.read(stop - start).decode("utf-8", "replace")
+        if len(self._cache) >= self.CACHE_LINES:
+            self._cache.clear()
+        self._cache[i] = text
+        return text
+
+    def clear(self):
+        if self._file is not None:
+            self._file.close()
+        self._file = tempfile.TemporaryFile()
+        self._offsets = array('Q')
+        self._end = 0
+        self._tail = ""
+        self._cache = {}
+
+
+class OutputModel(QAbstractListModel):
+    def __init__(self, store, parent=None):
+        super().__init__(parent)
+        self.store = store
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.store)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and index.isValid():
+            return self.store.line(index.row())
+        return None
+
+    def _last_changed(self):
+        idx = self.index(len(self.store) - 1)
+        self.dataChanged.emit(idx, idx)
+
+    def append(self, s):
+        # the current row takes ``s`` and a new empty current row opens
+        row = len(self.store)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.store.append(s)
+        self.endInsertRows()
+        idx = self.index(row - 1)
+        self.dataChanged.emit(idx, idx)
+
+    def replace_last(self, s):
+        self.store.replace_last(s)
+        self._last_changed()
+
+    def clear_last(self):
+        self.store.clear_last()
+        self._last_changed()
+
+    def clear(self):
+        self.beginResetModel()
+        self.store.clear()
+        self.endResetModel()
+
+
+class OutputView(QListView):
+    """
+    Read-only output pane that lays out and paints only the visible rows.
+    Accepts the same raw chunks as ModernDarkTerminalApp.handle_output.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.store = LineStore()
+        self.output_model = OutputModel(self.store, self)
+        self.setModel(self.output_model)
+        self.setUniformItemSizes(True)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        font = QFont("Courier New")
+        font.setStyleHint(QFont.StyleHint.Monospace)
+        font.setPixelSize(14)
+        self.setFont(font)
+        self.setStyleSheet("""
+            QListView {
+                background-color: #121212;
+                color: #00FF00;
+                border: none;
+            }
+        """)
+        self._last_was_output_line = False
+
+    def handle_output(self, raw_text):
+        if raw_text is None:
+            return
+        bar = self.verticalScrollBar()
+        follow = bar.value() >= bar.maximum()
+        for op, s in output_ops(raw_text, self._last_was_output_line):
+            if op == 'append':
+                self.output_model.append(s)
+                self._last_was_output_line = True
+            elif op == 'replace':
+                self.output_model.replace_last(s)
+                self._last_was_output_line = True
+            else:
+                self.output_model.clear_last()
+                self._last_was_output_line = False
+        if follow:
+            self.scrollToBottom()
+
+    def clear(self):
+        self.output_model.clear()
+        self._last_was_output_line = False
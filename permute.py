@@ -0,0 +1,170 @@
+import argparse
+import re
+import sys
+
+from targets import StreamDeduper
+
+DEFAULT_AFFIXES = (
+    "dev", "stg", "staging", "test", "qa", "uat", "prod", "int", "internal",
+    "admin", "api", "old", "new", "beta", "v1", "v2",
+)
+DEFAULT_SEPARATORS = ("", "-")
+# names the dedupe filter holds per generation; fixed so memory does not grow with the plan
+DEDUPE_CAPACITY = 4_000_000
+_LABEL_RE = re.compile(r'^[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?$')
+
+
+class LineSource:
+    """
+    Re-iterable view of a word file: every pass re-reads the file, so
+    nested loops over it cost I/O rather than memory.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._count = None
+
+    def __iter__(self):
+        with open(self.path, errors="replace") as f:
+            for line in f:
+                word = line.strip().lower()
+                if word and not word.startswith('#'):
+                    yield word
+
+    def __len__(self):
+        if self._count is None:
+            self._count = sum(1 for _ in self)
+        return self._count
+
+
+class KnownNames:
+    """Known subdomains from a file, re-iterable, relative to ``domain`` (apex and strangers skipped)."""
+
+    def __init__(self, path, domain):
+        self.source = LineSource(path)
+        self.suffix = "." + domain.lower()
+
+    def __iter__(self):
+        for name in self.source:
+            name = name.rstrip('.')
+            if name.endswith(self.suffix):
+                yield name[:-len(self.suffix)]
+
+
+def _valid(name):
+    return all(_LABEL_RE.match(label) for label in name.split('.'))
+
+
+class Permutations:
+    """
+    Lazily generated subdomain candidates:
+      - every word
+      - word x affix, both orders, with each separator (dev-api, api-dev, apidev)
+      - word + number, with each separator (api1, api-1)
+      - known-subdomain mutations: the known name's first label joined with
+        each word, and each word as a new level above it (dev.api)
+    Candidates are de-duplicated on the fly; ``size()`` is the upper bound
+    before de-duplication, computable without generating anything.
+    """
+
+    def __init__(self, words, known=(), affixes=DEFAULT_AFFIXES, numbers=3,
+                 separators=DEFAULT_SEPARATORS, domain=None, extensions=None):
+        self.words = words
+        self.known = known
+        self.affixes = tuple(affixes)
+        self.numbers = numbers
+        self.separators = tuple(separators)
+        self.domain = domain
+        self.extensions = tuple(extensions) if extensions else None
+
+    def _known_count(self):
+        return sum(1 for _ in self.known) if self.known else 0
+
+    def size(self):
+        n_words = len(self.words)
+        if self.extensions is not None:
+            return n_words * (1 + len(self.extensions))
+        n_seps = len(self.separators)
+        total = n_words
+        total += 2 * n_words * len(self.affixes) * n_seps
+        total += n_words * self.numbers * n_seps
+        total += self._known_count() * n_words * (2 * n_seps + 1)
+        return total
+
+    def _candidates(self):
+        if self.extensions is not None:
+            for word in self.words:
+                yield word
+                for ext in self.extensions:
+                    yield word + ext
+            return
+        yield from self.words
+        for word in self.words:
+            for affix in self.affixes:
+                for sep in self.separators:
+                    yield word + sep + affix
+                    yield affix + sep + word
+            for n in range(1, self.numbers + 1):
+                for sep in self.separators:
+                    yield f"{word}{sep}{n}"
+        for known in self.known:
+            head, dot, rest = known.partition('.')
+            for word in self.words:
+                for sep in self.separators:
+                    yield word + sep + head + dot + rest
+                    yield head + sep + word + dot + rest
+                yield f"{word}.{known}"
+
+    def __iter__(self):
+        dedupe = StreamDeduper(capacity=DEDUPE_CAPACITY)
+        suffix = "." + self.domain if self.domain else ""
+        check = self.extensions is None
+        for candidate in self._candidates():
+            if check and not _valid(candidate):
+                continue
+            if dedupe.is_new(candidate):
+                yield candidate + suffix
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Stream subdomain (or ffuf word) permutations to stdout, e.g. "
+                    "permute.py -d example.com words.txt | dnsx -silent")
+    parser.add_argument("wordlist", help="base words, one per line")
+    parser.add_argument("-d", "--domain", help="append this domain to every candidate")
+    parser.add_argument("--known", help="known subdomains to mutate (e.g. a subdomain set's names.txt); needs -d")
+    parser.add_argument("--affixes", default=",".join(DEFAULT_AFFIXES), help="comma-separated prefixes/suffixes")
+    parser.add_argument("--numbers", type=int, default=3, help="append 1..N to each word (default 3)")
+    parser.add_argument("--ext", help="ffuf mode: each word plus word+ext for these comma-separated extensions")
+    parser.add_argument("--count", action="store_true", help="only print the planned candidate count")
+    args = parser.parse_args(argv)
+
+    known = ()
+    if args.known:
+        if not args.domain:
+            parser.error("--known needs --domain")
+        known = KnownNames(args.known, args.domain)
+    perms = Permutations(
+        LineSource(args.wordlist), known,
+        affixes=[a for a in args.affixes.split(",") if a], numbers=args.numbers,
+        domain=args.domain, extensions=args.ext.split(",") if args.ext else None,
+    )
+    planned = perms.size()
+    if args.count:
+        print(planned)
+        return 0
+    print(f"[permute] up to {planned} candidates", file=sys.stderr, flush=True)
+    written = 0
+    try:
+        for candidate in perms:
+            sys.stdout.write(candidate + "\n")
+            written += 1
+        sys.stdout.flush()
+    except BrokenPipeError:
+        return 0
+    print(f"[permute] {written} unique candidates", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,574 @@
+import glob
+import os
+import re
+import sys
+
+import batch
+from nuclei_index import write_template_list
+from tool_versions import supports
+from utils import app_data_dir
+
+# -l/-list FILE as httpx, dnsx and nuclei take target lists
+_LIST_OPTION_RE = re.compile(r"""(\s-(?:l|list)\s+)("[^"]+"|'[^']+'|[^\s;&|]+)""")
+
+
+class PresetCommands:
+    """
+    Builds the shell command behind every sidebar preset. Kept free of Qt
+    so the commands can also be produced headlessly (see bench.py); it
+    only needs domain, output_dir, output_filename, wordlist_path,
+    nuclei_templates_path, delta_mode, nuclei_shards, template_index,
+    template_index_ready, tool_info and scope_path on the instance.
+    """
+
+    def tool_supports(self, tool, flag):
+        """Whether the installed tool takes ``flag``; True until the startup probe says otherwise."""
+        return supports(self.tool_info, tool, flag)
+
+    def script_cmd(self, script, *args):
+        """Shell snippet running one of this repo's helper scripts."""
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), script)
+        return ' '.join([f'"{sys.executable}"', f'"{path}"'] + [f'"{a}"' if ' ' in a else a for a in args])
+
+    def target_list_cmd(self, list_path, stage=None):
+        """
+        Command streaming ``list_path`` as normalized, de-duplicated targets,
+        to be piped into a tool reading targets from stdin. In delta mode,
+        targets ``stage`` already handled are filtered out.
+        """
+        cmd = self.script_cmd("targets.py", "normalize", "--strip-scheme", list_path) + self.scope_pipe()
+        if self.delta_mode and stage:
+            cmd += f" | {self.delta_filter_cmd(stage)}"
+        return cmd
+
+    def scope_filter_cmd(self, *inputs):
+        return self.script_cmd("scope.py", "filter", self.scope_path, *inputs)
+
+    def scope_pipe(self):
+        """' | scope filter' to put between two stages when a scope file is set, else ''."""
+        return f" | {self.scope_filter_cmd()}" if self.scope_path else ""
+
+    def apply_scope_lists(self, command):
+        """
+        With a scope file set, a command reading targets from ``-l``/``-list
+        FILE`` gets a copy of FILE holding only the in-scope lines.
+        """
+        if not self.scope_path:
+            return command
+        filters = []
+
+        def scoped(m):
+            path = m.group(2).strip('\'"')
+            out = os.path.join(self.output_dir, os.path.basename(path) + ".inscope")
+            filters.append(f'{self.scope_filter_cmd(path)} -o "{out}"')
+            return f'{m.group(1)}"{out}"'
+
+        command = _LIST_OPTION_RE.sub(scoped, command)
+        if not filters:
+            return command
+        return " && ".join(filters) + f" && {command}"
+
+    def delta_db_path(self):
+        domain = re.sub(r'^https?://', '', self.domain.strip()).rstrip('/')
+        return os.path.join(self.output_dir, f"delta_{domain}.sqlite")
+
+    def delta_filter_cmd(self, stage, *inputs, fingerprint=False, urls=False):
+        args = ["filter", self.delta_db_path(), stage]
+        if fingerprint:
+            args.append("--fingerprint")
+        if urls:
+            args.append("--urls")
+        return self.script_cmd("delta.py", *args, *inputs)
+
+    def with_delta_commit(self, cmd, stage):
+        """
+        In delta mode, mark what ``stage``'s filter let through as seen once
+        ``cmd`` exits 0; after a failed or interrupted run it comes again.
+        """
+        if not self.delta_mode:
+            return cmd
+        return f"{cmd} && {self.script_cmd('delta.py', 'commit', self.delta_db_path(), stage)}"
+
+    def apply_delta_dnsx(self, cmd, domain, stage):
+        """
+        In delta mode resolve only subdomains the ``stage`` preset has not
+        seen yet; a batch passes its options' stages comma-separated.
+        """
+        if not self.delta_mode:
+            return cmd
+        export = self.script_cmd("subdomain_set.py", "export", self.subdomain_set_dir(domain))
+        cmd = cmd.replace(f"dnsx -d {domain}", f"{export}{self.scope_pipe()} | {self.delta_filter_cmd(stage)} | dnsx", 1)
+        return self.with_delta_commit(cmd, stage)
+
+    def nuclei_delta_source(self, domain):
+        """
+        Newest httpx URL list for ``domain``, the one input of nuclei's delta:
+        a single file keeps a host probed by several presets from being fed
+        twice or having its fingerprint flip between their output formats.
+        """
+        sources = [path for path in glob.glob(os.path.join(self.output_dir, f"httpx_*{domain}*.txt"))
+                   if not os.path.basename(path).startswith(("httpx_headers_", "httpx_methods_"))]
+        return max(sources, key=os.path.getmtime) if sources else None
+
+    def apply_delta_nuclei(self, cmd, domain, stage):
+        """
+        In delta mode feed nuclei only live hosts that are new to the
+        ``stage`` preset or whose httpx fingerprint (status, title, tech...)
+        changed.
+        """
+        if not self.delta_mode:
+            return cmd
+        source = self.nuclei_delta_source(domain)
+        if source is None:
+            return cmd
+        if self.scope_path:
+            source = f"{self.scope_filter_cmd(source)} | {self.delta_filter_cmd(stage, '-', fingerprint=True, urls=True)}"
+        else:
+            source = self.delta_filter_cmd(stage, source, fingerprint=True, urls=True)
+        cmd = f"{source} | " + cmd.replace(f'-u "https://{domain}" ', '', 1)
+        return self.with_delta_commit(cmd, stage)
+
+    def subdomain_set_dir(self, domain):
+        return os.path.join(self.output_dir, f"subdomains_{domain}")
+
+    def subdomain_merge_cmd(self, domain, out):
+        """Merge a subfinder/dnsx result file into the per-domain subdomain set."""
+        source = os.path.splitext(os.path.basename(out))[0].replace(f"_{domain}", "")
+        return self.script_cmd("subdomain_set.py", "add", self.subdomain_set_dir(domain), source, out)
+
+    def ranked_resolvers_path(self):
+        return os.path.join(app_data_dir(), "resolvers_ranked.txt")
+
+    def rank_resolvers_cmd(self, source="resolvers.txt", keep=200):
+        """
+        Command probing ``source`` (relative to the output dir) and writing
+        the healthy resolvers, fastest first, to ranked_resolvers_path().
+        Results are cached for a day, so repeat runs only probe stale entries.
+        """
+        return self.script_cmd("resolvers.py", source, "-o", self.ranked_resolvers_path(), "--keep", str(keep))
+
+    def permutation_cmd(self, domain):
+        """
+        Command streaming subdomain permutations of the wordlist (and of the
+        subdomains already known for ``domain``) to stdout, for dnsx to read.
+        """
+        args = ["-d", domain]
+        known = os.path.join(self.subdomain_set_dir(domain), "names.txt")
+        if os.path.exists(known):
+            args += ["--known", known]
+        return self.script_cmd("permute.py", *args, self.wordlist_path)
+
+    def ffuf_cluster_cmd(self, output_path):
+        """Post-step for big ffuf runs: drop soft-404 clusters and print rerun filter flags."""
+        return self.script_cmd("ffuf_cluster.py", output_path)
+
+    def report_cmd(self):
+        """Correlated HTML/JSON report over this domain's nuclei, httpx and ffuf outputs."""
+        domain = re.sub(r'^https?://', '', self.domain.strip()).rstrip('/')
+        return self.script_cmd("report.py", "-d", domain, "--dir", self.output_dir)
+
+    def nuclei_templates_arg(self, list_path, fallback, **query):
+        """
+        Return a -t value for nuclei: a file listing exactly the templates
+        matching ``query`` when the index is ready, else ``fallback``.
+        """
+        if self.template_index_ready:
+            try:
+                paths = self.template_index.select(**query)
+            except Exception:
+                paths = []
+            if paths:
+                return write_template_list(paths, list_path)
+        return fallback
+
+    def preset_command(self, tool_name, option_index):
+        """Shell command for sidebar preset ``option_index`` of ``tool_name``."""
+        if tool_name.lower() == "fuzzer" and option_index == 1:
+            domain = self.domain.strip().rstrip('/')
+            url = f"https://{domain}/FUZZ"
+            wordlist = self.wordlist_path
+            output_path = os.path.join(self.output_dir, self.output_filename)
+            cmd = f'ffuf -u "{url}" -w "{wordlist}" -t 50 -o "{output_path}" -of json'
+            cmd += f" && {self.ffuf_cluster_cmd(output_path)}"
+            return cmd
+
+        elif tool_name.lower() == "fuzzer" and option_index == 2:
+            domain = re.sub(r'^https?://', '', self.domain.strip()).rstrip('/')
+            url = f"https://{domain}/FUZZ"
+            wordlist = self.wordlist_path
+            extensions = ".php,.bak,.old"
+            output_path = os.path.join(self.output_dir, self.output_filename)
+            cmd = f'ffuf -u "{url}" -w "{wordlist}" -e {extensions} -t 40 -o "{output_path}" -mc 200-500 -of json'
+            cmd += f" && {self.ffuf_cluster_cmd(output_path)}"
+            return cmd
+
+        elif tool_name.lower() == "fuzzer" and option_index == 3:
+            domain = re.sub(r'^https?://', '', self.domain.strip()).rstrip('/')
+            url = f"https://{domain}/search.php?FUZZ=1"
+            wordlist = self.wordlist_path
+            output_path = os.path.join(self.output_dir, self.output_filename)
+            cmd = f"ffuf -u '{url}' -w {wordlist} -t 40 -mc 200-500 -o {output_path} -of json"
+            return cmd
+
+        elif tool_name.lower() == "fuzzer" and option_index == 4:
+            domain = re.sub(r'^https?://', '', self.domain.strip()).rstrip('/')
+            url = f"https://{domain}/"
+            wordlist = self.wordlist_path
+            output_path = os.path.join(self.output_dir, self.output_filename)
+            cmd = f"ffuf -u {url} -H 'Host: FUZZ.{domain}' -w {wordlist} -t 80 -mc 200 -o {output_path} -of json"
+            return cmd
+
+        elif tool_name.lower() == "fuzzer" and option_index == 5:
+            domain = re.sub(r'^https?://', '', self.domain.strip()).rstrip('/')
+            url = f"https://{domain}/login"
+            wordlist = self.wordlist_path
+            output_path = os.path.join(self.output_dir, self.output_filename)
+            cmd = f"ffuf -u {url} -d 'username=admin&password=FUZZ' -X POST -w {wordlist} -H 'Content-Type: application/x-www-form-urlencoded' -t 30 -mc 200,302 -o {output_path} -of json"
+            return cmd
+
+        elif tool_name.lower() == "fuzzer" and option_index == 6:
+            domain = re.sub(r'^https?://', '', self.domain.strip()).rstrip('/')
+            url = f"https://{domain}/FUZZ"
+            wordlist = self.wordlist_path
+            extensions = ".php,.html"
+            output_path = os.path.join(self.output_dir, self.output_filename)
+            cmd = f"ffuf -u '{url}' -w '{wordlist}' -recursion -recursion-depth 2 -t 50 -e '{extensions}' -o '{output_path}' -of json"
+            cmd += f" && {self.ffuf_cluster_cmd(output_path)}"
+            return cmd
+
+        elif tool_name.lower() == "fuzzer" and option_index == 7:
+            domain = re.sub(r'^https?://', '', self.domain.strip()).rstrip('/')
+            url = f"https://{domain}/FUZZ"
+            wordlist = self.wordlist_path
+            output_path = os.path.join(self.output_dir, self.output_filename)
+            cmd = f"ffuf -u '{url}' -w '{wordlist}' -t 30 -rate 50 -timeout 10 -o '{output_path}' -of json"
+            return cmd
+
+        elif tool_name.lower() == "fuzzer" and option_index == 8:
+            domain = re.sub(r'^https?://', '', self.domain.strip()).rstrip('/')
+            url = f"https://{domain}/FUZZ"
+            wordlist = self.wordlist_path
+            output_path = os.path.join(self.output_dir, self.output_filename)
+            cmd = f'ffuf -u "{url}" -w "{wordlist}" -fs 0 -fw 5 -mr "index of|Directory listing" -o "{output_path}" -of json'
+            return cmd
+
+        elif tool_name.lower() == "fuzzer" and option_index == 9:
+            domain = re.sub(r'^https?://', '', self.domain.strip()).rstrip('/')
+            output_path = os.path.join(self.output_dir, self.output_filename)
+            cmd = f"ffuf -u 'https://{domain}/FUZZ' -H 'X-Api-Token: FUZZ2' -w '{self.wordlist_path}':FUZZ -w '{self.wordlist_path}':FUZZ2 -t 60 -mc 200 -o '{output_path}' -of json"
+            cmd += f" && {self.ffuf_cluster_cmd(output_path)}"
+            return cmd
+
+        elif tool_name.lower() == "fuzzer" and option_index == 10:
+            domain = re.sub(r'^https?://', '', self.domain.strip()).rstrip('/')
+            wordlist = self.wordlist_path
+            output_path = os.path.join(self.output_dir, self.output_filename)
+            cmd = f"ffuf -c -w {wordlist}  -u http://{domain}/FUZZ -of json"
+            return cmd
+        
+        elif tool_name.lower() == "nuclei":
+            domain = re.sub(r'^https?://', '', self.domain.strip()).rstrip('/')
+            output_base = os.path.join(self.output_dir, f"nuclei_{domain}")
+            templates = self.nuclei_templates_path
+
+            if option_index == 1:
+                out = f"{output_base}_all.txt"
+                cmd = f'nuclei -stats -u "https://{domain}" -t "{templates}" -o "{out}"'
+
+            elif option_index == 2:
+                out = f"{output_base}_vulnerabilities.txt"
+                t = self.nuclei_templates_arg(f"{output_base}_vulnerabilities.templates",
+                                              os.path.join(templates, "vulnerabilities"), path_part="vulnerabilities")
+                cmd = f'nuclei -stats -u "https://{domain}" -t "{t}" -o "{out}"'
+
+            elif option_index == 3:
+                out = f"{output_base}_exposures.txt"
+                t = self.nuclei_templates_arg(f"{output_base}_exposures.templates",
+                                              os.path.join(templates, "exposures"), path_part="exposures")
+                cmd = f'nuclei -stats -u "https://{domain}" -t "{t}" -o "{out}"'
+
+            elif option_index == 4:
+                out = f"{output_base}_files.txt"
+                t = self.nuclei_templates_arg(f"{output_base}_files.templates",
+                                              os.path.join(templates, "files"), path_part="files")
+                cmd = f'nuclei -stats -u "https://{domain}" -t "{t}" -o "{out}"'
+
+            elif option_index == 5:
+                out = f"{output_base}_takeovers.txt"
+                t = self.nuclei_templates_arg(f"{output_base}_takeovers.templates",
+                                              os.path.join(templates, "takeovers"), path_part="takeovers")
+                cmd = f'nuclei -stats -u "https://{domain}" -t "{t}" -o "{out}"'
+
+            elif option_index == 6:
+                out = f"{output_base}_misconfigurations.txt"
+                t = self.nuclei_templates_arg(f"{output_base}_misconfigurations.templates",
+                                              os.path.join(templates, "misconfiguration"), path_part="misconfiguration")
+                cmd = f'nuclei -stats -u "https://{domain}" -t "{t}" -o "{out}"'
+
+            elif option_index == 7:
+                out = f"{output_base}_credentials.txt"
+                t = self.nuclei_templates_arg(f"{output_base}_credentials.templates",
+                                              os.path.join(templates, "credentials"), path_part="credentials")
+                cmd = f'nuclei -stats -u "https://{domain}" -t "{t}" -o "{out}"'
+
+            elif option_index == 8:
+                out = f"{output_base}_leaks.txt"
+                t = self.nuclei_templates_arg(f"{output_base}_leaks.templates", None, tags=["leak"])
+                if t:
+                    cmd = f'nuclei -stats -u "https://{domain}" -t "{t}" -o "{out}"'
+                else:
+                    cmd = f'nuclei -stats -u "https://{domain}" -t "{templates}" -tags "leak" -o "{out}"'
+
+            elif option_index == 9:
+                out = f"{output_base}_custom.txt"
+                cmd = f'nuclei -stats -u "https://{domain}" -t "{os.path.join(templates, "custom")}" -o "{out}"'
+
+            elif option_index == 10:
+                out = f"{output_base}_quick_scan.txt"
+                t = self.nuclei_templates_arg(f"{output_base}_quick_scan.templates", None, severity=["critical", "high"])
+                if t:
+                    cmd = f'nuclei -stats -u "https://{domain}" -t "{t}" -c 25 -o "{out}"'
+                else:
+                    cmd = f'nuclei -stats -u "https://{domain}" -t "{templates}" -severity "critical,high" -c 25 -o "{out}"'
+
+            if self.delta_mode:
+                cmd = self.apply_delta_nuclei(cmd, domain, f"nuclei:{option_index}")
+            elif self.nuclei_shards > 1:
+                cmd = f"shard {self.nuclei_shards} {cmd}"
+            return cmd
+
+        elif tool_name.lower() == "httpx":
+            domain = re.sub(r'^https?://', '', self.domain.strip()).rstrip('/')
+            output_base = f"https://{domain}"
+            
+            if option_index == 1:
+                out = os.path.join(self.output_dir, f"httpx_basic_{domain}.txt")
+                cmd = f'httpx -u {output_base} -o "{out}"'
+                return cmd
+                
+            elif option_index == 2:
+                out = os.path.join(self.output_dir, f"httpx_list_{domain}.txt")
+                cmd = f'{self.target_list_cmd(self.wordlist_path, stage="httpx:list")} | httpx -o "{out}"'
+                cmd = self.with_delta_commit(cmd, "httpx:list")
+                return cmd
+                
+            elif option_index == 3:
+                out = os.path.join(self.output_dir, f"httpx_title_{domain}.txt")
+                cmd = f'httpx -u {output_base} -title -o "{out}"'
+                return cmd
+                
+            elif option_index == 4:
+                out = os.path.join(self.output_dir, f"httpx_status_{domain}.txt")
+                cmd = f'httpx -u {output_base} -status-code -o "{out}"'
+                return cmd
+                
+            elif option_index == 5:
+                out = os.path.join(self.output_dir, f"httpx_headers_{domain}.txt")
+                cmd = f'httpx -u {output_base} -headers -o "{out}"'
+                return cmd
+                
+            elif option_index == 6:
+                out = os.path.join(self.output_dir, f"httpx_methods_{domain}.txt")
+                cmd = f'{self.target_list_cmd(self.wordlist_path, stage="httpx:methods")} | httpx -methods GET,POST -o "{out}"'
+                cmd = self.with_delta_commit(cmd, "httpx:methods")
+                return cmd
+                
+            elif option_index == 7:
+                out = os.path.join(self.output_dir, f"httpx_follow_{domain}.txt")
+                cmd = f'{self.target_list_cmd(self.wordlist_path, stage="httpx:follow")} | httpx -follow-redirects -o "{out}"'
+                cmd = self.with_delta_commit(cmd, "httpx:follow")
+                return cmd
+                
+            elif option_index == 8:
+                out = os.path.join(self.output_dir, f"httpx_timeout_{domain}.txt")
+                cmd = f'{self.target_list_cmd(self.wordlist_path, stage="httpx:timeout")} | httpx -timeout 10 -retries 2 -o "{out}"'
+                cmd = self.with_delta_commit(cmd, "httpx:timeout")
+                return cmd
+                
+            elif option_index == 9:
+                out = os.path.join(self.output_dir, f"httpx_conc_{domain}.txt")
+                cmd = f'{self.target_list_cmd(self.wordlist_path, stage="httpx:conc")} | httpx -c 50 -o "{out}"'
+                cmd = self.with_delta_commit(cmd, "httpx:conc")
+                return cmd
+                
+            elif option_index == 10:
+                out = os.path.join(self.output_dir, f"httpx_custom_{domain}.txt")
+                cmd = f'httpx -u https://{domain}/path -o "{out}"'
+                return cmd
+
+
+        elif tool_name.lower() == "subfinder":
+            domain = re.sub(r'^https?://', '', self.domain.strip()).rstrip('/')
+            if option_index == 1:
+                out = os.path.join(self.output_dir, f"subfinder_passive_{domain}.txt")
+                cmd = f"subfinder -d {domain} -o \"{out}\""
+            elif option_index == 2:
+                out = os.path.join(self.output_dir, f"subfinder_recursive_{domain}.txt")
+                cmd = f"subfinder -d {domain} -recursive -o \"{out}\""
+            elif option_index == 3:
+                out = os.path.join(self.output_dir, f"subfinder_brute_{domain}.txt")
+                cmd = f"subfinder -d {domain} -brute -w \"{self.wordlist_path}\" -o \"{out}\""
+            elif option_index == 4:
+                resolvers = self.ranked_resolvers_path()
+                out = os.path.join(self.output_dir, f"subfinder_resolvers_{domain}.txt")
+                cmd = f"{self.rank_resolvers_cmd()} && subfinder -d {domain} -o \"{out}\" -r \"{resolvers}\""
+            elif option_index == 5:
+                out = os.path.join(self.output_dir, f"subfinder_timeout_{domain}.txt")
+                cmd = f"subfinder -d {domain} -timeout 10 -o \"{out}\""
+            elif option_index == 6:
+                out = os.path.join(self.output_dir, f"subfinder_threads_{domain}.txt")
+                cmd = f"subfinder -d {domain} -t 50 -o \"{out}\""
+            elif option_index == 7:
+                out = os.path.join(self.output_dir, f"subfinder_all_{domain}.txt")
+                all_sources = " -all" if self.tool_supports("subfinder", "-all") else ""
+                cmd = f"subfinder -d {domain}{all_sources} -o \"{out}\""
+            elif option_index == 8:
+                out = os.path.join(self.output_dir, f"subfinder_cert_{domain}.txt")
+                cmd = f"subfinder -d {domain} -o \"{out}\" -crt"
+            elif option_index == 9:
+                out = os.path.join(self.output_dir, f"subfinder_{domain}.json")
+                cmd = f"subfinder -d {domain} -o \"{out}\" -oJ"
+            elif option_index == 10:
+                out = os.path.join(self.output_dir, f"subfinder_custom_{domain}.txt")
+                cmd = f"subfinder -d {domain} -o \"{out}\""
+                
+
+            cmd += f" && {self.subdomain_merge_cmd(domain, out)}"
+            return cmd
+
+        elif tool_name.lower() == "dnsx":
+            domain = re.sub(r'^https?://', '', self.domain.strip()).rstrip('/')
+            if option_index == 1:
+                out = os.path.join(self.output_dir, f"dnsx_basic_{domain}.txt")
+                cmd = f'dnsx -d {domain} -o "{out}"'
+                cmd = self.apply_delta_dnsx(cmd, domain, "dnsx:basic")
+                cmd += f" && {self.subdomain_merge_cmd(domain, out)}"
+                return cmd
+
+            elif option_index == 2:
+                out = os.path.join(self.output_dir, f"dnsx_a_aaaa_{domain}.txt")
+                cmd = f'dnsx -d {domain} -a -aaaa -o "{out}"'
+                cmd = self.apply_delta_dnsx(cmd, domain, "dnsx:a_aaaa")
+                cmd += f" && {self.subdomain_merge_cmd(domain, out)}"
+                return cmd
+
+            elif option_index == 3:
+                out = os.path.join(self.output_dir, f"dnsx_cname_{domain}.txt")
+                cmd = f'dnsx -d {domain} -cname -o "{out}"'
+                cmd = self.apply_delta_dnsx(cmd, domain, "dnsx:cname")
+                cmd += f" && {self.subdomain_merge_cmd(domain, out)}"
+                return cmd
+
+            elif option_index == 4:
+                out = os.path.join(self.output_dir, f"dnsx_mx_txt_{domain}.txt")
+                cmd = f'dnsx -d {domain} -mx -txt -o "{out}"'
+                cmd = self.apply_delta_dnsx(cmd, domain, "dnsx:mx_txt")
+                cmd += f" && {self.subdomain_merge_cmd(domain, out)}"
+                return cmd
+
+            elif option_index == 5:
+                resolvers = self.ranked_resolvers_path()
+                out = os.path.join(self.output_dir, f"dnsx_resolvers_{domain}.txt")
+                cmd = f'dnsx -d {domain} -r "{resolvers}" -o "{out}"'
+                cmd = self.apply_delta_dnsx(cmd, domain, "dnsx:resolvers")
+                cmd = f"{self.rank_resolvers_cmd()} && {cmd}"
+                cmd += f" && {self.subdomain_merge_cmd(domain, out)}"
+                return cmd
+
+            elif option_index == 6:
+                out = os.path.join(self.output_dir, f"dnsx_wildcard_{domain}.txt")
+                cmd = f'python3 -c "print(\'generate-check\')" && dnsx -d {domain} -silent -o \"{out}\"'
+                return cmd
+
+            elif option_index == 7:
+                out = os.path.join(self.output_dir, f"dnsx_brute_{domain}.txt")
+                cmd = f'dnsx -d {domain} -w "{self.wordlist_path}" -o "{out}"'
+                cmd += f" && {self.subdomain_merge_cmd(domain, out)}"
+                return cmd
+
+            elif option_index == 8:
+                out = os.path.join(self.output_dir, f"dnsx_probe_{domain}.txt")
+                cmd = f'dnsx -d {domain} -a -o "{out}"{self.scope_pipe()} | httpx -silent -o "{os.path.join(self.output_dir, f"httpx_from_dnsx_{domain}.txt")}"'
+                return cmd
+
+            elif option_index == 9:
+                out = os.path.join(self.output_dir, f"dnsx_{domain}.json")
+                cmd = f'dnsx -d {domain} -o "{out}"'
+                return cmd
+
+            elif option_index == 10:
+                out = os.path.join(self.output_dir, f"dnsx_custom_{domain}.txt")
+                cmd = f'# Custom dnsx: dnsx -d {domain} -o \"{out}\"'
+                return cmd
+
+            elif option_index == 11:
+                out = os.path.join(self.output_dir, f"dnsx_permutations_{domain}.txt")
+                cmd = self.permutation_cmd(domain)
+                cmd += self.scope_pipe()
+                if self.delta_mode:
+                    cmd += f" | {self.delta_filter_cmd('dnsx:permutations')}"
+                cmd += f' | dnsx -silent -o "{out}"'
+                cmd = self.with_delta_commit(cmd, "dnsx:permutations")
+                cmd += f" && {self.subdomain_merge_cmd(domain, out)}"
+                return cmd
+
+        else:
+            if tool_name.lower() == "httpx":
+                cmd = f'httpx -u {self.domain} -o {self.output_filename}'
+            else:
+                cmd = f'# {tool_name} option {option_index} (configure command)'
+            return cmd
+ 
+
+    def batch_command(self, tool_name, option_indices):
+        """
+        One command line running several presets of ``tool_name``. dnsx
+        record lookups and httpx single-URL probes selected together run as
+        a single invocation with the union of their flags, whose JSON output
+        is split back into each option's usual file; the rest run in turn.
+        Sharded nuclei presets become one line for the ``shard`` builtin,
+        which /bin/sh does not know; mixed with shell commands they run
+        unsharded.
+        """
+        t = tool_name.lower()
+        domain = re.sub(r'^https?://', '', self.domain.strip()).rstrip('/')
+        indices = sorted(set(option_indices))
+        options = {"dnsx": batch.DNSX_OPTIONS, "httpx": batch.HTTPX_OPTIONS}.get(t, {})
+        group = {i: options[i][0] for i in indices if i in options}
+        if t == "httpx" and not self.tool_supports("httpx", batch.HTTPX_FLAGS["header"]):
+            # older httpx has no response-header flag: headers run on their own
+            group = {i: name for i, name in group.items() if name != "headers"}
+        if len(group) < 2:
+            group = {}
+
+        parts = []
+        if group:
+            names = list(group.values())
+            outputs = {name: os.path.join(self.output_dir, f"{t}_{name}_{domain}.txt") for name in names}
+            combined = os.path.join(self.output_dir, f"{t}_batch_{domain}.json")
+            if t == "dnsx":
+                cmd = f'dnsx -d {domain} {batch.dnsx_flags(names)} -json -o "{combined}"'
+                # each option keeps its own delta stage, as when run alone
+                cmd = self.apply_delta_dnsx(cmd, domain, ",".join(f"dnsx:{name}" for name in names))
+            else:
+                cmd = f'httpx -u https://{domain} {batch.httpx_flags(names)} -json -o "{combined}"'
+            cmd += " && " + self.script_cmd("batch.py", "split", t, combined,
+                                            *[f"{name}={path}" for name, path in outputs.items()])
+            if t == "dnsx":
+                cmd += "".join(f" && {self.subdomain_merge_cmd(domain, path)}" for path in outputs.values())
+            parts.append(cmd)
+        for i in indices:
+            if i in group:
+                continue
+            cmd = self.preset_command(tool_name, i)
+            if cmd and not cmd.lstrip().startswith('#'):
+                parts.append(cmd)
+        if len(parts) == 1:
+            return parts[0]
+        # "shard N ..." is the app's builtin, not a shell command: sharded
+        # presets share one shard line, run as a single scheduler group
+        sharded = [re.match(r'shard (\d+) (.+)$', cmd) for cmd in parts]
+        if all(sharded) and len({m.group(1) for m in sharded}) == 1:
+            return f"shard {sharded[0].group(1)} " + " ; ".join(m.group(2) for m in sharded)
+        parts = [m.group(2) if m else cmd for m, cmd in zip(sharded, parts)]
+        return " ; ".join(f"( {cmd} )" for cmd in parts)
@@ -0,0 +1,213 @@
+import os
+import signal
+import socket
+from PyQt6.QtCore import QObject, QSocketNotifier, QTimer, pyqtSignal
+from job_log import JobLog
+from output_queue import OutputQueue
+from spawn import spawn
+from utils import LineSplitter
+
+
+class ProcessMultiplexer(QObject):
+    """
+    Watches every child's output pipe from the Qt event loop with
+    QSocketNotifier instead of one blocking reader thread per job.
+
+    Children are reaped through one path: a pidfd per child when the
+    kernel supports it, otherwise a single SIGCHLD handler whose wakeup
+    fd makes the loop poll the running jobs.
+    """
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        super().__init__()
+        self.jobs = set()
+        self.use_pidfd = hasattr(os, "pidfd_open")
+        self._sigchld_notifier = None
+        if self.use_pidfd:
+            try:
+                fd = os.pidfd_open(os.getpid())
+                os.close(fd)
+            except OSError:
+                self.use_pidfd = False
+        if not self.use_pidfd:
+            self._install_sigchld()
+
+    def _install_sigchld(self):
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
+        signal.signal(signal.SIGCHLD, lambda signum, frame: None)
+        signal.set_wakeup_fd(self._wake_w.fileno(), warn_on_full_buffer=False)
+        self._sigchld_notifier = QSocketNotifier(self._wake_r.fileno(), QSocketNotifier.Type.Read, self)
+        self._sigchld_notifier.activated.connect(self._on_sigchld)
+
+    def _on_sigchld(self, *_):
+        try:
+            while self._wake_r.recv(512):
+                pass
+        except BlockingIOError:
+            pass
+        for job in list(self.jobs):
+            job._check_exit()
+
+    def register(self, job):
+        self.jobs.add(job)
+
+    def unregister(self, job):
+        self.jobs.discard(job)
+
+
+class ProcessJob(QObject):
+    """
+    One external command driven by the ProcessMultiplexer. Same interface
+    as CommandWorker (start/interrupt, output_signal, finished_signal) but
+    it runs entirely on the GUI thread.
+    """
+    output_signal = pyqtSignal(str)
+    finished_signal = pyqtSignal()
+    # a fork-server child's exit status arrives on another thread; queued to this one
+    _exit_signal = pyqtSignal()
+
+    READ_SIZE = 65536
+    # reads per notifier activation; the level-triggered notifier fires again
+    # for the rest, so a fast producer cannot hold the GUI thread
+    READS_PER_WAKE = 4
+
+    def __init__(self, command, cwd=None, log_path=None):
+        super().__init__()
+        self.command = command
+        self.cwd = cwd
+        self.log_path = log_path
+        self.process = None
+        self._log = None
+        self._splitter = LineSplitter(keep_ends=True)
+        self.queue = OutputQueue(log_path=log_path)
+        self._out_notifier = None
+        self._exit_notifier = None
+        self._pidfd = None
+        self._eof = False
+        self._exited = False
+        self._running = False
+
+    def isRunning(self):
+        return self._running
+
+    def start(self):
+        mux = ProcessMultiplexer.instance()
+        self._running = True
+        if self.log_path:
+            try:
+                self._log = JobLog(self.log_path)
+            except OSError as e:
+                self.output_signal.emit(f"[Error] cannot open job log: {e}\n")
+        try:
+            self.process = spawn(self.command, cwd=self.cwd)
+        except Exception as e:
+            self.output_signal.emit(f"[Error] {str(e)}\n")
+            self._finish()
+            return
+
+        mux.register(self)
+        fd = self.process.stdout.fileno()
+        os.set_blocking(fd, False)
+        self._out_notifier = QSocketNotifier(fd, QSocketNotifier.Type.Read, self)
+        self._out_notifier.activated.connect(self._on_readable)
+        if hasattr(self.process, "add_exit_callback"):
+            # the fork server reaps this child, so its exit message is the exit path
+            self._exit_signal.connect(self._check_exit)
+            self.process.add_exit_callback(self._exit_signal.emit)
+        if mux.use_pidfd:
+            try:
+                self._pidfd = os.pidfd_open(self.process.pid)
+                self._exit_notifier = QSocketNotifier(self._pidfd, QSocketNotifier.Type.Read, self)
+                self._exit_notifier.activated.connect(self._on_pidfd)
+            except OSError:
+                self._pidfd = None
+        # the child may already be gone before the notifier was armed
+        self._check_exit()
+
+    def _emit(self, chunk):
+        if self._log is not None:
+            self._log.write_line(chunk.rstrip('\n'))
+        if self.queue.push(chunk):
+            # let further reads pile up (and frames collapse) before rendering
+            QTimer.singleShot(0, self._drain)
+
+    def _drain(self):
+        for chunk in self.queue.drain():
+            self.output_signal.emit(chunk)
+
+    def _on_readable(self, *_):
+        fd = self.process.stdout.fileno()
+        for _ in range(self.READS_PER_WAKE):
+            try:
+                data = os.read(fd, self.READ_SIZE)
+            except BlockingIOError:
+                return
+            except OSError:
+                data = b""
+            if not data:
+                self._eof = True
+                self._out_notifier.setEnabled(False)
+                for line in self._splitter.finish():
+                    self._emit(line)
+                self._maybe_finish()
+                return
+            for line in self._splitter.feed(data):
+                self._emit(line)
+
+    def _on_pidfd(self, *_):
+        # fires once; a fork-server child may be gone before its status
+        # reaches us, and the level-triggered notifier would spin meanwhile
+        self._exit_notifier.setEnabled(False)
+        self._check_exit()
+
+    def _check_exit(self, *_):
+        if self._exited or self.process is None:
+            return
+        if self.process.poll() is None:
+            return
+        self._exited = True
+        if self._exit_notifier is not None:
+            self._exit_notifier.setEnabled(False)
+        self._maybe_finish()
+
+    def _maybe_finish(self):
+        if self._eof and self._exited:
+            self._finish()
+
+    def _finish(self):
+        if not self._running:
+            return
+        self._running = False
+        ProcessMultiplexer.instance().unregister(self)
+        if self.process is not None and self.process.stdout:
+            self.process.stdout.close()
+        if self._pidfd is not None:
+            os.close(self._pidfd)
+            self._pidfd = None
+        if self._log is not None:
+            self._log.close()
+        self._drain()
+        self.finished_signal.emit()
+        self.process = None
+
+    def interrupt(self):
+        """SIGINT to the job's process group, falling back to terminate."""
+        if not self.process:
+            return
+        try:
+            os.killpg(os.getpgid(self.process.pid), signal.SIGINT)
+        except Exception:
+            try:
+                self.process.terminate()
+            except Exception:
+                pass
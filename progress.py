@@ -0,0 +1,54 @@
+import re
+
+_ANSI_RE = re.compile(r'\x1b\[[0-9;?]*[A-Za-z]')
+
+# :: Progress: [1234/4614] :: Job [1/1] :: 523 req/sec :: Duration: [0:00:02] :: Errors: 0 ::
+_FFUF_RE = re.compile(
+    r':: Progress: \[(\d+)/(\d+)\]\s*:: Job \[(\d+)/(\d+)\]\s*::\s*(\d+) req/sec\s*::'
+    r'\s*Duration: \[([\d:]+)\]\s*::\s*Errors: (\d+)'
+)
+# [0:00:05] | Templates: 3456 | Hosts: 1 | RPS: 150 | Matched: 0 | Errors: 3 | Requests: 500/10000 (5%)
+_NUCLEI_RE = re.compile(r'^\[([\d:]+)\]\s*\|.*\bRPS: (\d+).*\bMatched: (\d+).*\bErrors: (\d+).*\bRequests: (\d+)/(\d+)')
+
+
+def _seconds(hms):
+    total = 0
+    for part in hms.split(':'):
+        total = total * 60 + int(part)
+    return total
+
+
+def _fields(tool, done, total, rate, elapsed, errors, **extra):
+    eta = (total - done) / rate if rate > 0 and total >= done else None
+    return dict(tool=tool, done=done, total=total, rate=rate, elapsed=elapsed, errors=errors, eta=eta, **extra)
+
+
+def parse_progress(line: str):
+    """
+    Structured fields from a ffuf progress line or a nuclei -stats line:
+    done, total, rate (req/s), elapsed and eta (seconds), errors.
+    Returns None for anything that is not a progress line.
+    """
+    line = _ANSI_RE.sub('', line).strip('\r\n ')
+    if not line:
+        return None
+    m = _FFUF_RE.search(line)
+    if m:
+        done, total, job, jobs, rate, duration, errors = m.groups()
+        return _fields("ffuf", int(done), int(total), int(rate), _seconds(duration), int(errors),
+                       job=f"{job}/{jobs}")
+    m = _NUCLEI_RE.search(line)
+    if m:
+        duration, rate, matched, errors, done, total = m.groups()
+        return _fields("nuclei", int(done), int(total), int(rate), _seconds(duration), int(errors),
+                       matched=int(matched))
+    return None
+
+
+def format_duration(seconds):
+    if seconds is None:
+        return "--:--"
+    seconds = int(seconds)
+    h, rest = divmod(seconds, 3600)
+    m, s = divmod(rest, 60)
+    return f"{h}:{m:02d}:{s:02d}" if h else f"{m:02d}:{s:02d}"
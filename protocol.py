@@ -0,0 +1,41 @@
+import json
+import struct
+
+# frame = 4-byte big-endian header length, JSON header, then header["size"]
+# bytes of binary payload (0 when absent)
+_LEN = struct.Struct(">I")
+MAX_HEADER = 1024 * 1024
+
+
+class ProtocolError(Exception):
+    pass
+
+
+def send_frame(sock, header, payload=b""):
+    header = dict(header, size=len(payload))
+    raw = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    sock.sendall(_LEN.pack(len(raw)) + raw + payload)
+
+
+def _recv_exact(sock, n):
+    buf = bytearray()
+    while len(buf) < n:
+        chunk = sock.recv(min(n - len(buf), 1 << 20))
+        if not chunk:
+            raise ConnectionError("connection closed")
+        buf += chunk
+    return bytes(buf)
+
+
+def recv_frame(sock):
+    """Return (header, payload) for the next frame."""
+    (length,) = _LEN.unpack(_recv_exact(sock, _LEN.size))
+    if length > MAX_HEADER:
+        raise ProtocolError(f"header too large: {length}")
+    try:
+        header = json.loads(_recv_exact(sock, length))
+    except ValueError as e:
+        raise ProtocolError(f"bad header: {e}")
+    size = header.get("size", 0)
+    payload = _recv_exact(sock, size) if size else b""
+    return header, payload
@@ -0,0 +1,129 @@
+import os
+import socket
+import threading
+
+from command_worker import CommandWorker
+from job_log import JobLog
+from protocol import recv_frame, send_frame
+from utils import LineSplitter
+from agent import WORKDIR_TOKEN
+
+
+def parse_agent(spec):
+    """'host:port[/token]' -> (host, port, token)."""
+    address, _, token = spec.partition('/')
+    host, _, port = address.rpartition(':')
+    return host or "127.0.0.1", int(port), token
+
+
+class RemoteJob(CommandWorker):
+    """
+    Runs a command on a remote agent (see agent.py) instead of locally.
+    ``inputs`` are local files shipped with the job and ``outputs`` local
+    paths the command writes; both are rewritten to the agent's per-job
+    work directory and results are copied back when the job ends. Inputs
+    listed in ``template_lists`` are nuclei template lists: their entries
+    under ``templates_root`` are sent relative to it and the agent resolves
+    them against its own templates directory.
+    """
+
+    def __init__(self, command, agent, inputs=(), outputs=(), cwd=None, log_path=None,
+                 template_lists=(), templates_root=None):
+        super().__init__(command, cwd=cwd, log_path=log_path)
+        self.agent = agent
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.template_lists = set(template_lists)
+        self.templates_root = templates_root
+        self.sock = None
+        self._send_lock = threading.Lock()
+
+    def _remote_name(self, kind, i, path):
+        return f"{kind}{i}_{os.path.basename(path)}"
+
+    def _relative_template_list(self, path):
+        root = os.path.abspath(self.templates_root)
+        lines = []
+        with open(path, errors="replace") as f:
+            for line in f:
+                line = line.strip()
+                if line and os.path.isabs(line) and os.path.commonpath([root, os.path.abspath(line)]) == root:
+                    line = os.path.relpath(line, root)
+                if line:
+                    lines.append(line + "\n")
+        return "".join(lines).encode("utf-8")
+
+    def run(self):
+        log = None
+        host, port, token = self.agent
+        try:
+            if self.log_path:
+                log = JobLog(self.log_path)
+            command = self.command
+            files = {}
+            for i, path in enumerate(self.inputs):
+                name = self._remote_name("in", i, path)
+                command = command.replace(path, f"{WORKDIR_TOKEN}/{name}")
+                files[name] = path
+            local_outputs = {}
+            for i, path in enumerate(self.outputs):
+                name = self._remote_name("out", i, path)
+                command = command.replace(path, f"{WORKDIR_TOKEN}/{name}")
+                local_outputs[name] = path
+
+            self.sock = socket.create_connection((host, port), timeout=10)
+            self.sock.settimeout(None)
+            send_frame(self.sock, {"type": "hello", "token": token})
+            header, _ = recv_frame(self.sock)
+            if header.get("type") != "welcome":
+                raise ConnectionError(header.get("message", "agent refused the job"))
+            self._push(f"[agent] running on {header.get('name')} ({host}:{port})\n", log)
+            with self._send_lock:
+                send_frame(self.sock, {"type": "run", "command": command, "outputs": list(local_outputs)})
+                for name, path in files.items():
+                    if path in self.template_lists and self.templates_root:
+                        send_frame(self.sock, {"type": "file", "name": name, "templates": True},
+                                   self._relative_template_list(path))
+                        continue
+                    with open(path, "rb") as f:
+                        send_frame(self.sock, {"type": "file", "name": name}, f.read())
+                send_frame(self.sock, {"type": "start"})
+
+            splitter = LineSplitter(keep_ends=True)
+            while True:
+                header, payload = recv_frame(self.sock)
+                kind = header.get("type")
+                if kind == "output":
+                    for chunk in splitter.feed(payload):
+                        self._push(chunk, log)
+                elif kind == "exit":
+                    for chunk in splitter.finish():
+                        self._push(chunk, log)
+                elif kind == "file":
+                    local = local_outputs.get(header.get("name"))
+                    if local:
+                        with open(local, "wb") as f:
+                            f.write(payload)
+                elif kind in ("done", "error"):
+                    if kind == "error":
+                        self._push(f"[Error] agent: {header.get('message')}\n", log)
+                    break
+        except Exception as e:
+            self._push(f"[Error] agent {host}:{port}: {e}\n", None)
+        finally:
+            if self.sock is not None:
+                self.sock.close()
+                self.sock = None
+            if log is not None:
+                log.close()
+            self._wake_signal.emit()
+            self.finished_signal.emit()
+
+    def interrupt(self):
+        if self.sock is None:
+            return
+        try:
+            with self._send_lock:
+                send_frame(self.sock, {"type": "interrupt"})
+        except OSError:
+            pass
@@ -0,0 +1,329 @@
+import argparse
+import glob
+import html
+import json
+import os
+import re
+import sys
+import time
+from itertools import groupby
+
+from extsort import external_sort
+from scope import host_of
+
+_ANSI_RE = re.compile(r'\x1b\[[0-9;]*[A-Za-z]')
+_WS_RE = re.compile(r'[ \t\n\r]*')
+# [template-id:matcher] [protocol] [severity] matched-at [extracted...]
+_NUCLEI_RE = re.compile(r'^\[([^\]]+)\]\s+\[([^\]]*)\]\s+\[([^\]]*)\]\s+(\S+)\s*(.*)$')
+SEVERITIES = ("critical", "high", "medium", "low", "info", "unknown")
+
+
+def _lines(path):
+    with open(path, errors="replace") as f:
+        for line in f:
+            line = _ANSI_RE.sub('', line).strip()
+            if line and not line.startswith('#'):
+                yield line
+
+
+def _field(text):
+    return text.replace('\t', ' ').replace('\n', ' ')
+
+
+def _record(host, kind, key, payload):
+    """One sortable line: host, kind and dedup key first, then the JSON payload."""
+    return f"{_field(host)}\t{kind}\t{_field(key)}\t{json.dumps(payload, separators=(',', ':'))}"
+
+
+def nuclei_records(path, category):
+    for line in _lines(path):
+        m = _NUCLEI_RE.match(line)
+        if not m:
+            continue
+        template, protocol, severity, matched, extra = m.groups()
+        severity = severity.lower() if severity.lower() in SEVERITIES else "unknown"
+        yield _record(host_of(matched), "finding", f"{template.split(':', 1)[0]} {matched}", {
+            "template": template, "protocol": protocol, "severity": severity,
+            "matched": matched, "extra": extra, "categories": [category],
+        })
+
+
+def httpx_records(path):
+    """
+    One record per probed URL. The headers and methods presets write
+    response headers and bodies into their files too, so every line that
+    does not start with an http(s) URL is skipped.
+    """
+    for line in _lines(path):
+        url, _, rest = line.partition(' ')
+        if not url.startswith(("http://", "https://")):
+            continue
+        yield _record(host_of(url), "http", url, {"url": url, "info": re.findall(r'\[([^\]]*)\]', rest)})
+
+
+def _json_array_items(f, key, chunk_size=1 << 16):
+    """
+    Yield the items of the array under top-level ``key`` of the JSON object
+    read from ``f``, one at a time, holding only the current item (and any
+    other top-level value being skipped) in memory.
+    """
+    decoder = json.JSONDecoder()
+    buf, pos, eof = "", 0, False
+
+    def fill():
+        nonlocal buf, pos, eof
+        data = f.read(chunk_size)
+        eof = not data
+        buf, pos = buf[pos:] + data, 0
+
+    def peek():
+        nonlocal pos
+        while True:
+            pos = _WS_RE.match(buf, pos).end()
+            if pos < len(buf) or eof:
+                return buf[pos:pos + 1]
+            fill()
+
+    def take(expected):
+        nonlocal pos
+        char = peek()
+        if char not in expected:
+            raise ValueError(f"expected one of {expected!r} in {f.name}")
+        pos += 1
+        return char
+
+    def value():
+        nonlocal pos
+        peek()
+        while True:
+            try:
+                item, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                fill()
+                continue
+            # a number cut at the buffer's end still decodes; read on to be sure
+            if end == len(buf) and not eof:
+                fill()
+                continue
+            pos = end
+            return item
+
+    take("{")
+    if peek() == "}":
+        return
+    while True:
+        name = value()
+        take(":")
+        if name != key:
+            value()
+        else:
+            take("[")
+            if peek() == "]":
+                return
+            while True:
+                yield value()
+                if take(",]") == "]":
+                    return
+        if take(",}") == "}":
+            return
+
+
+def ffuf_records(path, domain=None):
+    """
+    ffuf -of json hits, streamed from the results array so a large run
+    never has to fit in memory. With ``domain`` only hits on it or its
+    subdomains are kept.
+    """
+    try:
+        with open(path, errors="replace") as f:
+            for r in _json_array_items(f, "results"):
+                if not isinstance(r, dict):
+                    continue
+                url = r.get("url") or ""
+                host = host_of(url)
+                if domain and host != domain and not host.endswith("." + domain):
+                    continue
+                yield _record(host, "path", url, {
+                    "url": url, "status": r.get("status"), "length": r.get("length"), "words": r.get("words"),
+                })
+    except (OSError, ValueError):
+        return
+
+
+def nuclei_category(path, domain):
+    """'vulnerabilities' for nuclei_example.com_vulnerabilities.txt."""
+    name = os.path.splitext(os.path.basename(path))[0]
+    prefix = f"nuclei_{domain}_"
+    return name[len(prefix):] if name.startswith(prefix) else name
+
+
+def discover(output_dir, domain):
+    """(nuclei, httpx, ffuf) output files for ``domain`` in ``output_dir``."""
+    nuclei = sorted(glob.glob(os.path.join(output_dir, f"nuclei_{glob.escape(domain)}_*.txt")))
+    httpx = sorted(glob.glob(os.path.join(output_dir, f"httpx_*{glob.escape(domain)}*.txt")))
+    ffuf = []
+    for path in sorted(glob.glob(os.path.join(output_dir, "*.json"))):
+        # prefer the noise-filtered copy ffuf_cluster.py writes next to a run
+        if path.endswith(".filtered.json"):
+            continue
+        filtered = os.path.splitext(path)[0] + ".filtered.json"
+        candidate = filtered if os.path.exists(filtered) else path
+        try:
+            with open(candidate, errors="replace") as f:
+                head = f.read(256)
+        except OSError:
+            continue
+        if head.lstrip().startswith('{"commandline"'):
+            ffuf.append(candidate)
+    return nuclei, httpx, ffuf
+
+
+def grouped(records, tmp_dir=None):
+    """
+    Sort records by (host, kind, key) on disk and yield (host, entries),
+    one host at a time. Repeats of a finding (same template and match)
+    collapse into one entry listing every category it was reported under.
+    """
+    def split(line):
+        host, kind, key, payload = line.split('\t', 3)
+        return host, kind, key, payload
+
+    rows = (split(line) for line in external_sort(records, tmp_dir=tmp_dir, chunk_lines=100_000))
+    for host, host_rows in groupby(rows, key=lambda r: r[0]):
+        entries = []
+        for (kind, _), same in groupby(host_rows, key=lambda r: (r[1], r[2])):
+            merged = None
+            for _, _, _, payload in same:
+                item = json.loads(payload)
+                if merged is None:
+                    merged = item
+                elif kind == "finding":
+                    merged["categories"] += [c for c in item["categories"] if c not in merged["categories"]]
+            merged["kind"] = kind
+            entries.append(merged)
+        yield host, entries
+
+
+_HTML_HEAD = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{title}</title>
+<style>
+body {{ background: #121212; color: #ddd; font-family: sans-serif; margin: 2em; }}
+h1 {{ color: #9E7CFF; }} h2 {{ color: #7B61FF; border-bottom: 1px solid #333; }}
+table {{ border-collapse: collapse; width: 100%; margin-bottom: 1em; }}
+td, th {{ border: 1px solid #333; padding: 4px 8px; text-align: left; font-size: 13px; }}
+.critical {{ color: #ff5555; font-weight: bold; }} .high {{ color: #ff8855; }}
+.medium {{ color: #ffcc55; }} .low {{ color: #88ccff; }} .info, .unknown {{ color: #aaa; }}
+</style></head><body>
+<h1>{title}</h1>
+"""
+
+
+def _esc(value):
+    return html.escape("" if value is None else str(value))
+
+
+class ReportWriter:
+    """
+    Writes the HTML and JSON reports one host at a time; only the current
+    host's entries are held, and totals go in a closing summary.
+    """
+
+    def __init__(self, html_path, json_path, title):
+        self.html = open(html_path + ".tmp", "w")
+        self.json = open(json_path + ".tmp", "w")
+        self.paths = (html_path, json_path)
+        self.hosts = 0
+        self.counts = dict.fromkeys(SEVERITIES, 0)
+        self.html.write(_HTML_HEAD.format(title=_esc(title)))
+        self.json.write('{"title": %s, "generated": %d, "hosts": [\n' % (json.dumps(title), time.time()))
+
+    def add_host(self, host, entries):
+        findings = sorted((e for e in entries if e["kind"] == "finding"),
+                          key=lambda e: SEVERITIES.index(e["severity"]))
+        http = [e for e in entries if e["kind"] == "http"]
+        paths = [e for e in entries if e["kind"] == "path"]
+        for f in findings:
+            self.counts[f["severity"]] += 1
+
+        if self.hosts:
+            self.json.write(",\n")
+        json.dump({"host": host, "findings": findings, "http": http, "paths": paths}, self.json)
+        self.hosts += 1
+
+        out = [f'<h2 id="{_esc(host)}">{_esc(host or "(unknown host)")}</h2>']
+        if http:
+            out.append("<table><tr><th>URL</th><th>Fingerprint</th></tr>")
+            out += [f"<tr><td>{_esc(e['url'])}</td><td>{_esc(' | '.join(e['info']))}</td></tr>" for e in http]
+            out.append("</table>")
+        if findings:
+            out.append("<table><tr><th>Severity</th><th>Template</th><th>Matched</th>"
+                       "<th>Extra</th><th>Categories</th></tr>")
+            out += [f"<tr><td class=\"{f['severity']}\">{f['severity']}</td><td>{_esc(f['template'])}</td>"
+                    f"<td>{_esc(f['matched'])}</td><td>{_esc(f['extra'])}</td>"
+                    f"<td>{_esc(', '.join(f['categories']))}</td></tr>" for f in findings]
+            out.append("</table>")
+        if paths:
+            out.append("<table><tr><th>Path hit</th><th>Status</th><th>Length</th><th>Words</th></tr>")
+            out += [f"<tr><td>{_esc(p['url'])}</td><td>{_esc(p['status'])}</td><td>{_esc(p['length'])}</td>"
+                    f"<td>{_esc(p['words'])}</td></tr>" for p in paths]
+            out.append("</table>")
+        self.html.write("\n".join(out) + "\n")
+
+    def close(self):
+        summary = {"hosts": self.hosts, "findings": self.counts}
+        self.json.write('\n], "summary": %s}\n' % json.dumps(summary))
+        cells = "".join(f'<td class="{s}">{s}: {n}</td>' for s, n in self.counts.items())
+        self.html.write(f"<h2>Summary</h2><table><tr><td>hosts: {self.hosts}</td>{cells}</tr></table>\n"
+                        "</body></html>\n")
+        for f, path in zip((self.html, self.json), self.paths):
+            f.close()
+            os.replace(path + ".tmp", path)
+        return summary
+
+
+def build_report(nuclei, httpx, ffuf, html_path, json_path, domain, tmp_dir=None):
+    def records():
+        for path in nuclei:
+            yield from nuclei_records(path, nuclei_category(path, domain))
+        for path in httpx:
+            yield from httpx_records(path)
+        for path in ffuf:
+            # ffuf outputs are not named after a domain; keep only this one's hits
+            yield from ffuf_records(path, domain.lower())
+
+    writer = ReportWriter(html_path, json_path, f"Findings for {domain}")
+    try:
+        for host, entries in grouped(records(), tmp_dir=tmp_dir):
+            writer.add_host(host, entries)
+    finally:
+        summary = writer.close()
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Correlate nuclei, httpx and ffuf outputs by host into one HTML + JSON report")
+    parser.add_argument("-d", "--domain", required=True)
+    parser.add_argument("--dir", default=".", help="output directory holding the tool results")
+    parser.add_argument("-o", "--output", help="report path without extension (default DIR/report_DOMAIN)")
+    parser.add_argument("--nuclei", nargs="*", help="nuclei text outputs (default: discovered in --dir)")
+    parser.add_argument("--httpx", nargs="*", help="httpx text outputs")
+    parser.add_argument("--ffuf", nargs="*", help="ffuf -of json outputs")
+    args = parser.parse_args(argv)
+
+    nuclei, httpx, ffuf = discover(args.dir, args.domain)
+    nuclei = args.nuclei if args.nuclei is not None else nuclei
+    httpx = args.httpx if args.httpx is not None else httpx
+    ffuf = args.ffuf if args.ffuf is not None else ffuf
+    base = args.output or os.path.join(args.dir, f"report_{args.domain}")
+    print(f"[report] {len(nuclei)} nuclei, {len(httpx)} httpx, {len(ffuf)} ffuf files", file=sys.stderr)
+    summary = build_report(nuclei, httpx, ffuf, base + ".html", base + ".json", args.domain, tmp_dir=args.dir)
+    found = ", ".join(f"{n} {s}" for s, n in summary["findings"].items() if n)
+    print(f"[report] {summary['hosts']} hosts ({found or 'no findings'}) -> {base}.html, {base}.json")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
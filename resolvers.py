@@ -0,0 +1,309 @@
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import random
+import statistics
+import string
+import struct
+import sys
+import time
+
+from utils import app_data_dir
+
+# used when the input list is missing
+DEFAULT_RESOLVERS = [
+    "1.1.1.1", "1.0.0.1", "8.8.8.8", "8.8.4.4", "9.9.9.9", "149.112.112.112",
+    "208.67.222.222", "208.67.220.220",
+]
+# names with stable, well-known answers a healthy resolver must return
+KNOWN_ANSWERS = {
+    "one.one.one.one": {"1.1.1.1", "1.0.0.1"},
+    "dns.google": {"8.8.8.8", "8.8.4.4"},
+}
+# random labels under this zone must come back NXDOMAIN, not an address
+NX_PARENT = "example.com"
+RESOLVER_TTL = 24 * 3600
+
+_HEADER = struct.Struct(">HHHHHH")
+RCODE_NXDOMAIN = 3
+
+
+def parse_resolver(line):
+    """'ip', 'ip:port' or 'udp:ip:port' -> (ip, port); None for blanks, comments and bad ports."""
+    line = line.strip()
+    if not line or line.startswith('#'):
+        return None
+    if line.startswith("udp:"):
+        line = line[4:]
+    if line.startswith('['):
+        host, _, port = line[1:].partition(']:')
+    elif line.count(':') == 1:
+        host, _, port = line.partition(':')
+    else:
+        host, port = line, ""
+    if not port:
+        return host, 53
+    try:
+        port = int(port)
+    except ValueError:
+        return None
+    return (host, port) if 0 < port < 65536 else None
+
+
+def resolver_key(host, port):
+    if port == 53:
+        return host
+    return f"[{host}]:{port}" if ':' in host else f"{host}:{port}"
+
+
+def build_query(qid, name, qtype=1):
+    """A recursive DNS query for ``name`` (type A by default)."""
+    question = b"".join(bytes([len(label)]) + label.encode("ascii") for label in name.split('.') if label)
+    return _HEADER.pack(qid, 0x0100, 1, 0, 0, 0) + question + b"\x00" + struct.pack(">HH", qtype, 1)
+
+
+def _skip_name(data, pos):
+    while True:
+        length = data[pos]
+        if length == 0:
+            return pos + 1
+        if length & 0xC0 == 0xC0:
+            return pos + 2
+        pos += 1 + length
+
+
+def parse_response(data):
+    """(query id, rcode, set of A-record addresses) from a DNS response."""
+    qid, flags, qdcount, ancount, _, _ = _HEADER.unpack_from(data)
+    pos = _HEADER.size
+    for _ in range(qdcount):
+        pos = _skip_name(data, pos) + 4
+    addresses = set()
+    for _ in range(ancount):
+        pos = _skip_name(data, pos)
+        rtype, _, _, rdlength = struct.unpack_from(">HHIH", data, pos)
+        pos += 10
+        if rtype == 1 and rdlength == 4:
+            addresses.add(".".join(str(b) for b in data[pos:pos + 4]))
+        pos += rdlength
+    return qid, flags & 0x000F, addresses
+
+
+class _ResolverProtocol(asyncio.DatagramProtocol):
+    def __init__(self):
+        self.transport = None
+        self.pending = {}
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        try:
+            qid, rcode, addresses = parse_response(data)
+        except (struct.error, IndexError):
+            return
+        future = self.pending.pop(qid, None)
+        if future is not None and not future.done():
+            future.set_result((rcode, addresses))
+
+    def error_received(self, exc):
+        for future in self.pending.values():
+            if not future.done():
+                future.set_exception(exc)
+        self.pending.clear()
+
+    async def query(self, name, timeout):
+        loop = asyncio.get_running_loop()
+        qid = random.randrange(1 << 16)
+        while qid in self.pending:
+            qid = random.randrange(1 << 16)
+        future = loop.create_future()
+        self.pending[qid] = future
+        started = time.perf_counter()
+        self.transport.sendto(build_query(qid, name))
+        try:
+            rcode, addresses = await asyncio.wait_for(future, timeout)
+        finally:
+            self.pending.pop(qid, None)
+        return rcode, addresses, time.perf_counter() - started
+
+
+async def check_resolver(host, port, known=None, nx_parent=NX_PARENT, timeout=2.0, attempts=2):
+    """
+    Probe one resolver: every known name must resolve to its expected
+    addresses and a random name under ``nx_parent`` must be NXDOMAIN.
+    Returns {"ok", "latency" (median seconds), "reason"}.
+    """
+    known = KNOWN_ANSWERS if known is None else known
+    loop = asyncio.get_running_loop()
+    try:
+        transport, proto = await loop.create_datagram_endpoint(_ResolverProtocol, remote_addr=(host, port))
+    except OSError as e:
+        return {"ok": False, "latency": None, "reason": f"unreachable: {e}"}
+    latencies = []
+
+    async def ask(name):
+        for attempt in range(attempts):
+            try:
+                rcode, addresses, latency = await proto.query(name, timeout)
+                latencies.append(latency)
+                return rcode, addresses
+            except asyncio.TimeoutError:
+                continue
+        return None
+
+    try:
+        for name, expected in known.items():
+            answer = await ask(name)
+            if answer is None:
+                return {"ok": False, "latency": None, "reason": f"timeout on {name}"}
+            if not answer[1] or not answer[1] <= set(expected):
+                return {"ok": False, "latency": None, "reason": f"wrong answer for {name}: {sorted(answer[1])}"}
+        if nx_parent:
+            label = "".join(random.choices(string.ascii_lowercase + string.digits, k=16))
+            answer = await ask(f"{label}.{nx_parent}")
+            if answer is None:
+                return {"ok": False, "latency": None, "reason": "timeout on NXDOMAIN check"}
+            if answer[0] != RCODE_NXDOMAIN or answer[1]:
+                return {"ok": False, "latency": None, "reason": "hijacks NXDOMAIN"}
+    except OSError as e:
+        return {"ok": False, "latency": None, "reason": f"error: {e}"}
+    finally:
+        transport.close()
+    return {"ok": True, "latency": statistics.median(latencies) if latencies else None, "reason": ""}
+
+
+async def check_all(resolvers, concurrency=500, **kwargs):
+    """Probe (host, port) pairs concurrently; returns {key: result}."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(host, port):
+        async with semaphore:
+            return resolver_key(host, port), await check_resolver(host, port, **kwargs)
+
+    results = await asyncio.gather(*(one(h, p) for h, p in resolvers))
+    return dict(results)
+
+
+class ResolverCache:
+    """Probe results per resolver with the time they were taken, reused for ``ttl`` seconds."""
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(app_data_dir(), "resolvers.json")
+        try:
+            with open(self.path) as f:
+                self.data = json.load(f)
+        except (OSError, ValueError):
+            self.data = {}
+
+    def fresh(self, key, ttl):
+        entry = self.data.get(key)
+        if entry and time.time() - entry.get("checked_at", 0) < ttl:
+            return entry
+        return None
+
+    def set(self, key, result):
+        self.data[key] = dict(result, checked_at=time.time())
+
+    def save(self):
+        tmp = self.path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.data, f, indent=2, sort_keys=True)
+        os.replace(tmp, self.path)
+
+
+def check_signature(known=None, nx_parent=NX_PARENT, timeout=2.0, attempts=2):
+    """
+    Short id of the check settings; a cached result only counts for the
+    same known answers, NXDOMAIN zone, timeout and attempts.
+    """
+    known = KNOWN_ANSWERS if known is None else known
+    spec = json.dumps([sorted((name, sorted(addresses)) for name, addresses in known.items()),
+                       nx_parent, timeout, attempts])
+    return hashlib.sha1(spec.encode("utf-8")).hexdigest()[:12]
+
+
+def rank(results, max_latency=None, keep=None):
+    """Healthy resolvers, fastest first, trimmed to ``keep``."""
+    healthy = [(r["latency"] or 0.0, key) for key, r in results.items() if r.get("ok")]
+    if max_latency is not None:
+        healthy = [(lat, key) for lat, key in healthy if lat <= max_latency]
+    ranked = [key for _, key in sorted(healthy)]
+    return ranked[:keep] if keep else ranked
+
+
+def build_ranked_file(resolvers, out_path, cache=None, ttl=RESOLVER_TTL, keep=None,
+                      max_latency=None, concurrency=500, **check_kwargs):
+    """
+    Probe the resolvers not checked within ``ttl``, write the ranked list
+    to ``out_path`` and return (ranked, results).
+    """
+    results, stale = {}, []
+    signature = check_signature(**check_kwargs)
+    for host, port in resolvers:
+        key = resolver_key(host, port)
+        entry = cache.fresh(f"{key} {signature}", ttl) if cache is not None else None
+        if entry is not None:
+            results[key] = entry
+        else:
+            stale.append((host, port))
+    if stale:
+        probed = asyncio.run(check_all(stale, concurrency=concurrency, **check_kwargs))
+        results.update(probed)
+        if cache is not None:
+            for key, result in probed.items():
+                cache.set(f"{key} {signature}", result)
+            cache.save()
+    ranked = rank(results, max_latency, keep)
+    tmp = out_path + ".tmp"
+    with open(tmp, "w") as f:
+        f.write("".join(key + "\n" for key in ranked))
+    os.replace(tmp, out_path)
+    return ranked, results
+
+
+def _parse_check(value):
+    name, _, addresses = value.partition('=')
+    return name, {a for a in addresses.split(',') if a}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Probe DNS resolvers and write a ranked, trimmed list")
+    parser.add_argument("input", help="resolvers file (ip, ip:port or udp:ip:port per line)")
+    parser.add_argument("-o", "--output", required=True, help="ranked resolvers file to write")
+    parser.add_argument("--keep", type=int, default=None, help="keep only the N fastest")
+    parser.add_argument("--max-latency", type=float, default=None, help="drop resolvers slower than this (ms)")
+    parser.add_argument("--ttl", type=int, default=RESOLVER_TTL, help="reuse cached results younger than this (s)")
+    parser.add_argument("--timeout", type=float, default=2.0, help="per-query timeout (s)")
+    parser.add_argument("--concurrency", type=int, default=500)
+    parser.add_argument("--check", action="append", type=_parse_check, metavar="NAME=IP[,IP]",
+                        help="known answer to verify (repeatable; replaces the defaults)")
+    parser.add_argument("--nx-parent", default=NX_PARENT, help="zone used for the NXDOMAIN hijack check ('' to skip)")
+    parser.add_argument("--cache", default=None, help="cache file (default ~/.hackingtool/resolvers.json)")
+    args = parser.parse_args(argv)
+
+    if os.path.exists(args.input):
+        with open(args.input, errors="replace") as f:
+            entries = [parse_resolver(line) for line in f]
+    else:
+        print(f"[resolvers] {args.input} not found, using built-in public resolvers", file=sys.stderr)
+        entries = [parse_resolver(r) for r in DEFAULT_RESOLVERS]
+    resolvers = list(dict.fromkeys(e for e in entries if e))
+
+    started = time.monotonic()
+    ranked, results = build_ranked_file(
+        resolvers, args.output, cache=ResolverCache(args.cache), ttl=args.ttl, keep=args.keep,
+        max_latency=args.max_latency / 1000 if args.max_latency is not None else None,
+        concurrency=args.concurrency, known=dict(args.check) if args.check else None,
+        nx_parent=args.nx_parent, timeout=args.timeout,
+    )
+    bad = sum(1 for r in results.values() if not r.get("ok"))
+    print(f"[resolvers] {len(ranked)} ranked into {args.output} ({bad} unhealthy, "
+          f"{len(resolvers)} checked in {time.monotonic() - started:.1f}s)", file=sys.stderr)
+    return 0 if ranked else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+import os
+from collections import deque
+from PyQt6.QtCore import QObject, pyqtSignal
+
+
+class JobGroup(QObject):
+    """
+    A set of jobs whose completion is reported once, when the last one
+    ends or is cancelled before it started.
+    """
+    finished_signal = pyqtSignal()
+
+    def __init__(self, jobs, parent=None):
+        super().__init__(parent)
+        self.jobs = list(jobs)
+        self.remaining = len(self.jobs)
+        self.cancelled = 0
+        for job in self.jobs:
+            job.finished_signal.connect(self._job_finished)
+
+    def cancel(self, job):
+        """Count a job that was dropped from the queue without ever running."""
+        if job in self.jobs:
+            job.finished_signal.disconnect(self._job_finished)
+            self.cancelled += 1
+            self._job_finished()
+
+    def _job_finished(self):
+        self.remaining -= 1
+        if self.remaining == 0:
+            self.finished_signal.emit()
+
+
+class JobScheduler(QObject):
+    """
+    Start queued jobs with at most ``max_parallel`` running at once.
+    A job is anything with start(), interrupt() and a finished_signal,
+    e.g. CommandWorker.
+    """
+    idle_signal = pyqtSignal()
+
+    def __init__(self, max_parallel=None, parent=None):
+        super().__init__(parent)
+        self.max_parallel = max_parallel or os.cpu_count() or 4
+        self.queue = deque()
+        self.running = []
+        self.groups = []
+
+    def submit(self, job):
+        self.queue.append(job)
+        self._pump()
+        return job
+
+    def submit_group(self, jobs):
+        group = JobGroup(jobs, self)
+        self.groups.append(group)
+        group.finished_signal.connect(lambda g=group: self.groups.remove(g))
+        for job in group.jobs:
+            self.submit(job)
+        return group
+
+    def interrupt_all(self):
+        dropped = list(self.queue)
+        self.queue.clear()
+        # queued jobs never start, so their groups must stop waiting for them
+        for job in dropped:
+            for group in list(self.groups):
+                group.cancel(job)
+        for job in list(self.running):
+            try:
+                job.interrupt()
+            except Exception:
+                pass
+
+    def _pump(self):
+        while self.queue and len(self.running) < self.max_parallel:
+            job = self.queue.popleft()
+            self.running.append(job)
+            job.finished_signal.connect(lambda j=job: self._job_finished(j))
+            job.start()
+
+    def _job_finished(self, job):
+        if job in self.running:
+            self.running.remove(job)
+        self._pump()
+        if not self.running and not self.queue:
+            self.idle_signal.emit()
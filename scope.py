@@ -0,0 +1,274 @@
+import argparse
+import os
+import socket
+import sys
+
+INCLUDE, EXCLUDE = 1, 2
+
+
+class CidrTrie:
+    """
+    Radix trie of IPv4/IPv6 networks. Rules go into a plain binary trie;
+    lookups use a path-compressed copy where runs of single-child nodes
+    collapse into one edge, so a match costs a step per rule on the path
+    rather than per bit. The longest matching prefix decides, so a
+    narrower rule overrides the network around it.
+    """
+
+    def __init__(self):
+        # binary node: [child for bit 0, child for bit 1, action or 0]
+        self.roots = {4: [None, None, 0], 6: [None, None, 0]}
+        self._compressed = {}
+
+    def add(self, network, action):
+        address, _, bits = network.partition('/')
+        version, value, width = parse_ip(address)
+        if value is None:
+            raise ValueError(f"not an IP network: {network}")
+        bits = int(bits) if bits else width
+        if not 0 <= bits <= width:
+            raise ValueError(f"bad prefix length: {network}")
+        node = self.roots[version]
+        for i in range(bits):
+            bit = (value >> (width - 1 - i)) & 1
+            if node[bit] is None:
+                node[bit] = [None, None, 0]
+            node = node[bit]
+        # exclude wins over include for the very same network
+        node[2] = max(node[2], action)
+        self._compressed.pop(version, None)
+
+    @staticmethod
+    def _compress(node):
+        """Binary node -> [edge length, edge bits, action, child 0, child 1]."""
+        out = [0, 0, node[2], None, None]
+        for bit in (0, 1):
+            child, length, edge = node[bit], 1, bit
+            if child is None:
+                continue
+            while not child[2] and (child[0] is None) != (child[1] is None):
+                nxt = 0 if child[0] is not None else 1
+                child, length, edge = child[nxt], length + 1, (edge << 1) | nxt
+            compressed = CidrTrie._compress(child)
+            compressed[0], compressed[1] = length, edge
+            out[3 + bit] = compressed
+        return out
+
+    def match(self, version, value, width):
+        node = self._compressed.get(version)
+        if node is None:
+            node = self._compressed[version] = self._compress(self.roots[version])
+        found = node[2]
+        pos = 0
+        while pos < width:
+            node = node[3 + ((value >> (width - 1 - pos)) & 1)]
+            if node is None:
+                break
+            length = node[0]
+            pos += length
+            if pos > width or (value >> (width - pos)) & ((1 << length) - 1) != node[1]:
+                break
+            if node[2]:
+                found = node[2]
+        return found
+
+
+class DomainTrie:
+    """
+    Trie over reversed DNS labels (com -> example -> www). Each node holds
+    the action for the name itself and for names below it, so matching
+    costs one dict lookup per label; the deepest rule that applies wins.
+    """
+
+    def __init__(self):
+        # node: [children by label, action for this exact name, action for subdomains]
+        self.root = [{}, 0, 0]
+
+    def add(self, pattern, action):
+        """``example.com`` exact, ``*.example.com`` subdomains only, ``.example.com`` both."""
+        pattern = pattern.lower().rstrip('.')
+        exact = subs = False
+        if pattern.startswith("*."):
+            pattern, subs = pattern[2:], True
+        elif pattern.startswith("."):
+            pattern, exact, subs = pattern[1:], True, True
+        else:
+            exact = True
+        node = self.root
+        for label in reversed(pattern.split('.')):
+            node = node[0].setdefault(label, [{}, 0, 0])
+        if exact:
+            node[1] = max(node[1], action)
+        if subs:
+            node[2] = max(node[2], action)
+
+    def match(self, name):
+        labels = name.split('.')
+        node = self.root
+        found = 0
+        for i in range(len(labels) - 1, -1, -1):
+            # rules for subdomains of the name walked so far
+            if node[2]:
+                found = node[2]
+            node = node[0].get(labels[i])
+            if node is None:
+                return found
+        return node[1] or found
+
+
+def parse_ip(text):
+    """(4 or 6, integer value, bit width) for an IP literal, else (None, None, None)."""
+    try:
+        return 4, int.from_bytes(socket.inet_pton(socket.AF_INET, text), "big"), 32
+    except OSError:
+        pass
+    if ':' in text:
+        try:
+            return 6, int.from_bytes(socket.inet_pton(socket.AF_INET6, text), "big"), 128
+        except OSError:
+            pass
+    return None, None, None
+
+
+def host_of(line):
+    """
+    Host of one tool output line: a bare name, host:port, URL or the first
+    field of lines like ``sub.example.com [A] [1.2.3.4]``.
+    """
+    line = line.strip()
+    if not line:
+        return ""
+    host = line.split(None, 1)[0]
+    scheme = host.find("://")
+    if scheme != -1:
+        host = host[scheme + 3:]
+    for sep in "/?#":
+        cut = host.find(sep)
+        if cut != -1:
+            host = host[:cut]
+    host = host.rpartition('@')[2]
+    if host.startswith('['):
+        return host[1:host.find(']')].lower()
+    if host.count(':') == 1:
+        host = host.partition(':')[0]
+    return host.lower().rstrip('.')
+
+
+class Scope:
+    """
+    Include/exclude rules for hosts. A scope file has one rule per line:
+    a domain (``example.com``, ``*.example.com``, ``.example.com``), an IP
+    or a CIDR; ``!`` or ``-`` in front makes it an exclusion, ``#`` starts
+    a comment. The most specific matching rule decides, exclusions win
+    ties, and with no include rules everything not excluded is in scope.
+    """
+
+    def __init__(self, rules=()):
+        self.domains = DomainTrie()
+        self.networks = CidrTrie()
+        self.has_includes = False
+        for rule in rules:
+            self.add(rule)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, errors="replace") as f:
+            return cls(f)
+
+    def add(self, rule):
+        rule = rule.split('#', 1)[0].strip()
+        if not rule:
+            return
+        action = INCLUDE
+        if rule[0] in "!-":
+            action, rule = EXCLUDE, rule[1:].strip()
+        else:
+            self.has_includes = True
+        address = rule.partition('/')[0]
+        if parse_ip(address)[0] is not None:
+            self.networks.add(rule, action)
+        else:
+            self.domains.add(rule, action)
+
+    def action(self, host):
+        """INCLUDE, EXCLUDE or 0 (no rule) for a bare host name or IP."""
+        if host and (host[0].isdigit() or ':' in host):
+            version, value, width = parse_ip(host)
+            if version is not None:
+                return self.networks.match(version, value, width)
+        return self.domains.match(host)
+
+    def __contains__(self, host):
+        action = self.action(host)
+        return action == INCLUDE or (action == 0 and not self.has_includes)
+
+    def filter(self, lines, dropped=None):
+        """Yield the lines whose host is in scope; others go to ``dropped`` (a file) if given."""
+        for line in lines:
+            host = host_of(line)
+            if not host:
+                continue
+            if host in self:
+                yield line
+            elif dropped is not None:
+                dropped.write(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Scope filter for target streams, e.g. "
+                    "subfinder -d example.com -silent | scope.py filter scope.txt | httpx")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("filter", help="pass through only in-scope lines")
+    p.add_argument("scope", help="scope file")
+    p.add_argument("input", nargs="?", default="-", help="targets file (default stdin)")
+    p.add_argument("-o", "--output", help="write here instead of stdout")
+    p.add_argument("--dropped", help="also write out-of-scope lines to this file")
+    p = sub.add_parser("check", help="print in/out for each host")
+    p.add_argument("scope", help="scope file")
+    p.add_argument("hosts", nargs="+")
+    args = parser.parse_args(argv)
+
+    try:
+        scope = Scope.load(args.scope)
+    except (OSError, ValueError) as e:
+        print(f"[scope] cannot load {args.scope}: {e}", file=sys.stderr)
+        return 1
+
+    if args.command == "check":
+        for host in args.hosts:
+            print(f"{'in ' if host_of(host) in scope else 'out'}  {host}")
+        return 0
+
+    source = sys.stdin if args.input == "-" else open(args.input, errors="replace")
+    out = open(args.output + ".tmp", "w") if args.output else sys.stdout
+    dropped = open(args.dropped, "w") if args.dropped else None
+    kept = dropped_count = 0
+    try:
+        with source:
+            for line in source:
+                host = host_of(line)
+                if not host:
+                    continue
+                if host in scope:
+                    out.write(line if line.endswith("\n") else line + "\n")
+                    kept += 1
+                else:
+                    dropped_count += 1
+                    if dropped is not None:
+                        dropped.write(line)
+    except BrokenPipeError:
+        return 0
+    finally:
+        if dropped is not None:
+            dropped.close()
+        if args.output:
+            out.close()
+    if args.output:
+        os.replace(args.output + ".tmp", args.output)
+    print(f"[scope] {kept} in scope, {dropped_count} dropped", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+import os
+import sqlite3
+import time
+
+from job_log import JobLogReader
+from utils import app_data_dir
+
+# how much output a restored terminal shows; the rest stays in the job logs
+RESTORE_LINES = 2000
+
+
+class SessionStore:
+    """
+    The last session in SQLite: setup values, command history, and every
+    job with a pointer to its log. Each change is written as it happens,
+    so nothing needs saving at exit. Output is never copied in; a restore
+    reads only the tail of the logs it shows.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(app_data_dir(), "session.sqlite")
+        self.db = sqlite3.connect(self.path)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript("""
+            CREATE TABLE IF NOT EXISTS settings (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+            CREATE TABLE IF NOT EXISTS history (
+                id INTEGER PRIMARY KEY,
+                command TEXT NOT NULL,
+                at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS jobs (
+                id INTEGER PRIMARY KEY,
+                history_id INTEGER,
+                command TEXT NOT NULL,
+                log TEXT NOT NULL UNIQUE,
+                state TEXT NOT NULL,
+                started REAL NOT NULL,
+                finished REAL
+            );
+        """)
+        self.db.commit()
+
+    def close(self):
+        self.db.commit()
+        self.db.close()
+
+    def clear(self):
+        """Forget the session; job logs themselves are left alone."""
+        self.db.executescript("DELETE FROM settings; DELETE FROM history; DELETE FROM jobs;")
+        self.db.commit()
+
+    def settings(self):
+        return dict(self.db.execute("SELECT key, value FROM settings"))
+
+    def save_settings(self, **values):
+        self.db.executemany("INSERT OR REPLACE INTO settings VALUES (?, ?)",
+                            [(k, None if v is None else str(v)) for k, v in values.items()])
+        self.db.commit()
+
+    def add_history(self, command):
+        """Record a command line; returns its id for linking the jobs it starts."""
+        cur = self.db.execute("INSERT INTO history (command, at) VALUES (?, ?)", (command, time.time()))
+        self.db.commit()
+        return cur.lastrowid
+
+    def history(self):
+        return [row[0] for row in self.db.execute("SELECT command FROM history ORDER BY id")]
+
+    def add_job(self, command, log, history_id=None):
+        """Record a started job (a reattached one keeps its row); returns the job id."""
+        self.db.execute(
+            "INSERT OR IGNORE INTO jobs (history_id, command, log, state, started) VALUES (?, ?, ?, 'running', ?)",
+            (history_id, command, log, time.time()))
+        self.db.execute("UPDATE jobs SET state = 'running', finished = NULL WHERE log = ?", (log,))
+        self.db.commit()
+        return self.db.execute("SELECT id FROM jobs WHERE log = ?", (log,)).fetchone()[0]
+
+    def finish_job(self, job_id, state="done"):
+        self.db.execute("UPDATE jobs SET state = ?, finished = ? WHERE id = ?", (state, time.time(), job_id))
+        self.db.commit()
+
+    def jobs(self):
+        rows = self.db.execute("SELECT id, history_id, command, log, state FROM jobs ORDER BY id")
+        return [dict(id=r[0], history_id=r[1], command=r[2], log=r[3], state=r[4]) for r in rows]
+
+    def mark_interrupted(self, keep=()):
+        """Jobs still 'running' from a previous process died with it (unless in ``keep``, e.g. detached)."""
+        keep = set(keep)
+        for job in self.jobs():
+            if job["state"] == "running" and job["log"] not in keep:
+                self.finish_job(job["id"], state="interrupted")
+
+    def transcript(self, max_lines=RESTORE_LINES):
+        """
+        What the terminal showed, oldest first, trimmed to about
+        ``max_lines`` output lines: ("command", text) and ("output", lines,
+        lines_left_out) entries. Line counts come from the log indexes, so
+        only the tail that is shown gets decompressed. Returns (entries,
+        number of older commands left out).
+        """
+        jobs_by_history = {}
+        for job in self.jobs():
+            jobs_by_history.setdefault(job["history_id"], []).append(job)
+        entries = []
+        budget = max_lines
+        shown = 0
+        for history_id, command in self.db.execute("SELECT id, command FROM history ORDER BY id DESC"):
+            if budget <= 0:
+                break
+            for job in reversed(jobs_by_history.get(history_id, [])):
+                if job["state"] == "running":
+                    # a detached job still running replays its own output on reattach
+                    continue
+                reader = JobLogReader(job["log"])
+                total = reader.line_count
+                start = max(total - budget, 0)
+                budget -= total - start
+                entries.append(("output", reader.read_lines(start) if total > start else [], start))
+            entries.append(("command", command))
+            shown += 1
+        entries.reverse()
+        total_commands = self.db.execute("SELECT COUNT(*) FROM history").fetchone()[0]
+        return entries, total_commands - shown
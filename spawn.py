@@ -0,0 +1,260 @@
+import json
+import os
+import shlex
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import threading
+
+# anything the shell would interpret outside of quotes
+SHELL_METACHARS = set("|&;<>()$`*?[]{}~#\n\\!")
+
+
+def needs_shell(command: str) -> bool:
+    """True unless ``command`` is a plain program plus arguments (quotes allowed)."""
+    quote = None
+    for ch in command:
+        if quote == "'":
+            if ch == "'":
+                quote = None
+        elif quote == '"':
+            if ch == '"':
+                quote = None
+            elif ch in "$`\\!":
+                return True
+        elif ch in "'\"":
+            quote = ch
+        elif ch in SHELL_METACHARS:
+            return True
+    if quote is not None:
+        return True
+    first = command.split(None, 1)[0] if command.strip() else ""
+    # VAR=value cmd
+    return '=' in first
+
+
+def popen_args(command: str, cwd=None):
+    """
+    (args, shell) for subprocess.Popen: an argv with an absolute program
+    path when the command is simple, else the command string for /bin/sh.
+    A program given with a path (./tool, bin/tool) resolves against ``cwd``,
+    as the shell would; only bare names are looked up on $PATH.
+    """
+    if os.name != "posix" or needs_shell(command):
+        return command, True
+    try:
+        argv = shlex.split(command)
+    except ValueError:
+        return command, True
+    if not argv:
+        program = None
+    elif '/' in argv[0]:
+        program = os.path.join(cwd or os.getcwd(), argv[0])
+        if not (os.path.isfile(program) and os.access(program, os.X_OK)):
+            program = None
+    else:
+        program = shutil.which(argv[0])
+    if program is None:
+        # let the shell report "not found" (or run a builtin) as it always did
+        return command, True
+    return [program] + argv[1:], False
+
+
+def spawn(command, cwd=None, stdout=subprocess.PIPE, stderr=subprocess.STDOUT):
+    """
+    Start ``command`` in its own session. Simple commands are exec'd
+    directly (no /bin/sh, and no preexec_fn so CPython can use vfork);
+    pipelines and other shell syntax still go through the shell. With a
+    fork server running, the spawn happens there instead.
+    """
+    args, shell = popen_args(command, cwd)
+    server = ForkServer.running()
+    if server is not None and stdout is subprocess.PIPE and stderr is subprocess.STDOUT:
+        try:
+            return server.spawn(args, shell, cwd)
+        except OSError:
+            pass
+    return subprocess.Popen(args, shell=shell, cwd=cwd, stdout=stdout, stderr=stderr, start_new_session=True)
+
+
+class ForkedProcess:
+    """
+    Popen-like handle for a child of the fork server: pid, stdout, poll,
+    wait and signals. The exit status arrives from the server, on the
+    server's reader thread; add_exit_callback hears about it from there.
+    """
+
+    def __init__(self, pid, stdout):
+        self.pid = pid
+        self.stdout = stdout
+        self.returncode = None
+        self._exited = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks = []
+
+    def add_exit_callback(self, callback):
+        """Call ``callback()`` once the exit status is known (right away if it already is)."""
+        with self._lock:
+            if not self._exited.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def _set_exit(self, code):
+        with self._lock:
+            self.returncode = code
+            self._exited.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def poll(self):
+        return self.returncode
+
+    def wait(self, timeout=None):
+        if not self._exited.wait(timeout):
+            raise subprocess.TimeoutExpired(self.pid, timeout)
+        return self.returncode
+
+    def send_signal(self, sig):
+        if self.returncode is None:
+            os.kill(self.pid, sig)
+
+    def terminate(self):
+        self.send_signal(signal.SIGTERM)
+
+    def kill(self):
+        self.send_signal(signal.SIGKILL)
+
+
+def start_fork_server():
+    """
+    Start the fork server when HACKINGTOOL_FORKSERVER=1 and the kernel has
+    pidfds (its children are not ours, so SIGCHLD never reports them).
+    Call early, while this process is still small.
+    """
+    if os.environ.get("HACKINGTOOL_FORKSERVER") != "1" or not hasattr(os, "pidfd_open"):
+        return None
+    try:
+        os.close(os.pidfd_open(os.getpid()))
+        return ForkServer.start()
+    except OSError:
+        return None
+
+
+class ForkServer:
+    """
+    A small helper interpreter that spawns jobs on the GUI's behalf.
+    Forking a lean process costs the same however large the GUI grows;
+    the child's output pipe is handed back over a SOCK_SEQPACKET socket
+    (SCM_RIGHTS) and its exit status follows as a message.
+    """
+
+    _instance = None
+
+    @classmethod
+    def running(cls):
+        return cls._instance
+
+    @classmethod
+    def start(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        self.sock, child = socket.socketpair(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+        self.proc = subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), "serve", str(child.fileno())],
+            pass_fds=[child.fileno()], stdin=subprocess.DEVNULL, start_new_session=True)
+        child.close()
+        self._lock = threading.Lock()
+        self._next_id = 0
+        self._replies = {}
+        self._processes = {}
+        threading.Thread(target=self._reader, daemon=True).start()
+
+    def spawn(self, args, shell, cwd=None, timeout=10):
+        with self._lock:
+            self._next_id += 1
+            job_id = self._next_id
+            waiter = self._replies[job_id] = [threading.Event(), None]
+        request = {"id": job_id, "args": args, "shell": shell, "cwd": cwd}
+        self.sock.send(json.dumps(request).encode("utf-8"))
+        if not waiter[0].wait(timeout):
+            raise OSError("fork server did not answer")
+        reply = waiter[1]
+        if isinstance(reply, dict):
+            raise OSError(reply.get("message"))
+        return reply
+
+    def _reader(self):
+        while True:
+            try:
+                data, fds, _, _ = socket.recv_fds(self.sock, 65536, 1)
+            except OSError:
+                data, fds = b"", []
+            if not data:
+                break
+            message = json.loads(data)
+            job_id = message.get("id")
+            if message.get("type") == "exit":
+                process = self._processes.pop(job_id, None)
+                if process is not None:
+                    process._set_exit(message["code"])
+                continue
+            reply = message
+            if message.get("type") == "spawned":
+                reply = self._processes[job_id] = ForkedProcess(message["pid"], open(fds[0], "rb"))
+            waiter = self._replies.pop(job_id, None)
+            if waiter is not None:
+                # the process itself, or the error message
+                waiter[1] = reply
+                waiter[0].set()
+        # server gone: nothing more will be reported for its children
+        ForkServer._instance = None
+        for process in self._processes.values():
+            process._set_exit(-1)
+
+
+def serve(fd):
+    """Fork-server loop: spawn requests in, pipe fds and exit codes out."""
+    sock = socket.socket(fileno=fd)
+    send_lock = threading.Lock()
+
+    def send(message, fds=()):
+        with send_lock:
+            socket.send_fds(sock, [json.dumps(message).encode("utf-8")], list(fds))
+
+    def reap(job_id, proc):
+        send({"type": "exit", "id": job_id, "code": proc.wait()})
+
+    while True:
+        data = sock.recv(65536)
+        if not data:
+            return 0
+        request = json.loads(data)
+        job_id = request["id"]
+        read_fd, write_fd = os.pipe()
+        try:
+            proc = subprocess.Popen(request["args"], shell=request["shell"], cwd=request.get("cwd"),
+                                    stdin=subprocess.DEVNULL, stdout=write_fd, stderr=write_fd,
+                                    start_new_session=True)
+        except OSError as e:
+            os.close(read_fd)
+            send({"type": "error", "id": job_id, "message": str(e)})
+            continue
+        finally:
+            os.close(write_fd)
+        send({"type": "spawned", "id": job_id, "pid": proc.pid}, [read_fd])
+        os.close(read_fd)
+        threading.Thread(target=reap, args=(job_id, proc), daemon=True).start()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3 and sys.argv[1] == "serve":
+        sys.exit(serve(int(sys.argv[2])))
+    print("usage: spawn.py serve FD", file=sys.stderr)
+    sys.exit(2)
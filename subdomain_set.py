@@ -0,0 +1,164 @@
+import contextlib
+import json
+import os
+import sys
+import tempfile
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows: merges there are not serialized across processes
+    fcntl = None
+
+from extsort import external_sort
+
+
+def extract_name(line: str):
+    """Subdomain from a subfinder/dnsx output line (plain, -oJ or -json)."""
+    line = line.strip()
+    if not line or line.startswith('#'):
+        return None
+    if line.startswith('{'):
+        try:
+            line = json.loads(line).get("host", "")
+        except (ValueError, AttributeError):
+            return None
+    name = line.split()[0].lower().rstrip('.') if line.split() else ""
+    if name.startswith("*."):
+        name = name[2:]
+    return name or None
+
+
+class SubdomainSet:
+    """
+    Sorted, de-duplicated on-disk set of subdomains for one domain.
+
+    Every merge sorts the incoming names externally and streams them
+    against the existing names.txt into a new file, so memory stays flat
+    at any size. sources.json keeps, per source, how many names it
+    reported and how many of those were new to the set.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.names_path = os.path.join(directory, "names.txt")
+        self.meta_path = os.path.join(directory, "sources.json")
+        self.lock_path = os.path.join(directory, ".lock")
+        os.makedirs(directory, exist_ok=True)
+
+    def load_meta(self):
+        try:
+            with open(self.meta_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {"total": 0, "sources": {}}
+
+    def _save_meta(self, meta):
+        tmp = self.meta_path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(meta, f, indent=2, sort_keys=True)
+        os.replace(tmp, self.meta_path)
+
+    @contextlib.contextmanager
+    def _locked(self):
+        """Hold the set's lock; every preset merging into it runs its own process."""
+        with open(self.lock_path, "a") as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            yield
+
+    def iter_names(self):
+        if not os.path.exists(self.names_path):
+            return
+        with open(self.names_path, errors="replace") as f:
+            for line in f:
+                yield line.rstrip("\n")
+
+    def merge(self, source, names):
+        """Merge an iterable of names reported by ``source``; returns (seen, new)."""
+        incoming = external_sort((n for n in names if n), tmp_dir=self.directory)
+        with self._locked():
+            return self._merge_locked(source, incoming)
+
+    def _merge_locked(self, source, incoming):
+        existing = self.iter_names()
+        fd, tmp = tempfile.mkstemp(prefix="names_", suffix=".tmp", dir=self.directory)
+        seen = new = total = 0
+        try:
+            current = next(existing, None)
+            with os.fdopen(fd, "w") as out:
+                for name in incoming:
+                    seen += 1
+                    while current is not None and current < name:
+                        out.write(current + "\n")
+                        total += 1
+                        current = next(existing, None)
+                    if current == name:
+                        continue
+                    out.write(name + "\n")
+                    total += 1
+                    new += 1
+                while current is not None:
+                    out.write(current + "\n")
+                    total += 1
+                    current = next(existing, None)
+            os.replace(tmp, self.names_path)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(tmp)
+            raise
+        finally:
+            existing.close()
+
+        meta = self.load_meta()
+        stats = meta["sources"].setdefault(source, {"runs": 0, "seen": 0, "new": 0})
+        stats["runs"] += 1
+        stats["seen"] += seen
+        stats["new"] += new
+        stats["last_run"] = time.strftime("%Y-%m-%d %H:%M:%S")
+        meta["total"] = total
+        self._save_meta(meta)
+        return seen, new
+
+    def merge_files(self, source, paths):
+        def names():
+            for path in paths:
+                if not os.path.exists(path):
+                    continue
+                with open(path, errors="replace") as f:
+                    for line in f:
+                        name = extract_name(line)
+                        if name:
+                            yield name
+        return self.merge(source, names())
+
+
+def main(argv):
+    """
+    subdomain_set.py add DIR SOURCE FILE...   merge tool output into the set
+    subdomain_set.py export DIR               stream the union to stdout
+    subdomain_set.py stats DIR                per-source contribution
+    """
+    if len(argv) < 3 or argv[1] not in ("add", "export", "stats"):
+        print(main.__doc__.strip(), file=sys.stderr)
+        return 2
+    sset = SubdomainSet(argv[2])
+    if argv[1] == "add":
+        if len(argv) < 5:
+            print(main.__doc__.strip(), file=sys.stderr)
+            return 2
+        seen, new = sset.merge_files(argv[3], argv[4:])
+        print(f"[subdomains] {argv[3]}: {seen} names, {new} new, {sset.load_meta()['total']} total")
+    elif argv[1] == "export":
+        for name in sset.iter_names():
+            sys.stdout.write(name + "\n")
+    else:
+        meta = sset.load_meta()
+        print(f"total: {meta['total']}")
+        for source, st in sorted(meta["sources"].items(), key=lambda kv: -kv[1]["new"]):
+            print(f"{source:<24} runs={st['runs']} seen={st['seen']} new={st['new']} last={st.get('last_run', '')}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
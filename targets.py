@@ -0,0 +1,190 @@
+import hashlib
+import math
+import os
+import sys
+from urllib.parse import urlsplit
+
+from extsort import external_sort
+
+DEFAULT_PORTS = {"http": "80", "https": "443"}
+# memory for normalize's Bloom filters (the current and the previous generation)
+DEFAULT_FILTER_MB = 64
+
+
+def normalize_target(line: str, strip_scheme: bool = False):
+    """
+    Canonical form of a host or URL: lower-cased punycode host, no default
+    port, no trailing slash or fragment. Returns None for blank/comment lines.
+    With ``strip_scheme`` the scheme is dropped (httpx picks it itself).
+    """
+    line = line.strip()
+    if not line or line.startswith('#'):
+        return None
+    has_scheme = "://" in line
+    parts = urlsplit(line if has_scheme else "//" + line)
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").rstrip('.')
+    if host.startswith("*."):
+        host = host[2:]
+    if not host:
+        return None
+    try:
+        host = host.encode("idna").decode("ascii")
+    except UnicodeError:
+        pass
+    host = host.lower()
+    if ':' in host:
+        host = f"[{host}]"
+    try:
+        port = parts.port
+    except ValueError:
+        return None
+    if port is not None and DEFAULT_PORTS.get(scheme) != str(port):
+        host = f"{host}:{port}"
+    path = parts.path.rstrip('/')
+    if parts.query:
+        path += '?' + parts.query
+    if has_scheme and scheme and not strip_scheme:
+        return f"{scheme}://{host}{path}"
+    return host + path
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter; memory is set by capacity and error rate."""
+
+    def __init__(self, capacity: int, error_rate: float = 1e-6):
+        bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.size = bits
+        self.hashes = max(1, round(bits / capacity * math.log(2)))
+        self.bits = bytearray((bits + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, item: str) -> bool:
+        """Add item; return True if it was (probably) already present."""
+        present = True
+        for pos in self._positions(item):
+            byte, bit = divmod(pos, 8)
+            if not self.bits[byte] & (1 << bit):
+                present = False
+                self.bits[byte] |= 1 << bit
+        return present
+
+    def __contains__(self, item: str) -> bool:
+        for pos in self._positions(item):
+            byte, bit = divmod(pos, 8)
+            if not self.bits[byte] & (1 << bit):
+                return False
+        return True
+
+
+class StreamDeduper:
+    """
+    Exact de-duplication while the distinct count is small, then a Bloom
+    filter, so memory stays bounded however long the stream is. The filter
+    is only allocated once the exact set reaches ``exact_limit``. When it
+    has taken ``capacity`` names a fresh one starts and the full one is
+    kept for lookups only; the generation before that is forgotten. A
+    repeat that far back may then pass again, but the error rate never
+    climbs past what the filter was sized for.
+    """
+
+    def __init__(self, capacity: int = 10_000_000, exact_limit: int = 1_000_000, error_rate: float = 1e-6):
+        self.exact = set()
+        self.exact_limit = exact_limit
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.bloom = None
+        self.previous = None
+        self._in_bloom = 0
+
+    def is_new(self, item: str) -> bool:
+        if self.exact is not None:
+            if item in self.exact:
+                return False
+            self.exact.add(item)
+            if len(self.exact) >= self.exact_limit:
+                self.bloom = BloomFilter(self.capacity, self.error_rate)
+                for seen in self.exact:
+                    self.bloom.add(seen)
+                self._in_bloom = len(self.exact)
+                self.exact = None
+            return True
+        if self.previous is not None and item in self.previous:
+            return False
+        if self.bloom.add(item):
+            return False
+        self._in_bloom += 1
+        if self._in_bloom >= self.capacity:
+            self.previous = self.bloom
+            self.bloom = BloomFilter(self.capacity, self.error_rate)
+            self._in_bloom = 0
+        return True
+
+
+def bloom_capacity(memory_bytes: int, error_rate: float = 1e-6) -> int:
+    """How many items a BloomFilter of ``memory_bytes`` holds at ``error_rate``."""
+    return max(1, int(memory_bytes * 8 * math.log(2) ** 2 / -math.log(error_rate)))
+
+
+def normalized_targets(lines, strip_scheme: bool = False, capacity: int = 10_000_000):
+    """Yield each canonical target once, in input order."""
+    dedupe = StreamDeduper(capacity)
+    for line in lines:
+        target = normalize_target(line, strip_scheme)
+        if target is not None and dedupe.is_new(target):
+            yield target
+
+
+def main(argv):
+    """
+    targets.py normalize [--strip-scheme] [--filter-mb N] FILE|-
+    Write the normalized, de-duplicated targets to stdout, in input order.
+    The Bloom filters get N MB (default 64). A file with more targets than
+    they hold is de-duplicated exactly by an external sort instead, and
+    comes out sorted.
+    """
+    args = argv[1:]
+    strip_scheme = "--strip-scheme" in args
+    args = [a for a in args if a != "--strip-scheme"]
+    filter_mb = DEFAULT_FILTER_MB
+    if "--filter-mb" in args:
+        i = args.index("--filter-mb")
+        try:
+            filter_mb = int(args[i + 1])
+        except (IndexError, ValueError):
+            filter_mb = 0
+        del args[i:i + 2]
+    if len(args) != 2 or args[0] != "normalize" or filter_mb < 1:
+        print(main.__doc__.strip(), file=sys.stderr)
+        return 2
+    src = args[1]
+    # each of the two live generations gets half the budget
+    capacity = bloom_capacity(filter_mb * 1024 * 1024 // 2)
+    if src == "-":
+        stream, oversized = sys.stdin, False
+    else:
+        stream = open(src, errors="replace")
+        # assume ~16 bytes per target to tell whether the list outgrows the filters
+        oversized = os.path.getsize(src) // 16 > capacity
+    kept = 0
+    with stream:
+        if oversized:
+            targets = external_sort(t for t in (normalize_target(line, strip_scheme) for line in stream)
+                                    if t is not None)
+        else:
+            targets = normalized_targets(stream, strip_scheme, capacity)
+        for target in targets:
+            sys.stdout.write(target + "\n")
+            kept += 1
+    print(f"[normalize] {kept} unique targets", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -2,8 +2,8 @@ import sys
 import signal
 import platform
 import os
-import html
 import subprocess
+import shutil
 import re
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
@@ -11,24 +11,61 @@ from PyQt6.QtWidgets import (
     QDialog, QLineEdit, QFileDialog, QMessageBox , QTextEdit,
     QLabel, QPlainTextEdit,QApplication
 )
-from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QPoint
+from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QPoint, QTimer
 from PyQt6.QtGui import QTextCursor, QGuiApplication
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import pyqtSignal
 from command_worker import CommandWorker
-from utils import ANSI_SGR_COLORS, ansi_to_html
+from process_engine import ProcessJob
+from job_log import new_job_log_path
+from background import BackgroundTask
+from nuclei_index import TemplateIndex
+from tool_versions import probe_all
+from presets import PresetCommands
+from nuclei_shard import plan_shards, merge_findings
+from remote import RemoteJob, parse_agent
+from scope import Scope, host_of
+from detached_job import DetachedJob
+import jobd
+from scheduler import JobScheduler
+from progress import parse_progress
+from job_status import JobStatusPanel
+from utils import DEFAULT_STYLE, output_ops
+from ansi_style import StyleCache
+from output_view import OutputView
+from output_queue import OutputQueue
 from setup_dialog import InitialSetupDialog
+from session import SessionStore
 
-class ModernDarkTerminalApp(QMainWindow):
+# how often a hidden or minimized window checks whether it is back on screen
+HIDDEN_POLL_MS = 250
+
+class ModernDarkTerminalApp(PresetCommands, QMainWindow):
     def __init__(self):
         self.nuclei_templates_path = os.path.expanduser("~/nuclei-templates")
         self._last_was_output_line = False
+        self.styles = StyleCache()
+        self._ansi_style = DEFAULT_STYLE
         super().__init__()
+        # output waits here for the next display frame; while the window is
+        # hidden only the newest 256 KiB of job output are kept (the rest is
+        # in the job logs)
+        self.render_queue = OutputQueue(max_bytes=256 * 1024)
+        self.render_timer = QTimer(self)
+        self.render_timer.setSingleShot(True)
+        self.render_timer.timeout.connect(self.on_render_tick)
+
+        self.session = SessionStore()
+        res = self.session.settings()
+        if not res.get("domain") or "--new-session" in sys.argv:
+            setup = InitialSetupDialog(self)
+            if setup.exec() != QDialog.DialogCode.Accepted:
+                sys.exit(0)
+            res = setup.result
+            self.session.clear()
+            self.session.save_settings(**res)
+        else:
+            self.nuclei_templates_path = res.get("nuclei_templates_path") or self.nuclei_templates_path
 
-        setup = InitialSetupDialog(self)
-        if setup.exec() != QDialog.DialogCode.Accepted:
-            sys.exit(0)
-
-        res = setup.result
         self.domain = res["domain"]
         self.wordlist_path = res["wordlist"]
         self.output_dir = res["output_dir"]
@@ -146,7 +183,12 @@ class ModernDarkTerminalApp(QMainWindow):
         """)
         self.terminal.setReadOnly(False)
         self.terminal.installEventFilter(self)
+        self.output_view = OutputView()
+        self.output_view.hide()
+        self.main_layout_content.addWidget(self.output_view)
         self.main_layout_content.addWidget(self.terminal)
+        self.job_status = JobStatusPanel()
+        self.main_layout_content.addWidget(self.job_status)
         self.button_bar_frame = QFrame()
         self.button_bar_frame.setFixedHeight(56)
         self.button_bar_frame.setStyleSheet("background-color: #1B1B2B;")
@@ -158,9 +200,16 @@ class ModernDarkTerminalApp(QMainWindow):
         btn_clear = QPushButton("Clear")
         btn_copy = QPushButton("Copy")
         btn_change_wordlist = QPushButton("Change Wordlist")
+        btn_scope = QPushButton("Set Scope File")
         btn_back_menu = QPushButton("Back")
-
-        for b in (btn_clear, btn_copy, btn_change_wordlist, btn_back_menu):
+        btn_output_view = QPushButton("Fast Output View")
+        btn_output_view.setCheckable(True)
+        self.btn_detached = QPushButton("Detached Jobs")
+        self.btn_detached.setCheckable(True)
+        self.btn_detached.setEnabled(jobd.is_supported())
+
+        for b in (btn_clear, btn_copy, btn_change_wordlist, btn_scope, btn_back_menu, btn_output_view,
+                  self.btn_detached):
             b.setFixedHeight(40)
             b.setStyleSheet("""
                 QPushButton {
@@ -179,10 +228,13 @@ class ModernDarkTerminalApp(QMainWindow):
 
         button_bar_layout.addStretch()
 
-        btn_clear.clicked.connect(lambda: (self.terminal.clear(), self.show_prompt()))
+        btn_clear.clicked.connect(lambda: (self.terminal.clear(), self.output_view.clear(), self.show_prompt()))
         btn_copy.clicked.connect(lambda: QApplication.clipboard().setText(self.terminal.toPlainText()))
         btn_back_menu.clicked.connect(self.back_to_main)
         btn_change_wordlist.clicked.connect(self.change_wordlist)
+        btn_scope.clicked.connect(self.change_scope_file)
+        btn_output_view.toggled.connect(self.toggle_output_view)
+        self.btn_detached.toggled.connect(self.toggle_detached_mode)
 
         self.main_layout_content.addWidget(self.button_bar_frame)
 
@@ -199,10 +251,26 @@ class ModernDarkTerminalApp(QMainWindow):
         self.process = None
         self.history = []
         self.history_index = -1
+        self.jobs = []
+        self.scheduler = JobScheduler(parent=self)
+        self.nuclei_shards = 1
+        self.agents = []
+        self.detached_mode = False
+        self.delta_mode = False
         self.username = os.getlogin() if hasattr(os, "getlogin") else "user"
         self.cwd = os.getcwd()
+        self.template_index = None
+        self.template_index_ready = False
+        self.tool_info = {}
+        self.scope_path = None
+        self.scope = None
+        self._history_id = None
+        self.restore_session()
         self.show_prompt()
-        
+        self.start_template_indexing()
+        self.start_tool_probe()
+        self.reattach_detached_jobs()
+
     def change_wordlist(self):
         """
         Let the user pick a new wordlist file and update self.wordlist_path.
@@ -216,10 +284,297 @@ class ModernDarkTerminalApp(QMainWindow):
             QMessageBox.warning(self, "Invalid File", "Selected file does not exist.")
             return
         self.wordlist_path = path
+        self.save_session_settings()
         self.terminal.append("")
         self.terminal.insertPlainText(f"[info] wordlist updated: {self.wordlist_path}\n")
         QMessageBox.information(self, "Wordlist Updated", f"New wordlist set to:\n{self.wordlist_path}")
 
+    def change_scope_file(self):
+        """
+        Pick a scope file (domains, *.wildcards, IPs/CIDRs, ! for exclusions).
+        Presets then filter targets through it between stages.
+        """
+        path, _ = QFileDialog.getOpenFileName(self, "Select scope file", "", "Text Files (*.txt);;All Files (*)")
+        if path:
+            self.set_scope(path)
+
+    def set_scope(self, path):
+        try:
+            scope = Scope.load(path)
+        except (OSError, ValueError) as e:
+            QMessageBox.warning(self, "Invalid Scope", f"Cannot use {path}:\n{e}")
+            return
+        self.scope_path = path
+        self.scope = scope
+        self.save_session_settings()
+        self.handle_output(f"[info] scope: {path}\n")
+
+    def run_scope_command(self, cmd_parts):
+        """
+        scope                 show the scope file in use
+        scope set FILE        use FILE as the scope
+        scope clear           stop filtering by scope
+        scope check HOST...   say whether each host is in scope
+        """
+        action = cmd_parts[1] if len(cmd_parts) > 1 else "show"
+        if action == "set" and len(cmd_parts) > 2:
+            self.set_scope(os.path.abspath(os.path.join(self.cwd, cmd_parts[2])))
+        elif action == "clear":
+            self.scope_path = None
+            self.scope = None
+            self.save_session_settings()
+            self.handle_output("[info] scope cleared\n")
+        elif action == "check" and len(cmd_parts) > 2:
+            if self.scope is None:
+                self.handle_output("[info] no scope set: everything is in scope\n")
+                return
+            lines = [f"{'in ' if host_of(h) in self.scope else 'out'}  {h}" for h in cmd_parts[2:]]
+            self.handle_output('\n'.join(lines) + "\n")
+        elif action == "show":
+            self.handle_output(f"[info] scope: {self.scope_path}\n" if self.scope_path else "[info] no scope set\n")
+        else:
+            self.handle_output("[Error] usage: scope [set FILE | clear | check HOST...]\n")
+
+    def run_session_command(self, cmd_parts):
+        """
+        session          where the session is kept
+        session clear    forget it: the next start asks for setup again
+        """
+        action = cmd_parts[1] if len(cmd_parts) > 1 else "show"
+        if action == "clear":
+            self.session.clear()
+            self.history = []
+            self.history_index = 0
+            self._history_id = None
+            self.handle_output("[info] session cleared; job logs are kept\n")
+        elif action == "show":
+            self.handle_output(f"[info] session: {self.session.path} ({len(self.history)} commands, "
+                               f"{len(self.jobs)} jobs)\n")
+        else:
+            self.handle_output("[Error] usage: session [clear]\n")
+
+    def create_job(self, command, agent=None, inputs=(), outputs=(), template_lists=()):
+        """
+        Build a job for ``command`` wired to the terminal and a job log.
+        On POSIX jobs run on the single-threaded ProcessMultiplexer; Windows
+        keeps the thread-per-command CommandWorker. With ``agent`` the job
+        runs on a remote agent, shipping ``inputs`` (``template_lists`` among
+        them relative to the templates path) and fetching ``outputs``;
+        in detached mode the job daemon owns the process.
+        """
+        log_path = new_job_log_path(command)
+        self.jobs.append({"command": command, "log": log_path,
+                          "sid": self.session.add_job(command, log_path, self._history_id)})
+        if agent is not None:
+            worker = RemoteJob(command, agent, inputs, outputs, cwd=self.output_dir, log_path=log_path,
+                               template_lists=template_lists, templates_root=self.nuclei_templates_path)
+        elif self.detached_mode:
+            worker = DetachedJob(command, cwd=self.output_dir, log_path=log_path)
+        else:
+            job_class = CommandWorker if platform.system() == "Windows" else ProcessJob
+            worker = job_class(command, cwd=self.output_dir, log_path=log_path)
+        return self.track_job(worker, command)
+
+    def track_job(self, worker, command):
+        key = len(self.jobs)
+        worker.output_signal.connect(lambda chunk, k=key, c=command: self.on_job_output(k, c, chunk))
+        worker.finished_signal.connect(lambda k=key: self.job_status.finish(k))
+        worker.finished_signal.connect(lambda k=key: self.session.finish_job(self.jobs[k - 1]["sid"]))
+        return worker
+
+    def toggle_detached_mode(self, enabled):
+        """Run new jobs under the job daemon so they survive closing the GUI."""
+        if enabled and not jobd.start_daemon():
+            self.handle_output("[Error] could not start the job daemon\n")
+            self.btn_detached.setChecked(False)
+            return
+        self.detached_mode = enabled
+        self.terminal.setFocus()
+
+    def reattach_detached_jobs(self):
+        """
+        Reconnect to a job daemon left running by an earlier session and
+        replay the output of its jobs that no GUI has seen yet.
+        """
+        if self._detached_jobs is None:
+            return
+        self.btn_detached.setChecked(True)
+        pending = [job for job in self._detached_jobs if job["running"] or job["pending"]]
+        if not pending:
+            return
+        self.handle_output(f"[info] reattaching to {len(pending)} detached job(s)\n")
+        for job in pending:
+            self.jobs.append({"command": job["command"], "log": job["log"],
+                              "sid": self.session.add_job(job["command"], job["log"])})
+            worker = DetachedJob(job["command"], log_path=job["log"], job_id=job["id"])
+            self.scheduler.submit(self.track_job(worker, job["command"]))
+        self.current_worker = self.scheduler
+
+    def list_detached_jobs(self):
+        """Jobs of a job daemon left running by an earlier session, or None if there is none."""
+        if not jobd.is_supported() or not jobd.daemon_running():
+            return None
+        try:
+            return jobd.list_jobs()
+        except OSError:
+            return None
+
+    def restore_session(self):
+        """
+        Bring back the last session: history, the job list and the tail of
+        its output, read from the job logs the session points at. Jobs the
+        old process was running died with it unless the job daemon has them.
+        """
+        scope_path = self.session.settings().get("scope_path")
+        if scope_path and os.path.isfile(scope_path):
+            try:
+                self.scope, self.scope_path = Scope.load(scope_path), scope_path
+            except (OSError, ValueError):
+                pass
+        self._detached_jobs = self.list_detached_jobs()
+        self.session.mark_interrupted(keep=[job["log"] for job in self._detached_jobs or ()])
+        self.history = self.session.history()
+        self.history_index = len(self.history)
+        self.jobs = [{"command": job["command"], "log": job["log"], "sid": job["id"]}
+                     for job in self.session.jobs()]
+        entries, older = self.session.transcript()
+        if not entries:
+            return
+        cursor = self.terminal.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        dim = self.styles.format(("#A6A6A6", None, False))
+        if older:
+            cursor.insertText(f"[session] {older} older command(s) not shown; see 'history' and 'jobs'\n", dim)
+        for entry in entries:
+            if entry[0] == "command":
+                cursor.insertText(f"$ {entry[1]}\n", dim)
+                continue
+            _, lines, left_out = entry
+            if left_out:
+                cursor.insertText(f"[session] {left_out} earlier line(s) left in the job log\n", dim)
+            style = DEFAULT_STYLE
+            for line in lines:
+                # a progress line rewritten in place: keep its final state
+                style = self.styles.insert(cursor, line.rstrip('\r').rsplit('\r', 1)[-1], style)
+                cursor.insertText('\n', self.styles.format(DEFAULT_STYLE))
+        cursor.insertText("[session] restored\n", dim)
+        self.terminal.setTextCursor(cursor)
+        from_bottom = int(self.session.settings().get("scroll") or 0)
+        bar = self.terminal.verticalScrollBar()
+        QTimer.singleShot(0, lambda: bar.setValue(max(bar.maximum() - from_bottom, 0)))
+
+    def save_session_settings(self):
+        bar = self.terminal.verticalScrollBar()
+        self.session.save_settings(
+            domain=self.domain, wordlist=self.wordlist_path, output_dir=self.output_dir,
+            output_name=self.output_filename, nuclei_templates_path=self.nuclei_templates_path,
+            scope_path=self.scope_path, scroll=bar.maximum() - bar.value())
+
+    def closeEvent(self, event):
+        # after 'session clear' there is nothing to update: the next start asks again
+        if self.session.settings():
+            self.save_session_settings()
+        self.session.close()
+        super().closeEvent(event)
+
+    def on_job_output(self, key, command, chunk):
+        """
+        Progress lines (ffuf, nuclei -stats) go to the job's status row;
+        everything else is rendered as terminal text.
+        """
+        fields = parse_progress(chunk)
+        if fields is not None:
+            self.job_status.update_progress(key, f"#{key} {fields['tool']}", fields)
+            return
+        self.handle_output(chunk, logged=True)
+
+    def run_sharded(self, command):
+        """
+        shard N [--targets] nuclei ... [ ; nuclei ...]
+        Split the nuclei template set (or -l target list) into N shards, run
+        them through the scheduler and merge their -o files, dropping
+        duplicate (template-id, matched-at) findings. Shards are spread
+        round-robin over this machine and any registered agents. Several
+        ';'-separated nuclei commands (a batch of presets) share one group.
+        """
+        m = re.match(r'\s*shard\s+(\d+)\s+(--targets\s+)?(.+)$', command)
+        if not m:
+            self.handle_output("[Error] usage: shard N [--targets] nuclei ... [ ; nuclei ...]\n")
+            self.show_prompt()
+            return
+        n = int(m.group(1))
+        by = "targets" if m.group(2) else "templates"
+        plans = []
+        try:
+            for nuclei_cmd in re.split(r'\s;\s', m.group(3)):
+                plans.append(plan_shards(nuclei_cmd, n, by=by, scope=self.scope))
+        except (ValueError, OSError) as e:
+            self.handle_output(f"[Error] {e}\n")
+            self.show_prompt()
+            return
+
+        hosts = [None] + self.agents
+        shards = [shard for commands, inputs, outputs, _ in plans for shard in zip(commands, inputs, outputs)]
+        self.handle_output(f"[info] running {len(shards)} nuclei shards (by {by}) on {len(hosts)} host(s)\n")
+        workers = []
+        for i, (c, shard_in, shard_out) in enumerate(shards):
+            agent = hosts[i % len(hosts)]
+            template_lists = [shard_in] if by == "templates" else []
+            workers.append(self.create_job(c, agent, [shard_in], [shard_out], template_lists))
+        self.current_worker = self.scheduler
+        group = self.scheduler.submit_group(workers)
+
+        def on_done():
+            for _, _, outputs, merged in plans:
+                try:
+                    written, dupes = merge_findings(outputs, merged)
+                    self.handle_output(f"[info] merged {written} findings into {merged} ({dupes} duplicates dropped)\n")
+                    # plan_shards made this run its own directory; nothing else reads it
+                    shutil.rmtree(os.path.dirname(outputs[0]), ignore_errors=True)
+                except OSError as e:
+                    self.handle_output(f"[Error] merge failed: {e}\n")
+            self.show_prompt()
+
+        group.finished_signal.connect(on_done)
+
+    def run_agents_command(self, cmd_parts):
+        """
+        agents                      list registered agents
+        agents add HOST:PORT[/TOKEN] register one (token defaults to $HACKINGTOOL_AGENT_TOKEN)
+        agents clear                forget all agents
+        """
+        action = cmd_parts[1] if len(cmd_parts) > 1 else "list"
+        if action == "add" and len(cmd_parts) > 2:
+            try:
+                host, port, token = parse_agent(cmd_parts[2])
+            except ValueError:
+                self.handle_output("[Error] usage: agents add HOST:PORT[/TOKEN]\n")
+                return
+            token = token or os.environ.get("HACKINGTOOL_AGENT_TOKEN", "")
+            self.agents.append((host, port, token))
+            self.handle_output(f"[info] agent {host}:{port} added ({len(self.agents)} registered)\n")
+        elif action == "clear":
+            self.agents = []
+            self.handle_output("[info] agents cleared\n")
+        elif action == "list":
+            lines = [f"{i}  {host}:{port}" for i, (host, port, _) in enumerate(self.agents, start=1)]
+            self.handle_output('\n'.join(lines) + "\n" if lines else "[info] no agents registered\n")
+        else:
+            self.handle_output("[Error] usage: agents [add HOST:PORT[/TOKEN] | clear]\n")
+
+    def toggle_delta_mode(self, enabled):
+        self.delta_mode = enabled
+
+    def toggle_output_view(self, enabled):
+        """
+        Route command output to the virtualized OutputView, leaving the
+        QTextEdit as a small prompt/input area.
+        """
+        self.flush_output()
+        self.output_view.setVisible(enabled)
+        self.terminal.setMaximumHeight(160 if enabled else 16777215)
+        self.terminal.setFocus()
+
     def add_main_buttons(self):
         for i in reversed(range(self.scroll_layout.count())):
             widget = self.scroll_layout.itemAt(i).widget()
@@ -262,36 +617,44 @@ class ModernDarkTerminalApp(QMainWindow):
         self.sidebar_expanded = not self.sidebar_expanded
 
     def show_prompt(self):
-        """Append a prompt line using HTML so colors/formatting can be used."""
+        """Append a colored prompt line, inserted as formatted text runs."""
+        self.flush_output()
         self.cwd = os.getcwd()
-        prompt = f'<span style="color:#9EA7FF;font-weight:600;">{html.escape(self.username)}</span>' \
-                f'@<span style="color:#7B61FF;font-weight:600;">{html.escape(self.domain)}</span>:' \
-                f'<span style="color:#A6A6A6;">{html.escape(self.cwd)}</span>$ '
         self.terminal.moveCursor(QTextCursor.MoveOperation.End)
-        self.terminal.insertHtml(prompt)
-        self.terminal.insertPlainText('')
+        cursor = self.terminal.textCursor()
+        plain = self.styles.format(DEFAULT_STYLE)
+        cursor.insertText(self.username, self.styles.format(("#9EA7FF", None, True)))
+        cursor.insertText("@", plain)
+        cursor.insertText(self.domain, self.styles.format(("#7B61FF", None, True)))
+        cursor.insertText(":", plain)
+        cursor.insertText(self.cwd, self.styles.format(("#A6A6A6", None, False)))
+        cursor.insertText("$ ", plain)
+        self.terminal.setTextCursor(cursor)
         self.terminal.moveCursor(QTextCursor.MoveOperation.End)
-        
+
         self._last_was_output_line = False
-        
+        self._ansi_style = DEFAULT_STYLE
+
+    def select_after_prompt(self, cursor):
+        """
+        Select the text after the prompt's '$' on the last line (or the
+        whole line when it has no prompt). Returns True if a prompt was found.
+        """
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        block = cursor.block()
+        idx = block.text().rfind('$')
+        cursor.setPosition(block.position() + (idx + 1 if idx >= 0 else 0))
+        cursor.movePosition(QTextCursor.MoveOperation.EndOfBlock, QTextCursor.MoveMode.KeepAnchor)
+        return idx >= 0
+
     def replace_current_line(self, text):
         """
         Replace current input area (last block) with the provided text (keeps prompt).
-        Works by selecting the last block and replacing it.
         """
+        self.flush_output()
         cursor = self.terminal.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.End)
-        cursor.select(QTextCursor.SelectionType.BlockUnderCursor)
-        block_text = cursor.selectedText()
-        if '$' in block_text:
-            idx = block_text.rfind('$')
-            prompt_part = block_text[:idx+1]
-            new_block = html.escape(prompt_part) + ' ' + html.escape(text)
-            cursor.removeSelectedText()
-            cursor.insertHtml(new_block)
-        else:
-            cursor.removeSelectedText()
-            cursor.insertHtml(html.escape(text))
+        has_prompt = self.select_after_prompt(cursor)
+        cursor.insertText((' ' if has_prompt else '') + text, self.styles.format(DEFAULT_STYLE))
         self.terminal.setTextCursor(cursor)
         self.terminal.moveCursor(QTextCursor.MoveOperation.End)
 
@@ -313,6 +676,7 @@ class ModernDarkTerminalApp(QMainWindow):
                 if command:
                     self.history.append(command)
                     self.history_index = len(self.history)
+                    self._history_id = self.session.add_history(command)
 
                     cmd_parts = command.strip().split()
                     cmd_base = cmd_parts[0].lower()
@@ -346,12 +710,27 @@ class ModernDarkTerminalApp(QMainWindow):
                     elif cmd_base == "echo":
                         self.handle_output(' '.join(cmd_parts[1:]))
                         self.show_prompt()
+                    elif cmd_base == "jobs":
+                        lines = [f"{i}  {job['command']}  ->  {job['log']}" for i, job in enumerate(self.jobs, start=1)]
+                        self.handle_output('\n'.join(lines) if lines else "[info] no jobs yet")
+                        self.show_prompt()
+                    elif cmd_base == "agents":
+                        self.run_agents_command(cmd_parts)
+                        self.show_prompt()
+                    elif cmd_base == "scope":
+                        self.run_scope_command(cmd_parts)
+                        self.show_prompt()
+                    elif cmd_base == "session":
+                        self.run_session_command(cmd_parts)
+                        self.show_prompt()
+                    elif cmd_base == "shard":
+                        self.terminal.append("")
+                        self.run_sharded(command)
                     elif cmd_base == "exit":
                         self.close()
                     else:
                         self.terminal.append("")
-                        self.current_worker = CommandWorker(command, cwd=self.output_dir)
-                        self.current_worker.output_signal.connect(self.handle_output)
+                        self.current_worker = self.create_job(self.apply_scope_lists(command))
                         self.current_worker.finished_signal.connect(self.show_prompt)
                         self.current_worker.start()
                 return True
@@ -368,10 +747,12 @@ class ModernDarkTerminalApp(QMainWindow):
                     self.terminal.copy()
                 else:
                     worker = getattr(self, "current_worker", None)
-                    if worker is not None and isinstance(worker, QThread):
+                    if worker is not None and (hasattr(worker, "interrupt") or hasattr(worker, "interrupt_all")):
                         try:
                             if hasattr(worker, "interrupt"):
                                 worker.interrupt()
+                            elif hasattr(worker, "interrupt_all"):
+                                worker.interrupt_all()
                         except Exception:
                             pass
                     else:
@@ -400,119 +781,113 @@ class ModernDarkTerminalApp(QMainWindow):
         return False
 
 
-    def handle_output(self, raw_text):
+    def handle_output(self, raw_text, logged=False):
+        """
+        Queue output for the terminal. Whatever arrives within one display
+        frame is rendered together by flush_output, and nothing is rendered
+        while the window is minimized, hidden or covered. Only ``logged``
+        output (a job's, kept in its job log) may be skipped when too much
+        piles up; builtin command output is always shown.
+        """
+        if raw_text is None:
+            return
+        self.render_queue.push(raw_text, droppable=logged)
+        if not self.render_timer.isActive():
+            self.render_timer.start(self.frame_interval())
+
+    def frame_interval(self):
+        """Milliseconds per frame of the screen the window is on."""
+        screen = self.screen()
+        rate = screen.refreshRate() if screen is not None else 0
+        return max(1, int(1000 / rate)) if rate > 0 else 16
+
+    def rendering_suspended(self):
+        if self.isMinimized() or not self.isVisible():
+            return True
+        window = self.windowHandle()
+        return window is not None and not window.isExposed()
+
+    def on_render_tick(self):
+        if self.rendering_suspended():
+            # keep buffering; the first tick back on screen catches up in one step
+            self.render_timer.start(HIDDEN_POLL_MS)
+            return
+        self.flush_output()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == event.Type.WindowStateChange and not self.isMinimized() and self.render_queue.lag_bytes:
+            self.render_timer.start(0)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.render_queue.lag_bytes:
+            self.render_timer.start(0)
+
+    def flush_output(self):
+        """Render everything queued now, e.g. before a prompt must follow it."""
+        self.render_timer.stop()
+        text = ''.join(self.render_queue.drain())
+        if not text:
+            return
+        if self.output_view.isVisible():
+            self.output_view.handle_output(text)
+            return
+        self.render_output(text)
+
+    def render_output(self, raw_text):
         """
         Robust output handler:
         - '\n' -> append new output line (never overwrite previous lines)
         - '\r' -> update last output line (or update text after prompt if prompt is present)
         - '\x1b[2K' -> clear last output line
-        - other ANSI escapes (colors) are stripped here to avoid raw escape printing;
-            if you want colors later we can add safe html-rendering.
+        - SGR color sequences are rendered as formatted text runs; other
+            ANSI escapes are stripped to avoid raw escape printing.
         Uses self._last_was_output_line to know whether last block is an output line or a prompt.
+        All edits share one cursor and one edit block, and the view is
+        scrolled to the end once, so a whole frame costs a single relayout.
         """
-        if raw_text is None:
-            return
-
-        text = raw_text.replace('\t', '    ')
-
-        def strip_ansi_except_controls(s):
-            return re.sub(r'\x1b\[[0-9;]*[A-Za-z]', '', s)
-
-        text = text.replace('\x1b[2K', '[ESC_CLEAR_LINE]')
-
-        parts = re.split(r'(\r|\n|\[ESC_CLEAR_LINE\])', text)
+        cur = self.terminal.textCursor()
+        cur.beginEditBlock()
 
         def append_output_line(s):
-            self.terminal.moveCursor(QTextCursor.MoveOperation.End)
-            cur = self.terminal.textCursor()
             cur.movePosition(QTextCursor.MoveOperation.End)
-            cur.insertText(s + '\n')
-            self.terminal.setTextCursor(cur)
-            self.terminal.moveCursor(QTextCursor.MoveOperation.End)
+            self._ansi_style = self.styles.insert(cur, s, self._ansi_style)
+            cur.insertText('\n', self.styles.format(DEFAULT_STYLE))
             self._last_was_output_line = True
 
-        def replace_last_output_line(s):
+        def select_last_output_line():
             """
-            Replace the last output line. If the last block is a prompt (contains '$'),
-            preserve prompt part and replace only after it.
+            Select the last output line. If the last block is a prompt (contains '$'),
+            preserve prompt part and select only after it.
             """
-            cur = self.terminal.textCursor()
-            cur.movePosition(QTextCursor.MoveOperation.End)
-            cur.select(QTextCursor.SelectionType.BlockUnderCursor)
-            block_text = cur.selectedText()
-
-            if '$' in block_text and not self._last_was_output_line:
-                idx = block_text.rfind('$')
-                prompt_part = block_text[:idx+1]
-                new_block = prompt_part + ' ' + s
-                cur.removeSelectedText()
-                cur.insertText(new_block)
+            if self.select_after_prompt(cur) and not self._last_was_output_line:
+                cur.insertText(' ')
             else:
+                cur.movePosition(QTextCursor.MoveOperation.StartOfBlock)
+                cur.movePosition(QTextCursor.MoveOperation.EndOfBlock, QTextCursor.MoveMode.KeepAnchor)
                 cur.removeSelectedText()
-                cur.insertText(s)
-            self.terminal.setTextCursor(cur)
-            self.terminal.moveCursor(QTextCursor.MoveOperation.End)
+
+        def replace_last_output_line(s):
+            select_last_output_line()
+            self._ansi_style = self.styles.insert(cur, s, self._ansi_style)
             self._last_was_output_line = True
 
         def clear_last_output_line():
-
-            cur = self.terminal.textCursor()
-            cur.movePosition(QTextCursor.MoveOperation.End)
-            cur.select(QTextCursor.SelectionType.BlockUnderCursor)
-            block_text = cur.selectedText()
-            if '$' in block_text and not self._last_was_output_line:
-                idx = block_text.rfind('$')
-                prompt_part = block_text[:idx+1]
-                cur.removeSelectedText()
-                cur.insertText(prompt_part + ' ')
-            else:
-                cur.removeSelectedText()
-            self.terminal.setTextCursor(cur)
-            self.terminal.moveCursor(QTextCursor.MoveOperation.End)
+            select_last_output_line()
             self._last_was_output_line = False
 
-        buffer = ""
-        last_was_newline = False
-        last_was_progress = False
-
-        for token in parts:
-            if token == '' or token is None:
-                continue
-            if token == '\n':
-                if buffer != "":
-                    clean = strip_ansi_except_controls(buffer)
-                    append_output_line(clean)
-                    buffer = ""
-                else:
-                    append_output_line('')
-                last_was_newline = True
-                last_was_progress = False
-                continue
-
-            if token == '\r':
-                if buffer != "":
-                    clean = strip_ansi_except_controls(buffer)
-                    replace_last_output_line(clean)
-                    buffer = ""
-                last_was_progress = True
-                last_was_newline = False
-                continue
-
-            if token == '[ESC_CLEAR_LINE]':
+        for op, s in output_ops(raw_text, self._last_was_output_line, keep_sgr=True):
+            if op == 'append':
+                append_output_line(s)
+            elif op == 'replace':
+                replace_last_output_line(s)
+            else:
                 clear_last_output_line()
-                buffer = ""
-                last_was_progress = False
-                last_was_newline = False
-                continue
-
-            buffer += token
 
-        if buffer != "":
-            clean = strip_ansi_except_controls(buffer)
-            if last_was_progress or (not last_was_newline and self._last_was_output_line):
-                replace_last_output_line(clean)
-            else:
-                append_output_line(clean)
+        cur.endEditBlock()
+        self.terminal.setTextCursor(cur)
+        self.terminal.moveCursor(QTextCursor.MoveOperation.End)
 
     def open_subpage(self, tool_name):
         self.header_label.setText(f"Now inside {tool_name}")
@@ -559,7 +934,8 @@ class ModernDarkTerminalApp(QMainWindow):
                 "Brute (wordlist)",      
                 "Port/Service Probe",    
                 "Save JSON",             
-                "Custom Template"        
+                "Custom Template",       
+                "Permutation Brute"      
             ]
         else:
             option_labels = [
@@ -576,6 +952,7 @@ class ModernDarkTerminalApp(QMainWindow):
             ]
 
 
+        self.selected_options = set()
         for idx, label in enumerate(option_labels, start=1):
             btn = QPushButton(label)
             btn.setStyleSheet("""
@@ -590,9 +967,30 @@ class ModernDarkTerminalApp(QMainWindow):
                 QPushButton:hover {
                     background-color: #7B61FF;
                 }
+                QPushButton[selected="true"] {
+                    background-color: #3A3A55;
+                    border: 1px solid #7B61FF;
+                }
             """)
-            btn.clicked.connect(lambda checked, i=idx, t=tool_name: self.on_option_click(t, i))
+            btn.clicked.connect(lambda checked, i=idx, t=tool_name, b=btn: self.on_option_button(t, i, b))
             self.scroll_layout.addWidget(btn)
+
+        self.run_selected_btn = QPushButton("Run Selected (Ctrl+click options)")
+        self.run_selected_btn.setEnabled(False)
+        self.run_selected_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #3A3A55;
+                color: white;
+                font-size: 14px;
+                border-radius: 12px;
+                padding: 8px 15px;
+            }
+            QPushButton:enabled {
+                background-color: #7B61FF;
+            }
+        """)
+        self.run_selected_btn.clicked.connect(lambda checked, t=tool_name: self.on_run_selected(t))
+        self.scroll_layout.addWidget(self.run_selected_btn)
             
         set_templates_btn = QPushButton("Set Nuclei Templates Path")
         set_templates_btn.setStyleSheet("""
@@ -609,6 +1007,58 @@ class ModernDarkTerminalApp(QMainWindow):
         """)
         set_templates_btn.clicked.connect(self.set_nuclei_templates_path)
         self.scroll_layout.addWidget(set_templates_btn)
+        if t == "nuclei":
+            shard_btn = QPushButton(f"Sharded Mode ({self.scheduler.max_parallel}x)")
+            shard_btn.setCheckable(True)
+            shard_btn.setChecked(self.nuclei_shards > 1)
+            shard_btn.setStyleSheet("""
+                QPushButton {
+                    background-color: #3A3A55;
+                    color: white;
+                    font-size: 14px;
+                    border-radius: 12px;
+                    padding: 8px 15px;
+                }
+                QPushButton:checked {
+                    background-color: #7B61FF;
+                }
+            """)
+            shard_btn.toggled.connect(self.toggle_nuclei_shards)
+            self.scroll_layout.addWidget(shard_btn)
+        if t == "nuclei":
+            report_btn = QPushButton("Build Report")
+            report_btn.setStyleSheet("""
+                QPushButton {
+                    background-color: #7B61FF;
+                    color: white;
+                    font-size: 14px;
+                    border-radius: 12px;
+                    padding: 8px 15px;
+                }
+                QPushButton:hover {
+                    background-color: #9E7CFF;
+                }
+            """)
+            report_btn.clicked.connect(lambda: self.replace_current_line(self.report_cmd()))
+            self.scroll_layout.addWidget(report_btn)
+        if t in ("httpx", "dnsx", "nuclei"):
+            delta_btn = QPushButton("Delta Mode (new assets only)")
+            delta_btn.setCheckable(True)
+            delta_btn.setChecked(self.delta_mode)
+            delta_btn.setStyleSheet("""
+                QPushButton {
+                    background-color: #3A3A55;
+                    color: white;
+                    font-size: 14px;
+                    border-radius: 12px;
+                    padding: 8px 15px;
+                }
+                QPushButton:checked {
+                    background-color: #7B61FF;
+                }
+            """)
+            delta_btn.toggled.connect(self.toggle_delta_mode)
+            self.scroll_layout.addWidget(delta_btn)
         back_btn = QPushButton("Back")
         back_btn.setStyleSheet("""
             QPushButton {
@@ -626,6 +1076,9 @@ class ModernDarkTerminalApp(QMainWindow):
         self.scroll_layout.addWidget(back_btn)
 
 
+    def toggle_nuclei_shards(self, enabled):
+        self.nuclei_shards = self.scheduler.max_parallel if enabled else 1
+
     def set_nuclei_templates_path(self):
         """
         Ask user to pick a directory for nuclei templates and store it.
@@ -635,304 +1088,88 @@ class ModernDarkTerminalApp(QMainWindow):
         if not path:
             return
         self.nuclei_templates_path = path
+        self.save_session_settings()
         QMessageBox.information(self, "Nuclei templates set", f"Nuclei templates path set to:\n{self.nuclei_templates_path}")
         self.terminal.append("")
         self.terminal.insertPlainText(f"[info] nuclei templates: {self.nuclei_templates_path}\n")
+        self.start_template_indexing()
 
-    def on_option_click(self, tool_name, option_index):
-        if tool_name.lower() == "fuzzer" and option_index == 1:
-            domain = self.domain.strip().rstrip('/')
-            url = f"https://{domain}/FUZZ"
-            wordlist = self.wordlist_path
-            output_path = os.path.join(self.output_dir, self.output_filename)
-            cmd = f'ffuf -u "{url}" -w "{wordlist}" -t 50 -o "{output_path}" -of json'
-            self.replace_current_line(cmd)
-
-        elif tool_name.lower() == "fuzzer" and option_index == 2:
-            domain = re.sub(r'^https?://', '', self.domain.strip()).rstrip('/')
-            url = f"https://{domain}/FUZZ"
-            wordlist = self.wordlist_path
-            extensions = ".php,.bak,.old"
-            output_path = os.path.join(self.output_dir, self.output_filename)
-            cmd = f'ffuf -u "{url}" -w "{wordlist}" -e {extensions} -t 40 -o "{output_path}" -mc 200-500 -of json'
-            self.replace_current_line(cmd)
-
-        elif tool_name.lower() == "fuzzer" and option_index == 3:
-            domain = re.sub(r'^https?://', '', self.domain.strip()).rstrip('/')
-            url = f"https://{domain}/search.php?FUZZ=1"
-            wordlist = self.wordlist_path
-            output_path = os.path.join(self.output_dir, self.output_filename)
-            cmd = f"ffuf -u '{url}' -w {wordlist} -t 40 -mc 200-500 -o {output_path} -of json"
-            self.replace_current_line(cmd)
-
-        elif tool_name.lower() == "fuzzer" and option_index == 4:
-            domain = re.sub(r'^https?://', '', self.domain.strip()).rstrip('/')
-            url = f"https://{domain}/"
-            wordlist = self.wordlist_path
-            output_path = os.path.join(self.output_dir, self.output_filename)
-            cmd = f"ffuf -u {url} -H 'Host: FUZZ.{domain}' -w {wordlist} -t 80 -mc 200 -o {output_path} -of json"
-            self.replace_current_line(cmd)
-
-        elif tool_name.lower() == "fuzzer" and option_index == 5:
-            domain = re.sub(r'^https?://', '', self.domain.strip()).rstrip('/')
-            url = f"https://{domain}/login"
-            wordlist = self.wordlist_path
-            output_path = os.path.join(self.output_dir, self.output_filename)
-            cmd = f"ffuf -u {url} -d 'username=admin&password=FUZZ' -X POST -w {wordlist} -H 'Content-Type: application/x-www-form-urlencoded' -t 30 -mc 200,302 -o {output_path} -of json"
-            self.replace_current_line(cmd)
-
-        elif tool_name.lower() == "fuzzer" and option_index == 6:
-            domain = re.sub(r'^https?://', '', self.domain.strip()).rstrip('/')
-            url = f"https://{domain}/FUZZ"
-            wordlist = self.wordlist_path
-            extensions = ".php,.html"
-            output_path = os.path.join(self.output_dir, self.output_filename)
-            cmd = f"ffuf -u '{url}' -w '{wordlist}' -recursion -recursion-depth 2 -t 50 -e '{extensions}' -o '{output_path}' -of json"
-            self.replace_current_line(cmd)
-
-        elif tool_name.lower() == "fuzzer" and option_index == 7:
-            domain = re.sub(r'^https?://', '', self.domain.strip()).rstrip('/')
-            url = f"https://{domain}/FUZZ"
-            wordlist = self.wordlist_path
-            output_path = os.path.join(self.output_dir, self.output_filename)
-            cmd = f"ffuf -u '{url}' -w '{wordlist}' -t 30 -rate 50 -timeout 10 -o '{output_path}' -of json"
-            self.replace_current_line(cmd)
-
-        elif tool_name.lower() == "fuzzer" and option_index == 8:
-            domain = re.sub(r'^https?://', '', self.domain.strip()).rstrip('/')
-            url = f"https://{domain}/FUZZ"
-            wordlist = self.wordlist_path
-            output_path = os.path.join(self.output_dir, self.output_filename)
-            cmd = f'ffuf -u "{url}" -w "{wordlist}" -fs 0 -fw 5 -mr "index of|Directory listing" -o "{output_path}" -of json'
-            self.replace_current_line(cmd)
-
-        elif tool_name.lower() == "fuzzer" and option_index == 9:
-            domain = re.sub(r'^https?://', '', self.domain.strip()).rstrip('/')
-            output_path = os.path.join(self.output_dir, self.output_filename)
-            cmd = f"ffuf -u 'https://{domain}/FUZZ' -H 'X-Api-Token: FUZZ2' -w '{self.wordlist_path}':FUZZ -w '{self.wordlist_path}':FUZZ2 -t 60 -mc 200 -o '{output_path}' -of json"
+    def start_template_indexing(self):
+        """
+        (Re)index the nuclei templates tree in the background. Until it is
+        ready the presets keep passing whole directories to nuclei.
+        """
+        self.template_index_ready = False
+        if not os.path.isdir(self.nuclei_templates_path):
+            return
+        try:
+            self.template_index = TemplateIndex(self.nuclei_templates_path)
+        except Exception as e:
+            self.handle_output(f"[Error] template index: {e}\n")
+            return
+        self.index_task = BackgroundTask(self.template_index.update)
+        self.index_task.result_signal.connect(self.on_template_index_ready)
+        self.index_task.error_signal.connect(lambda e: self.handle_output(f"[Error] template index: {e}\n"))
+        self.index_task.start()
+
+    def on_template_index_ready(self, stats):
+        total, changed, removed = stats
+        self.template_index_ready = True
+        self.statusBar().showMessage(
+            f"nuclei templates indexed: {total} files ({changed} updated, {removed} removed)", 8000)
+
+    def start_tool_probe(self):
+        """
+        Find ffuf/nuclei/httpx/subfinder/dnsx and their versions in the
+        background; presets use the result to pick flags the installed
+        versions understand.
+        """
+        self.tool_task = BackgroundTask(probe_all)
+        self.tool_task.result_signal.connect(self.on_tools_probed)
+        self.tool_task.error_signal.connect(lambda e: self.handle_output(f"[Error] tool probe: {e}\n"))
+        self.tool_task.start()
+
+    def on_tools_probed(self, tool_info):
+        self.tool_info = tool_info
+        missing = [name for name, info in tool_info.items() if not info["binary"]]
+        found = [f"{name} {info['version'] or '?'}" for name, info in tool_info.items() if info["binary"]]
+        self.statusBar().showMessage("tools: " + ", ".join(found) if found else "no tools found", 8000)
+        if missing:
+            self.handle_output(f"[info] not found on $PATH: {', '.join(missing)} (run install.py)\n")
+
+    def warn_if_missing(self, tool_name):
+        info = self.tool_info.get(tool_name.lower())
+        if info is not None and not info["binary"]:
+            self.statusBar().showMessage(f"{tool_name} is not installed (run install.py)", 8000)
+
+    def on_option_button(self, tool_name, option_index, button):
+        """Ctrl+click toggles an option into the batch selection; a plain click fills in its command."""
+        if not QApplication.keyboardModifiers() & Qt.KeyboardModifier.ControlModifier:
+            self.on_option_click(tool_name, option_index)
+            return
+        if option_index in self.selected_options:
+            self.selected_options.discard(option_index)
+        else:
+            self.selected_options.add(option_index)
+        button.setProperty("selected", option_index in self.selected_options)
+        button.style().unpolish(button)
+        button.style().polish(button)
+        count = len(self.selected_options)
+        self.run_selected_btn.setEnabled(count > 0)
+        self.run_selected_btn.setText(f"Run Selected ({count})" if count else "Run Selected (Ctrl+click options)")
+
+    def on_run_selected(self, tool_name):
+        self.warn_if_missing(tool_name)
+        cmd = self.batch_command(tool_name, self.selected_options)
+        if cmd:
             self.replace_current_line(cmd)
 
-        elif tool_name.lower() == "fuzzer" and option_index == 10:
-            domain = re.sub(r'^https?://', '', self.domain.strip()).rstrip('/')
-            wordlist = self.wordlist_path
-            output_path = os.path.join(self.output_dir, self.output_filename)
-            cmd = f"ffuf -c -w {wordlist}  -u http://{domain}/FUZZ -of json"
+    def on_option_click(self, tool_name, option_index):
+        self.warn_if_missing(tool_name)
+        cmd = self.preset_command(tool_name, option_index)
+        if cmd is not None:
             self.replace_current_line(cmd)
-        
-        elif tool_name.lower() == "nuclei":
-            domain = re.sub(r'^https?://', '', self.domain.strip()).rstrip('/')
-            output_base = os.path.join(self.output_dir, f"nuclei_{domain}")
-            templates = self.nuclei_templates_path
-
-            if option_index == 1:
-                out = f"{output_base}_all.txt"
-                cmd = f'nuclei -u "https://{domain}" -t "{templates}" -o "{out}"'
-                self.replace_current_line(cmd)
-
-            elif option_index == 2:
-                out = f"{output_base}_vulnerabilities.txt"
-                cmd = f'nuclei -u "https://{domain}" -t "{os.path.join(templates, "vulnerabilities")}" -o "{out}"'
-                self.replace_current_line(cmd)
-
-            elif option_index == 3:
-                out = f"{output_base}_exposures.txt"
-                cmd = f'nuclei -u "https://{domain}" -t "{os.path.join(templates, "exposures")}" -o "{out}"'
-                self.replace_current_line(cmd)
-
-            elif option_index == 4:
-                out = f"{output_base}_files.txt"
-                cmd = f'nuclei -u "https://{domain}" -t "{os.path.join(templates, "files")}" -o "{out}"'
-                self.replace_current_line(cmd)
-
-            elif option_index == 5:
-                out = f"{output_base}_takeovers.txt"
-                cmd = f'nuclei -u "https://{domain}" -t "{os.path.join(templates, "takeovers")}" -o "{out}"'
-                self.replace_current_line(cmd)
-
-            elif option_index == 6:
-                out = f"{output_base}_misconfigurations.txt"
-                cmd = f'nuclei -u "https://{domain}" -t "{os.path.join(templates, "misconfiguration")}" -o "{out}"'
-                self.replace_current_line(cmd)
-
-            elif option_index == 7:
-                out = f"{output_base}_credentials.txt"
-                cmd = f'nuclei -u "https://{domain}" -t "{os.path.join(templates, "credentials")}" -o "{out}"'
-                self.replace_current_line(cmd)
-
-            elif option_index == 8:
-                out = f"{output_base}_leaks.txt"
-                cmd = f'nuclei -u "https://{domain}" -t "{templates}" -tags "leak" -o "{out}"'
-                self.replace_current_line(cmd)
-
-            elif option_index == 9:
-                out = f"{output_base}_custom.txt"
-                cmd = f'nuclei -u "https://{domain}" -t "{os.path.join(templates, "custom")}" -o "{out}"'
-                self.replace_current_line(cmd)
-
-            elif option_index == 10:
-                out = f"{output_base}_quick_scan.txt"
-                cmd = f'nuclei -u "https://{domain}" -t "{templates}" -severity "critical,high" -c 25 -o "{out}"'
-                self.replace_current_line(cmd)
-
-        elif tool_name.lower() == "httpx":
-            domain = re.sub(r'^https?://', '', self.domain.strip()).rstrip('/')
-            output_base = f"https://{domain}"
-            
-            if option_index == 1:
-                out = os.path.join(self.output_dir, f"httpx_basic_{domain}.txt")
-                cmd = f'httpx -u {output_base} -o "{out}"'
-                self.replace_current_line(cmd)
-                
-            elif option_index == 2:
-                out = os.path.join(self.output_dir, f"httpx_list_{domain}.txt")
-                cmd = f'httpx -l "{self.wordlist_path}" -o "{out}"'
-                self.replace_current_line(cmd)
-                
-            elif option_index == 3:
-                out = os.path.join(self.output_dir, f"httpx_title_{domain}.txt")
-                cmd = f'httpx -u {output_base} -title -o "{out}"'
-                self.replace_current_line(cmd)
-                
-            elif option_index == 4:
-                out = os.path.join(self.output_dir, f"httpx_status_{domain}.txt")
-                cmd = f'httpx -u {output_base} -status-code -o "{out}"'
-                self.replace_current_line(cmd)
-                
-            elif option_index == 5:
-                out = os.path.join(self.output_dir, f"httpx_headers_{domain}.txt")
-                cmd = f'httpx -u {output_base} -headers -o "{out}"'
-                self.replace_current_line(cmd)
-                
-            elif option_index == 6:
-                out = os.path.join(self.output_dir, f"httpx_methods_{domain}.txt")
-                cmd = f'httpx -l "{self.wordlist_path}" -methods GET,POST -o "{out}"'
-                self.replace_current_line(cmd)
-                
-            elif option_index == 7:
-                out = os.path.join(self.output_dir, f"httpx_follow_{domain}.txt")
-                cmd = f'httpx -l "{self.wordlist_path}" -follow-redirects -o "{out}"'
-                self.replace_current_line(cmd)
-                
-            elif option_index == 8:
-                out = os.path.join(self.output_dir, f"httpx_timeout_{domain}.txt")
-                cmd = f'httpx -l "{self.wordlist_path}" -timeout 10 -retries 2 -o "{out}"'
-                self.replace_current_line(cmd)
-                
-            elif option_index == 9:
-                out = os.path.join(self.output_dir, f"httpx_conc_{domain}.txt")
-                cmd = f'httpx -l "{self.wordlist_path}" -c 50 -o "{out}"'
-                self.replace_current_line(cmd)
-                
-            elif option_index == 10:
-                out = os.path.join(self.output_dir, f"httpx_custom_{domain}.txt")
-                cmd = f'httpx -u https://{domain}/path -o "{out}"'
-                self.replace_current_line(cmd)
-
-
-        elif tool_name.lower() == "subfinder":
-            domain = re.sub(r'^https?://', '', self.domain.strip()).rstrip('/')
-            if option_index == 1:
-                out = os.path.join(self.output_dir, f"subfinder_passive_{domain}.txt")
-                cmd = f"subfinder -d {domain} -o \"{out}\""
-                self.replace_current_line(cmd)
-            elif option_index == 2:
-                out = os.path.join(self.output_dir, f"subfinder_recursive_{domain}.txt")
-                cmd = f"subfinder -d {domain} -recursive -o \"{out}\""
-                self.replace_current_line(cmd)
-            elif option_index == 3:
-                out = os.path.join(self.output_dir, f"subfinder_brute_{domain}.txt")
-                cmd = f"subfinder -d {domain} -brute -w \"{self.wordlist_path}\" -o \"{out}\""
-                self.replace_current_line(cmd)
-            elif option_index == 4:
-                resolvers = "resolvers.txt"
-                out = os.path.join(self.output_dir, f"subfinder_resolvers_{domain}.txt")
-                cmd = f"subfinder -d {domain} -o \"{out}\" -r \"{resolvers}\""
-                self.replace_current_line(cmd)
-            elif option_index == 5:
-                out = os.path.join(self.output_dir, f"subfinder_timeout_{domain}.txt")
-                cmd = f"subfinder -d {domain} -timeout 10 -o \"{out}\""
-                self.replace_current_line(cmd)
-            elif option_index == 6:
-                out = os.path.join(self.output_dir, f"subfinder_threads_{domain}.txt")
-                cmd = f"subfinder -d {domain} -t 50 -o \"{out}\""
-                self.replace_current_line(cmd)
-            elif option_index == 7:
-                out = os.path.join(self.output_dir, f"subfinder_all_{domain}.txt")
-                cmd = f"subfinder -d {domain} -all -o \"{out}\""
-                self.replace_current_line(cmd)
-            elif option_index == 8:
-                out = os.path.join(self.output_dir, f"subfinder_cert_{domain}.txt")
-                cmd = f"subfinder -d {domain} -o \"{out}\" -crt"
-                self.replace_current_line(cmd)
-            elif option_index == 9:
-                out = os.path.join(self.output_dir, f"subfinder_{domain}.json")
-                cmd = f"subfinder -d {domain} -o \"{out}\" -oJ"
-                self.replace_current_line(cmd)
-            elif option_index == 10:
-                out = os.path.join(self.output_dir, f"subfinder_custom_{domain}.txt")
-                cmd = f"subfinder -d {domain} -o \"{out}\""
-                self.replace_current_line(cmd)
-                
-        elif tool_name.lower() == "dnsx":
-            domain = re.sub(r'^https?://', '', self.domain.strip()).rstrip('/')
-            if option_index == 1:
-                out = os.path.join(self.output_dir, f"dnsx_basic_{domain}.txt")
-                cmd = f'dnsx -d {domain} -o "{out}"'
-                self.replace_current_line(cmd)
-
-            elif option_index == 2:
-                out = os.path.join(self.output_dir, f"dnsx_a_aaaa_{domain}.txt")
-                cmd = f'dnsx -d {domain} -a -aaaa -o "{out}"'
-                self.replace_current_line(cmd)
-
-            elif option_index == 3:
-                out = os.path.join(self.output_dir, f"dnsx_cname_{domain}.txt")
-                cmd = f'dnsx -d {domain} -cname -o "{out}"'
-                self.replace_current_line(cmd)
-
-            elif option_index == 4:
-                out = os.path.join(self.output_dir, f"dnsx_mx_txt_{domain}.txt")
-                cmd = f'dnsx -d {domain} -mx -txt -o "{out}"'
-                self.replace_current_line(cmd)
-
-            elif option_index == 5:
-                resolvers = "resolvers.txt"
-                out = os.path.join(self.output_dir, f"dnsx_resolvers_{domain}.txt")
-                cmd = f'dnsx -d {domain} -r "{resolvers}" -o "{out}"'
-                self.replace_current_line(cmd)
-
-            elif option_index == 6:
-                out = os.path.join(self.output_dir, f"dnsx_wildcard_{domain}.txt")
-                cmd = f'python3 -c "print(\'generate-check\')" && dnsx -d {domain} -silent -o \"{out}\"'
-                self.replace_current_line(cmd)
-
-            elif option_index == 7:
-                out = os.path.join(self.output_dir, f"dnsx_brute_{domain}.txt")
-                cmd = f'dnsx -d {domain} -w "{self.wordlist_path}" -o "{out}"'
-                self.replace_current_line(cmd)
-
-            elif option_index == 8:
-                out = os.path.join(self.output_dir, f"dnsx_probe_{domain}.txt")
-                cmd = f'dnsx -d {domain} -a -o "{out}" | httpx -silent -o "{os.path.join(self.output_dir, f"httpx_from_dnsx_{domain}.txt")}"'
-                self.replace_current_line(cmd)
-
-            elif option_index == 9:
-                out = os.path.join(self.output_dir, f"dnsx_{domain}.json")
-                cmd = f'dnsx -d {domain} -o "{out}"'
-                self.replace_current_line(cmd)
-
-            elif option_index == 10:
-                out = os.path.join(self.output_dir, f"dnsx_custom_{domain}.txt")
-                cmd = f'# Custom dnsx: dnsx -d {domain} -o \"{out}\"'
-                self.replace_current_line(cmd)
 
-        else:
-            if tool_name.lower() == "httpx":
-                cmd = f'httpx -u {self.domain} -o {self.output_filename}'
-            else:
-                cmd = f'# {tool_name} option {option_index} (configure command)'
-            self.replace_current_line(cmd)
- 
     def back_to_main(self):
         self.header_label.setText("")
         self.add_main_buttons()
\ No newline at end of file
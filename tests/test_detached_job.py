@@ -0,0 +1,65 @@
+import os
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("PyQt6")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QCoreApplication
+
+import jobd
+from detached_job import DetachedJob
+
+
+@pytest.fixture
+def daemon(tmp_path, monkeypatch):
+    path = str(tmp_path / "jobd.sock")
+    monkeypatch.setattr(jobd, "socket_path", lambda: path)
+    server = jobd.JobDaemon(path)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def run_to_end(job, timeout=10.0):
+    app = QCoreApplication.instance() or QCoreApplication([])
+    lines = []
+    job.output_signal.connect(lines.append)
+    job.start()
+    deadline = time.monotonic() + timeout
+    while (job.isRunning() or job.sock is not None) and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.01)
+    app.processEvents()
+    return lines
+
+
+def wait_delivered(job, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while job.delivered < job.next_seq and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_final_output_is_acked(daemon, tmp_path):
+    log = str(tmp_path / "job.log")
+    lines = run_to_end(DetachedJob("for i in 1 2 3 4 5; do echo line$i; done", log_path=log))
+    assert "".join(lines).split() == [f"line{i}" for i in range(1, 6)]
+    job = next(iter(daemon.jobs.values()))
+    wait_delivered(job)
+    assert not job.running
+    assert job.delivered == job.next_seq
+
+
+def test_reattach_to_finished_job_acks_replay(daemon, tmp_path):
+    job = daemon.spawn("echo one; echo two", log_path=str(tmp_path / "job.log"))
+    while job.running:
+        time.sleep(0.01)
+    lines = run_to_end(DetachedJob(None, job_id=job.id))
+    assert "".join(lines).split() == ["one", "two"]
+    wait_delivered(job)
+    assert job.delivered == job.next_seq
+    daemon.prune()
+    assert job.id not in daemon.jobs
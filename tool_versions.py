@@ -0,0 +1,235 @@
+import json
+import os
+import re
+import shutil
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from utils import app_data_dir
+
+TOOLS = [
+    {"name": "ffuf", "package": "github.com/ffuf/ffuf", "module": "github.com/ffuf/ffuf"},
+    {"name": "httpx", "package": "github.com/projectdiscovery/httpx/cmd/httpx",
+     "module": "github.com/projectdiscovery/httpx"},
+    {"name": "subfinder", "package": "github.com/projectdiscovery/subfinder/v2/cmd/subfinder",
+     "module": "github.com/projectdiscovery/subfinder/v2"},
+    {"name": "nuclei", "package": "github.com/projectdiscovery/nuclei/v3/cmd/nuclei",
+     "module": "github.com/projectdiscovery/nuclei/v3"},
+    {"name": "dnsx", "package": "github.com/projectdiscovery/dnsx/cmd/dnsx",
+     "module": "github.com/projectdiscovery/dnsx"},
+]
+
+LATEST_TTL = 6 * 3600
+
+# how each tool prints its own version
+VERSION_FLAGS = {"ffuf": "-V"}
+# preset flags that older releases do not understand: (tool, flag) -> first version with it
+FLAG_SINCE = {
+    ("subfinder", "-all"): "v2.4.0",
+    ("httpx", "-include-response-header"): "v1.2.5",
+}
+_VERSION_RE = re.compile(r'\bv?(\d+\.\d+\.\d+(?:-[0-9A-Za-z.]+)?)')
+_ANSI_RE = re.compile(r'\x1b\[[0-9;?]*[A-Za-z]')
+
+
+def go_binary():
+    """The go executable to use; $GO lets tests point at a stub."""
+    return os.environ.get("GO", "go")
+
+
+def find_binary(name):
+    """Locate a tool on $PATH, falling back to the Go bin directory."""
+    path = shutil.which(name)
+    if path:
+        return path
+    gobin = os.environ.get("GOBIN") or os.path.join(
+        os.environ.get("GOPATH") or os.path.expanduser("~/go"), "bin")
+    candidate = os.path.join(gobin, name)
+    return candidate if os.access(candidate, os.X_OK) else None
+
+
+def _run(argv, timeout=60):
+    res = subprocess.run(argv, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=timeout)
+    return res.returncode, res.stdout
+
+
+def module_version(binary, go=None):
+    """Module version embedded in a Go binary (`go version -m`), or None."""
+    try:
+        code, out = _run([go or go_binary(), "version", "-m", binary])
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if code != 0:
+        return None
+    for line in out.splitlines():
+        fields = line.split()
+        if len(fields) >= 3 and fields[0] == "mod":
+            return fields[2]
+    return None
+
+
+def reported_version(binary, name):
+    """Version the tool prints about itself (``-version``, ``-V`` for ffuf), or None."""
+    flag = VERSION_FLAGS.get(name, "-version")
+    try:
+        res = subprocess.run([binary, flag], stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                             stderr=subprocess.STDOUT, text=True, errors="replace", timeout=15)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    m = _VERSION_RE.search(_ANSI_RE.sub('', res.stdout))
+    return f"v{m.group(1)}" if m else None
+
+
+def parse_version(version):
+    """'v2.6.5' or '2.6.5-dev' -> (2, 6, 5); None when there is no x.y.z."""
+    m = _VERSION_RE.search(version or "")
+    if not m:
+        return None
+    return tuple(int(n) for n in m.group(1).split('-')[0].split('.'))
+
+
+def supports(tool_info, tool, flag):
+    """
+    Whether the installed ``tool`` understands ``flag``, per FLAG_SINCE.
+    Unknown tools, versions and flags count as supported.
+    """
+    since = FLAG_SINCE.get((tool, flag))
+    info = (tool_info or {}).get(tool) or {}
+    installed = parse_version(info.get("version"))
+    if since is None or installed is None:
+        return True
+    return installed >= parse_version(since)
+
+
+def latest_version(module, go=None):
+    """Latest published version of a module (`go list -m module@latest`)."""
+    try:
+        code, out = _run([go or go_binary(), "list", "-m", "-f", "{{.Version}}", f"{module}@latest"], timeout=120)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if code != 0:
+        return None
+    return out.strip() or None
+
+
+class VersionCache:
+    """
+    JSON cache of probe results. Installed versions are keyed by binary
+    path and invalidated by mtime/size; latest versions expire after a TTL.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(app_data_dir(), "tool_versions.json")
+        self._lock = threading.Lock()
+        try:
+            with open(self.path) as f:
+                self.data = json.load(f)
+        except (OSError, ValueError):
+            self.data = {}
+        self.data.setdefault("binaries", {})
+        self.data.setdefault("latest", {})
+
+    def save(self):
+        with self._lock:
+            tmp = self.path + ".tmp"
+            with open(tmp, "w") as f:
+                json.dump(self.data, f, indent=2, sort_keys=True)
+            os.replace(tmp, self.path)
+
+    @staticmethod
+    def _stamp(binary):
+        st = os.stat(binary)
+        return [st.st_mtime_ns, st.st_size]
+
+    def binary_info(self, binary):
+        """Cached dict for ``binary`` if it has not changed on disk since."""
+        try:
+            stamp = self._stamp(binary)
+        except OSError:
+            return None
+        entry = self.data["binaries"].get(binary)
+        if entry and entry.get("stamp") == stamp:
+            return entry
+        return None
+
+    def set_binary_info(self, binary, **info):
+        try:
+            stamp = self._stamp(binary)
+        except OSError:
+            return
+        with self._lock:
+            self.data["binaries"][binary] = dict(info, stamp=stamp)
+
+    def latest(self, module):
+        entry = self.data["latest"].get(module)
+        if entry and time.time() - entry["checked"] < LATEST_TTL:
+            return entry["version"]
+        return None
+
+    def set_latest(self, module, version):
+        with self._lock:
+            self.data["latest"][module] = {"version": version, "checked": time.time()}
+
+
+def probe_installed(tool, cache, go=None):
+    """Return (binary, installed module version) for a tool, using the cache."""
+    binary = find_binary(tool["name"])
+    if not binary:
+        return None, None
+    cached = cache.binary_info(binary)
+    if cached and "module_version" in cached:
+        return binary, cached["module_version"]
+    version = module_version(binary, go)
+    info = dict(cache.binary_info(binary) or {})
+    info.pop("stamp", None)
+    cache.set_binary_info(binary, **dict(info, module_version=version))
+    return binary, version
+
+
+def probe_latest(tool, cache, go=None):
+    version = cache.latest(tool["module"])
+    if version:
+        return version
+    version = latest_version(tool["module"], go)
+    if version:
+        cache.set_latest(tool["module"], version)
+    return version
+
+
+def probe_version(tool, cache):
+    """
+    Return (binary, version) as the tool reports it, falling back to the
+    module version embedded in the binary. Cached by path and mtime/size.
+    """
+    binary = find_binary(tool["name"])
+    if not binary:
+        return None, None
+    cached = cache.binary_info(binary)
+    if cached and "version" in cached:
+        return binary, cached["version"]
+    version = reported_version(binary, tool["name"])
+    if version is None and shutil.which(go_binary()):
+        version = module_version(binary)
+    info = dict(cached or {})
+    info.pop("stamp", None)
+    cache.set_binary_info(binary, **dict(info, version=version))
+    return binary, version
+
+
+def probe_all(tools=TOOLS, cache=None):
+    """
+    Locate and version every tool in parallel; unchanged binaries are
+    answered from the cache without running anything.
+    Returns {name: {"binary": path or None, "version": str or None}}.
+    """
+    cache = cache or VersionCache()
+    with ThreadPoolExecutor(max_workers=len(tools)) as pool:
+        probes = pool.map(lambda t: probe_version(t, cache), tools)
+        results = {t["name"]: {"binary": b, "version": v} for t, (b, v) in zip(tools, probes)}
+    try:
+        cache.save()
+    except OSError:
+        pass
+    return results
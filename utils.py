@@ -1,57 +1,212 @@
-import html
+import codecs
+import os
 import re
 
-ANSI_SGR_COLORS = {
-        30: "black", 31: "red", 32: "green", 33: "orange", 34: "blue",
-        35: "magenta", 36: "cyan", 37: "lightgray", 90: "gray",
-        91: "lightcoral", 92: "lightgreen", 93: "yellow", 94: "lightskyblue",
-        95: "plum", 96: "paleturquoise", 97: "white"
-    }
-
-def ansi_to_html(text: str) -> str:
-    """
-    Very small ANSI SGR -> HTML converter.
-    Handles sequences like \x1b[31m (red) and \x1b[0m (reset) and bold (1).
-    Other sequences are removed.
-    """
-    text = html.escape(text)
-    sgr_re = re.compile(r'\\x1B\\[([0-9;]*)m')
-    parts = []
-    last_pos = 0
-    open_spans = []
-
-    for m in sgr_re.finditer(text):
-        start, end = m.span()
-        params = m.group(1)
-        parts.append(text[last_pos:start])
-        last_pos = end
-
-        if params == '' or params == '0':
-            while open_spans:
-                parts.append("</span>")
-                open_spans.pop()
+# xterm's 16 base colors, brightened slightly for the dark background
+ANSI_PALETTE = (
+    "#000000", "#CD3131", "#0DBC79", "#E5E510", "#2472C8", "#BC3FBC", "#11A8CD", "#E5E5E5",
+    "#666666", "#F14C4C", "#23D18B", "#F5F543", "#3B8EEA", "#D670D6", "#29B8DB", "#FFFFFF",
+)
+_CUBE_LEVELS = (0, 95, 135, 175, 215, 255)
+
+# (foreground, background, bold); colors are '#rrggbb' or None for default
+DEFAULT_STYLE = (None, None, False)
+
+_SGR_RE = re.compile(r'\x1b\[([0-9;:]*)m')
+_NON_SGR_RE = re.compile(r'\x1b\[[0-9;?]*[A-Za-ln-z]')
+
+
+def xterm_color(n: int) -> str:
+    """'#rrggbb' for an xterm 256-color index."""
+    if n < 16:
+        return ANSI_PALETTE[n]
+    if n < 232:
+        n -= 16
+        r, g, b = _CUBE_LEVELS[n // 36], _CUBE_LEVELS[n // 6 % 6], _CUBE_LEVELS[n % 6]
+    else:
+        r = g = b = 8 + 10 * (n - 232)
+    return f"#{r:02X}{g:02X}{b:02X}"
+
+
+def _extended_color(codes, i):
+    """Parse '5;n' or '2;r;g;b' after a 38/48; returns (color, next index)."""
+    if i < len(codes) and codes[i] == 5 and i + 1 < len(codes):
+        return xterm_color(codes[i + 1] % 256), i + 2
+    if i < len(codes) and codes[i] == 2 and i + 3 < len(codes):
+        r, g, b = (min(c, 255) for c in codes[i + 1:i + 4])
+        return f"#{r:02X}{g:02X}{b:02X}", i + 4
+    return None, len(codes)
+
+
+def apply_sgr(style, params: str):
+    """Return ``style`` updated by one SGR parameter string such as '1;38;5;208'."""
+    fg, bg, bold = style
+    codes = [int(c) if c.isdigit() else 0 for c in re.split(r'[;:]', params)] if params else [0]
+    i = 0
+    while i < len(codes):
+        c = codes[i]
+        i += 1
+        if c == 0:
+            fg, bg, bold = DEFAULT_STYLE
+        elif c == 1:
+            bold = True
+        elif c == 22:
+            bold = False
+        elif 30 <= c <= 37:
+            fg = ANSI_PALETTE[c - 30]
+        elif 90 <= c <= 97:
+            fg = ANSI_PALETTE[c - 90 + 8]
+        elif 40 <= c <= 47:
+            bg = ANSI_PALETTE[c - 40]
+        elif 100 <= c <= 107:
+            bg = ANSI_PALETTE[c - 100 + 8]
+        elif c == 39:
+            fg = None
+        elif c == 49:
+            bg = None
+        elif c in (38, 48):
+            color, i = _extended_color(codes, i)
+            if c == 38:
+                fg = color
+            else:
+                bg = color
+    return (fg, bg, bold)
+
+
+def ansi_runs(text: str, style=DEFAULT_STYLE):
+    """
+    Split text into (segment, style) runs at SGR sequences; other escape
+    sequences are dropped. Returns (runs, style in effect at the end) so the
+    state can carry over into the next chunk.
+    """
+    text = _NON_SGR_RE.sub('', text)
+    runs = []
+    pos = 0
+    for m in _SGR_RE.finditer(text):
+        if m.start() > pos:
+            runs.append((text[pos:m.start()], style))
+        style = apply_sgr(style, m.group(1))
+        pos = m.end()
+    if pos < len(text):
+        runs.append((text[pos:], style))
+    return runs, style
+
+
+def app_data_dir(*parts) -> str:
+    """
+    Return (and create) a directory under ~/.hackingtool used for
+    logs, caches and other state that should outlive a session.
+    """
+    path = os.path.join(os.path.expanduser("~/.hackingtool"), *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+ESC_CLEAR_LINE = '\x1b[2K'
+
+
+def strip_ansi_except_controls(s: str) -> str:
+    return re.sub(r'\x1b\[[0-9;]*[A-Za-z]', '', s)
+
+
+def strip_ansi_except_sgr(s: str) -> str:
+    return _NON_SGR_RE.sub('', s)
+
+
+def output_ops(raw_text: str, last_was_output_line: bool, keep_sgr: bool = False):
+    """
+    Translate a chunk of tool output into terminal line operations:
+    ('append', text), ('replace', text) or ('clear', None).
+    - '\\n' -> append new output line (never overwrite previous lines)
+    - '\\r' -> update last output line
+    - '\\x1b[2K' -> clear last output line
+    ``last_was_output_line`` tells whether the last line on screen is output
+    (as opposed to a prompt); it decides how a trailing fragment is applied.
+    With ``keep_sgr`` color sequences are left in the text for a renderer.
+    """
+    strip = strip_ansi_except_sgr if keep_sgr else strip_ansi_except_controls
+    text = raw_text.replace('\t', '    ').replace(ESC_CLEAR_LINE, '[ESC_CLEAR_LINE]')
+    parts = re.split(r'(\r|\n|\[ESC_CLEAR_LINE\])', text)
+
+    buffer = ""
+    last_was_newline = False
+    last_was_progress = False
+
+    for token in parts:
+        if token == '' or token is None:
+            continue
+        if token == '\n':
+            yield ('append', strip(buffer))
+            buffer = ""
+            last_was_output_line = True
+            last_was_newline = True
+            last_was_progress = False
+            continue
+
+        if token == '\r':
+            if buffer != "":
+                yield ('replace', strip(buffer))
+                buffer = ""
+                last_was_output_line = True
+            last_was_progress = True
+            last_was_newline = False
+            continue
+
+        if token == '[ESC_CLEAR_LINE]':
+            yield ('clear', None)
+            buffer = ""
+            last_was_output_line = False
+            last_was_progress = False
+            last_was_newline = False
+            continue
+
+        buffer += token
+
+    if buffer != "":
+        clean = strip(buffer)
+        if last_was_progress or (not last_was_newline and last_was_output_line):
+            yield ('replace', clean)
         else:
-            attrs = params.split(';')
-            style_attrs = []
-            for a in attrs:
-                try:
-                    ai = int(a)
-                except:
-                    continue
-                if ai == 1:
-                    style_attrs.append("font-weight:700")
-                elif 30 <= ai <= 37 or 90 <= ai <= 97:
-                    color = ANSI_SGR_COLORS.get(ai, None)
-                    if color:
-                        style_attrs.append(f"color:{color}")
-                elif ai == 39:
-                    pass
-            if style_attrs:
-                parts.append(f"<span style=\"{';'.join(style_attrs)}\">")
-                open_spans.append(True)
-
-    parts.append(text[last_pos:])
-    while open_spans:
-        parts.append("</span>")
-        open_spans.pop()
-    return ''.join(parts).replace('\\n', '<br/>').replace('  ', '&nbsp;&nbsp;')
\ No newline at end of file
+            yield ('append', clean)
+
+
+class LineSplitter:
+    """
+    Incremental bytes -> lines decoder with the same newline handling as a
+    text-mode pipe (universal newlines: '\r\n' and '\r' end a line too).
+
+    With ``keep_ends`` every chunk keeps its terminator instead: 'text\n'
+    for a line and 'text\r' for a carriage-return progress frame, which is
+    what handle_output needs to tell appends from in-place updates.
+    """
+
+    def __init__(self, encoding="utf-8", keep_ends=False):
+        self.decoder = codecs.getincrementaldecoder(encoding)("replace")
+        self.keep_ends = keep_ends
+        self.pending = ""
+
+    def feed(self, data: bytes):
+        text = self.pending + self.decoder.decode(data)
+        # a trailing '\r' may be the first half of '\r\n'
+        hold_cr = text.endswith('\r')
+        if hold_cr:
+            text = text[:-1]
+        text = text.replace('\r\n', '\n')
+        if not self.keep_ends:
+            lines = text.replace('\r', '\n').split('\n')
+            self.pending = lines.pop() + ('\r' if hold_cr else '')
+            return lines
+        parts = re.split(r'(\r|\n)', text)
+        chunks = [parts[i] + parts[i + 1] for i in range(0, len(parts) - 1, 2)]
+        self.pending = parts[-1] + ('\r' if hold_cr else '')
+        return chunks
+
+    def finish(self):
+        tail = self.pending + self.decoder.decode(b"", final=True)
+        self.pending = ""
+        if self.keep_ends:
+            if tail and not tail.endswith('\r'):
+                tail += '\n'
+            return [tail] if tail else []
+        tail = tail.rstrip('\r')
+        return [tail] if tail else []